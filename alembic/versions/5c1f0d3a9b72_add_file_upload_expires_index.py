@@ -0,0 +1,36 @@
+"""add_file_upload_expires_index
+
+Revision ID: 5c1f0d3a9b72
+Revises: 39945b27c364
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1f0d3a9b72"
+down_revision = "39945b27c364"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index used by the expired uploads cleanup (DELETE ... WHERE expires_at < now)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_file_upload_expires",
+            "file_upload",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_file_upload_expires",
+            table_name="file_upload",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,42 @@
+"""add_processing_job_inflight_index
+
+Revision ID: 8d2e4b6f1a03
+Revises: 5c1f0d3a9b72
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d2e4b6f1a03"
+down_revision = "5c1f0d3a9b72"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index for the in-progress jobs query (find_processing_jobs)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_processing_job_inflight",
+            "document_processing_job",
+            ["status"],
+            unique=False,
+            postgresql_where=sa.text(
+                "status IN ('extracting', 'checking_duplicates', 'chunking', "
+                "'embedding')"
+            ),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_processing_job_inflight",
+            table_name="document_processing_job",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,55 @@
+"""add_document_trigram_indexes
+
+Revision ID: b7e1c9d24f5a
+Revises: 8d2e4b6f1a03
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e1c9d24f5a"
+down_revision = "8d2e4b6f1a03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # pg_trgm provides similarity() (find_by_title_similarity) and lets GIN
+    # indexes serve ILIKE '%term%' (find_by_content_search) without a seq scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_document_title_trgm",
+            "document",
+            ["title"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_document_content_trgm",
+            "document",
+            ["content"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_document_content_trgm",
+            table_name="document",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_document_title_trgm",
+            table_name="document",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""add_document_created_at_id_index
+
+Revision ID: e4a7c2b9d813
+Revises: b7e1c9d24f5a
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4a7c2b9d813"
+down_revision = "b7e1c9d24f5a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pagination in find_all: ORDER BY created_at DESC, id DESC and
+    # WHERE (created_at, id) < cursor walk this index instead of OFFSET scans
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_document_created_at_id",
+            "document",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_document_created_at_id",
+            table_name="document",
+            postgresql_concurrently=True,
+        )
@@ -56,7 +56,7 @@ class CreatePresignedUploadUseCase:
             )
 
             upload_url, expires_at, upload_fields = (
-                self.s3_service.generate_presigned_upload_url(
+                await self.s3_service.generate_presigned_upload_url_async(
                     s3_key=s3_key,
                     content_type=request.content_type,
                     expires_in=3600,
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 
+from domain.value_objects.content_hash import sha256_hexdigest
 from domain.value_objects.document_metadata import DocumentMetadata
 from domain.value_objects.embedding import Embedding
 
@@ -34,6 +35,9 @@ class Document:
     chunks: List[DocumentChunk]
     created_at: datetime = None
     updated_at: datetime = None
+    # False em listagens sem o texto: content fica vazio e o documento não
+    # pode ser salvo de volta
+    content_loaded: bool = True
 
     def __post_init__(self):
         if self.id is None:
@@ -51,6 +55,16 @@ class Document:
     def word_count(self) -> int:
         return len(self.content.split())
 
+    @property
+    def content_hash(self) -> Optional[str]:
+        """SHA256 do conteúdo, calculado uma vez enquanto o conteúdo não muda"""
+        cached = self.__dict__.get("_content_hash")
+        if cached is None or cached[0] is not self.content:
+            digest = sha256_hexdigest(self.content) if self.content else None
+            cached = (self.content, digest)
+            self.__dict__["_content_hash"] = cached
+        return cached[1]
+
     def add_chunk(self, chunk: DocumentChunk) -> None:
         chunk.document_id = self.id
         self.chunks.append(chunk)
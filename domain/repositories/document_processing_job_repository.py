@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from domain.entities.document_processing_job import DocumentProcessingJob
@@ -14,6 +14,11 @@ class DocumentProcessingJobRepository(ABC):
         """Salva um DocumentProcessingJob"""
         pass
 
+    @abstractmethod
+    async def save_many(self, jobs: Sequence[DocumentProcessingJob]) -> None:
+        """Salva vários DocumentProcessingJobs em uma única operação"""
+        pass
+
     @abstractmethod
     async def find_by_id(self, job_id: UUID) -> Optional[DocumentProcessingJob]:
         """Busca job por ID"""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from domain.entities.document import Document, DocumentChunk
@@ -16,13 +17,34 @@ class DocumentRepository(ABC):
     async def find_by_id(self, document_id: UUID) -> Optional[Document]:
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, document_ids: List[UUID]) -> List[Document]:
+        """Busca vários documentos em uma única consulta"""
+        pass
+
     @abstractmethod
     async def find_by_source(self, source: str) -> Optional[Document]:
         pass
 
     @abstractmethod
     async def find_all(
-        self, limit: Optional[int] = None, offset: int = 0
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        with_content: bool = True,
+    ) -> List[Document]:
+        pass
+
+    @abstractmethod
+    async def find_by_title_similarity(
+        self, title: str, threshold: float = 0.8, with_content: bool = True
+    ) -> List[Document]:
+        pass
+
+    @abstractmethod
+    async def find_by_content_search(
+        self, search_term: str, limit: int = 10, with_content: bool = True
     ) -> List[Document]:
         pass
 
@@ -50,6 +72,10 @@ class DocumentChunkRepository(ABC):
     async def save_chunk(self, chunk: DocumentChunk) -> DocumentChunk:
         pass
 
+    @abstractmethod
+    async def save_chunks(self, chunks: List[DocumentChunk]) -> List[DocumentChunk]:
+        pass
+
     @abstractmethod
     async def find_chunk_by_id(self, chunk_id: UUID) -> Optional[DocumentChunk]:
         pass
@@ -60,6 +86,13 @@ class DocumentChunkRepository(ABC):
     ) -> List[DocumentChunk]:
         pass
 
+    @abstractmethod
+    async def find_chunks_by_document_ids(
+        self, document_ids: List[UUID]
+    ) -> Dict[UUID, List[DocumentChunk]]:
+        """Busca os chunks de vários documentos em uma única consulta"""
+        pass
+
     @abstractmethod
     async def delete_chunks_by_document_id(self, document_id: UUID) -> int:
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from domain.entities.document import DocumentChunk
@@ -28,6 +28,12 @@ class VectorRepository(ABC):
     ) -> bool:
         pass
 
+    @abstractmethod
+    async def add_chunk_embeddings(
+        self, embeddings: List[Tuple[UUID, Embedding]]
+    ) -> int:
+        pass
+
     @abstractmethod
     async def search_similar_chunks(
         self,
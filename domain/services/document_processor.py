@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from domain.entities.document import Document
+from domain.entities.document import Document, DocumentChunk
 from domain.entities.document_processing_job import DocumentProcessingJob
 from domain.entities.file_upload import FileUpload
 from domain.exceptions.business_exceptions import BusinessRuleViolationError
@@ -12,13 +13,19 @@ from domain.repositories.vector_repository import VectorRepository
 from domain.services.document_service import DocumentService
 from domain.value_objects.content_hash import ContentHash
 from domain.value_objects.document_metadata import DocumentMetadata
+from domain.value_objects.embedding import Embedding
 from domain.value_objects.processing_status import ProcessingStatus
+from infrastructure.external.embedding_cache import EmbeddingCache
 from infrastructure.external.openai_client import OpenAIClient
 from infrastructure.external.s3_service import S3Service
 from infrastructure.processors.text_chunker import TextChunker
 
 logger = logging.getLogger(__name__)
 
+# Chunks por grupo de embeddings e grupos prontos aguardando gravação
+_EMBEDDING_GROUP_SIZE = 2048
+_PIPELINE_DEPTH = 2
+
 
 class DocumentProcessor:
     """Serviço de domínio para processar documentos completos"""
@@ -31,6 +38,7 @@ class DocumentProcessor:
         openai_client: OpenAIClient,
         s3_service: S3Service,
         document_repository: DocumentRepository,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         self.document_service = document_service
         self.vector_repository = vector_repository
@@ -38,6 +46,7 @@ class DocumentProcessor:
         self.openai_client = openai_client
         self.s3_service = s3_service
         self.document_repository = document_repository
+        self.embedding_cache = embedding_cache
 
     async def process_uploaded_document(
         self, file_upload: FileUpload, job: DocumentProcessingJob
@@ -247,7 +256,9 @@ class DocumentProcessor:
                 skip_duplicate_check=True,
             )
 
-            chunks = self.text_chunker.chunk_document_content(
+            # Chunking é CPU-bound (tiktoken libera o GIL): roda fora do event loop
+            chunks = await asyncio.to_thread(
+                self.text_chunker.chunk_document_content,
                 content=text_content,
                 document_id=str(document.id),
                 metadata={
@@ -279,38 +290,96 @@ class DocumentProcessor:
                     "Nenhum chunk encontrado para o documento"
                 )
 
-            batch_size = 20
-            total_batches = (len(chunks) + batch_size - 1) // batch_size
+            queue: asyncio.Queue = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+            producer = asyncio.create_task(self._produce_embeddings(chunks, queue))
+            consumer = asyncio.create_task(self._save_embeddings(chunks, queue, job))
+            try:
+                await asyncio.gather(producer, consumer)
+            finally:
+                producer.cancel()
+                consumer.cancel()
 
-            for i in range(0, len(chunks), batch_size):
-                batch_chunks = chunks[i : i + batch_size]
-                batch_number = (i // batch_size) + 1
+            logger.info(
+                f"Embeddings gerados para {len(chunks)} chunks do documento {document.id}"
+            )
 
-                texts = [chunk.content for chunk in batch_chunks]
-                embeddings = await self.openai_client.generate_embeddings_batch(texts)
+        except Exception as e:
+            logger.error(f"Erro na geração de embeddings: {e}")
+            raise BusinessRuleViolationError(
+                f"Falha na geração de embeddings: {str(e)}"
+            )
 
-                for chunk, embedding in zip(batch_chunks, embeddings):
-                    await self.vector_repository.add_chunk_embedding(
-                        chunk_id=chunk.id, embedding=embedding, metadata={}
-                    )
+    async def _produce_embeddings(
+        self, chunks: List[DocumentChunk], queue: asyncio.Queue
+    ) -> None:
+        """Gera embeddings por grupo de chunks e entrega à etapa de gravação"""
+        for i in range(0, len(chunks), _EMBEDDING_GROUP_SIZE):
+            group = chunks[i : i + _EMBEDDING_GROUP_SIZE]
+            embeddings = await self._get_embeddings([chunk.content for chunk in group])
+            await queue.put((group, embeddings))
+        await queue.put(None)
+
+    async def _save_embeddings(
+        self,
+        chunks: List[DocumentChunk],
+        queue: asyncio.Queue,
+        job: DocumentProcessingJob,
+    ) -> None:
+        """Grava os embeddings recebidos enquanto o próximo grupo é gerado"""
+        batch_size = 20
+        total_batches = (len(chunks) + batch_size - 1) // batch_size
+        processed_count = 0
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            group, embeddings = item
+            for i in range(0, len(group), batch_size):
+                batch_chunks = group[i : i + batch_size]
+
+                await self.vector_repository.add_chunk_embeddings(
+                    [
+                        (chunk.id, embedding)
+                        for chunk, embedding in zip(
+                            batch_chunks, embeddings[i : i + batch_size]
+                        )
+                    ]
+                )
 
-                processed_count = min(i + batch_size, len(chunks))
+                processed_count += len(batch_chunks)
                 job.update_chunks_progress(processed_count, len(chunks))
 
+                batch_number = (processed_count + batch_size - 1) // batch_size
                 logger.info(
                     f"Batch {batch_number}/{total_batches} processado: {len(batch_chunks)} embeddings"
                 )
 
-            logger.info(
-                f"Embeddings gerados para {len(chunks)} chunks do documento {document.id}"
-            )
+    async def _get_embeddings(self, texts: List[str]) -> List[Embedding]:
+        """Gera embeddings consultando o cache antes e enviando à OpenAI só os ausentes"""
+        if not self.embedding_cache:
+            return await self.openai_client.generate_embeddings_batch(texts)
 
-        except Exception as e:
-            logger.error(f"Erro na geração de embeddings: {e}")
-            raise BusinessRuleViolationError(
-                f"Falha na geração de embeddings: {str(e)}"
+        hashes = [self.embedding_cache.hash_text(text) for text in texts]
+        embeddings = await self.embedding_cache.get_many(hashes)
+
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if misses:
+            generated = await self.openai_client.generate_embeddings_batch(
+                [texts[i] for i in misses]
+            )
+            for i, embedding in zip(misses, generated):
+                embeddings[i] = embedding
+            await self.embedding_cache.set_many(
+                {hashes[i]: embedding for i, embedding in zip(misses, generated)}
             )
 
+        logger.debug(
+            f"Cache de embeddings: {len(texts) - len(misses)}/{len(texts)} encontrados"
+        )
+        return embeddings
+
     async def _cleanup_s3_file(self, file_upload: FileUpload) -> None:
         """Remove arquivo do S3 após processamento"""
         if not file_upload.s3_key:
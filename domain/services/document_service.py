@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from domain.entities.document import Document, DocumentChunk
@@ -65,9 +66,16 @@ class DocumentService:
         return await self._document_repository.find_by_source(source)
 
     async def list_documents(
-        self, limit: Optional[int] = None, offset: int = 0
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        with_content: bool = True,
     ) -> List[Document]:
-        return await self._document_repository.find_all(limit=limit, offset=offset)
+        """Lista documentos; with_content=False traz só os dados de listagem"""
+        return await self._document_repository.find_all(
+            limit=limit, offset=offset, cursor=cursor, with_content=with_content
+        )
 
     async def delete_document(self, document_id: UUID) -> bool:
         if not await self._document_repository.find_by_id(document_id):
@@ -83,7 +91,7 @@ class DocumentService:
         if self._document_chunk_repository:
             for chunk in chunks:
                 chunk.document_id = document_id
-                await self._document_chunk_repository.save_chunk(chunk)
+            await self._document_chunk_repository.save_chunks(chunks)
         else:
             for chunk in chunks:
                 chunk.document_id = document_id
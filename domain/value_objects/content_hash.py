@@ -4,6 +4,18 @@ from dataclasses import dataclass
 
 from domain.exceptions.business_exceptions import BusinessRuleViolationError
 
+# Caracteres codificados por vez: textos grandes não geram uma cópia inteira em
+# bytes só para o hash
+_HASH_CHUNK_CHARS = 1 << 20
+
+
+def sha256_hexdigest(text: str) -> str:
+    """SHA256 do texto em UTF-8, codificado em blocos"""
+    digest = hashlib.sha256()
+    for start in range(0, len(text), _HASH_CHUNK_CHARS):
+        digest.update(text[start : start + _HASH_CHUNK_CHARS].encode("utf-8"))
+    return digest.hexdigest()
+
 
 @dataclass(frozen=True)
 class ContentHash:
@@ -39,7 +51,7 @@ class ContentHash:
         normalized_text = cls._normalize_text(text)
 
         if algorithm == "sha256":
-            hash_value = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+            hash_value = sha256_hexdigest(normalized_text)
         elif algorithm == "md5":
             hash_value = hashlib.md5(normalized_text.encode("utf-8")).hexdigest()
         else:
@@ -9,10 +9,14 @@ class DatabaseSettings(BaseSettings):
     postgres_password: str = Field(default="postgres", env="POSTGRES_PASSWORD")
     postgres_db: str = Field(default="intelligent_document_search", env="POSTGRES_DB")
 
-    postgres_pool_size: int = Field(default=10, env="POSTGRES_POOL_SIZE")
-    postgres_max_overflow: int = Field(default=20, env="POSTGRES_MAX_OVERFLOW")
+    postgres_pool_size: int = Field(default=20, env="POSTGRES_POOL_SIZE")
+    postgres_max_overflow: int = Field(default=10, env="POSTGRES_MAX_OVERFLOW")
     postgres_pool_timeout: int = Field(default=30, env="POSTGRES_POOL_TIMEOUT")
     postgres_pool_recycle: int = Field(default=3600, env="POSTGRES_POOL_RECYCLE")
+    postgres_pool_pre_ping: bool = Field(default=False, env="POSTGRES_POOL_PRE_PING")
+    postgres_statement_cache_size: int = Field(
+        default=500, env="POSTGRES_STATEMENT_CACHE_SIZE"
+    )
 
     postgres_ssl_mode: str = Field(default="disable", env="POSTGRES_SSL_MODE")
 
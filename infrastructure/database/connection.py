@@ -1,13 +1,23 @@
 import logging
 from typing import AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
+from infrastructure.config.database_settings import database_settings
 from infrastructure.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Cache de SQL compilado do SQLAlchemy (padrão 500)
+_QUERY_CACHE_SIZE = 1200
+
+
+def _orjson_serializer(value) -> str:
+    """Serializa as colunas JSON com orjson; datetimes viram ISO 8601"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class DatabaseConnection:
     def __init__(self):
@@ -25,15 +35,27 @@ class DatabaseConnection:
                 echo=False,
                 poolclass=NullPool,
                 pool_pre_ping=True,
+                json_serializer=_orjson_serializer,
+                json_deserializer=orjson.loads,
             )
         else:
             self._engine = create_async_engine(
                 settings.database_url,
                 echo=False,
-                pool_size=10,
-                max_overflow=20,
-                pool_pre_ping=True,
-                pool_recycle=3600,
+                pool_size=database_settings.postgres_pool_size,
+                max_overflow=database_settings.postgres_max_overflow,
+                pool_timeout=database_settings.postgres_pool_timeout,
+                pool_recycle=database_settings.postgres_pool_recycle,
+                pool_pre_ping=database_settings.postgres_pool_pre_ping,
+                query_cache_size=_QUERY_CACHE_SIZE,
+                # Cache de prepared statements do asyncpg por conexão
+                connect_args={
+                    "prepared_statement_cache_size": (
+                        database_settings.postgres_statement_cache_size
+                    )
+                },
+                json_serializer=_orjson_serializer,
+                json_deserializer=orjson.loads,
             )
 
         self._session_factory = async_sessionmaker(
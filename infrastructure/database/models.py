@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
@@ -21,6 +22,9 @@ from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# Status de jobs em andamento, cobertos pelo índice parcial idx_processing_job_inflight
+IN_FLIGHT_JOB_STATUSES = ("extracting", "checking_duplicates", "chunking", "embedding")
+
 
 class MunicipalityModel(Base):
     __tablename__ = "municipality"
@@ -133,6 +137,25 @@ class DocumentModel(Base):
     __table_args__ = (
         Index("idx_document_title", "title"),
         Index("idx_document_file_hash", "file_hash"),
+        # Paginação por cursor (created_at, id) em find_all
+        Index(
+            "idx_document_created_at_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Trigramas (pg_trgm) para ILIKE '%termo%' sem seq scan
+        Index(
+            "idx_document_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_document_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
         Index(
             "idx_document_metadata_source",
             func.json_extract_path_text("meta_data", "source"),
@@ -252,6 +275,7 @@ class FileUploadModel(Base):
     __table_args__ = (
         Index("idx_file_upload_document_id", "document_id"),
         Index("idx_file_upload_created", "created_at"),
+        Index("idx_file_upload_expires", "expires_at"),
         CheckConstraint("file_size > 0", name="check_file_size_positive"),
     )
 
@@ -283,6 +307,13 @@ class DocumentProcessingJobModel(Base):
         Index("idx_processing_job_upload_id", "upload_id"),
         Index("idx_processing_job_status", "status"),
         Index("idx_processing_job_created", "created_at"),
+        Index(
+            "idx_processing_job_inflight",
+            "status",
+            postgresql_where=text(
+                "status IN ('extracting', 'checking_duplicates', 'chunking', 'embedding')"
+            ),
+        ),
         CheckConstraint(
             "progress >= 0 AND progress <= 100", name="check_progress_range"
         ),
@@ -0,0 +1,317 @@
+"""Templates de email compilados uma única vez por processo"""
+
+from jinja2 import DictLoader, Environment, select_autoescape
+
+_INVITATION_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Convite para o Sistema</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background: #2c3e50; color: white; padding: 20px; text-align: center; }
+        .content { padding: 20px; background: #f8f9fa; }
+        .button {
+            display: inline-block;
+            background: #3498db;
+            color: white;
+            padding: 12px 24px;
+            text-decoration: none;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .footer { padding: 20px; text-align: center; color: #666; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Sistema de Documentos Inteligentes{{ municipality_text }}</h1>
+        </div>
+
+        <div class="content">
+            <h2>Olá, {{ full_name }}!</h2>
+
+            <p>Você foi convidado por <strong>{{ invited_by_name }}</strong> para acessar
+            o Sistema de Documentos Inteligentes{{ municipality_text }}.</p>
+            <p>Este sistema permite que você:</p>
+            <ul>
+                <li>Faça perguntas sobre documentos oficiais</li>
+                <li>Obtenha respostas inteligentes baseadas em IA</li>
+                <li>Acesse informações de forma rápida e eficiente</li>
+            </ul>
+
+            <p>Para ativar sua conta, clique no botão abaixo:</p>
+
+            <div style="text-align: center;">
+                <a href="{{ activation_url }}" class="button">Ativar Minha Conta</a>
+            </div>
+
+            <p><small>Se o botão não funcionar, copie e cole este link no seu navegador:<br>
+            <a href="{{ activation_url }}">{{ activation_url }}</a></small></p>
+
+            <p><strong>Importante:</strong> Este convite expira em 7 dias.</p>
+        </div>
+
+        <div class="footer">
+            <p>Este é um email automático. Não responda a esta mensagem.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_INVITATION_TEXT = """\
+Sistema de Documentos Inteligentes{{ municipality_text }}
+
+Olá, {{ full_name }}!
+
+Você foi convidado por {{ invited_by_name }} para acessar o Sistema de Documentos Inteligentes{{ municipality_text }}.
+
+Este sistema permite que você:
+- Faça perguntas sobre documentos oficiais
+- Obtenha respostas inteligentes baseadas em IA
+- Acesse informações de forma rápida e eficiente
+
+Para ativar sua conta, acesse o link abaixo:
+{{ activation_url }}
+
+IMPORTANTE: Este convite expira em 7 dias.
+
+---
+Este é um email automático. Não responda a esta mensagem.
+"""
+
+_PASSWORD_RESET_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Redefinição de Senha</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background: #e74c3c; color: white; padding: 20px; text-align: center; }
+        .content { padding: 20px; background: #f8f9fa; }
+        .button {
+            display: inline-block;
+            background: #e74c3c;
+            color: white;
+            padding: 12px 24px;
+            text-decoration: none;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .footer { padding: 20px; text-align: center; color: #666; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Redefinição de Senha</h1>
+        </div>
+
+        <div class="content">
+            <h2>Olá, {{ full_name }}!</h2>
+
+            <p>Recebemos uma solicitação para redefinir a senha da sua conta.</p>
+
+            <p>Se você fez esta solicitação, clique no botão abaixo para criar uma nova senha:</p>
+
+            <div style="text-align: center;">
+                <a href="{{ reset_url }}" class="button">Redefinir Senha</a>
+            </div>
+
+            <p><small>Se o botão não funcionar, copie e cole este link no seu navegador:<br>
+            <a href="{{ reset_url }}">{{ reset_url }}</a></small></p>
+
+            <p><strong>Se você não solicitou esta redefinição, ignore este email.</strong> Sua senha permanecerá inalterada.</p>
+
+            <p><small>Este link expira em 1 hora por segurança.</small></p>
+        </div>
+
+        <div class="footer">
+            <p>Este é um email automático. Não responda a esta mensagem.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_PASSWORD_RESET_TEXT = """\
+Redefinição de Senha
+
+Olá, {{ full_name }}!
+
+Recebemos uma solicitação para redefinir a senha da sua conta.
+
+Se você fez esta solicitação, acesse o link abaixo para criar uma nova senha:
+{{ reset_url }}
+
+Se você não solicitou esta redefinição, ignore este email. Sua senha permanecerá inalterada.
+
+IMPORTANTE: Este link expira em 1 hora por segurança.
+
+---
+Este é um email automático. Não responda a esta mensagem.
+"""
+
+_ACCOUNT_ACTIVATED_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Conta Ativada</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background: #27ae60; color: white; padding: 20px; text-align: center; }
+        .content { padding: 20px; background: #f8f9fa; }
+        .footer { padding: 20px; text-align: center; color: #666; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>✅ Conta Ativada com Sucesso!</h1>
+        </div>
+
+        <div class="content">
+            <h2>Parabéns, {{ full_name }}!</h2>
+
+            <p>Sua conta foi ativada com sucesso no Sistema de Documentos Inteligentes.</p>
+
+            <p>Agora você pode:</p>
+            <ul>
+                <li>Fazer login no sistema</li>
+                <li>Fazer perguntas sobre documentos</li>
+                <li>Acessar todas as funcionalidades disponíveis</li>
+            </ul>
+
+            <p>Acesse o sistema em: <a href="{{ base_url }}">{{ base_url }}</a></p>
+        </div>
+
+        <div class="footer">
+            <p>Este é um email automático. Não responda a esta mensagem.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_ACCOUNT_ACTIVATED_TEXT = """\
+Conta Ativada com Sucesso!
+
+Parabéns, {{ full_name }}!
+
+Sua conta foi ativada com sucesso no Sistema de Documentos Inteligentes.
+
+Agora você pode:
+- Fazer login no sistema
+- Fazer perguntas sobre documentos
+- Acessar todas as funcionalidades disponíveis
+
+Acesse o sistema em: {{ base_url }}
+
+---
+Este é um email automático. Não responda a esta mensagem.
+"""
+
+_WELCOME_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Bem-vindo</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background: #3498db; color: white; padding: 20px; text-align: center; }
+        .content { padding: 20px; background: #f8f9fa; }
+        .footer { padding: 20px; text-align: center; color: #666; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎉 Bem-vindo ao Sistema!</h1>
+        </div>
+
+        <div class="content">
+            <h2>Olá, {{ full_name }}!</h2>
+
+            <p>Seja bem-vindo ao Sistema de Documentos Inteligentes{{ municipality_text }}!</p>
+
+            <p>Você agora tem acesso a uma ferramenta poderosa que utiliza inteligência
+            artificial para ajudar você a encontrar informações em documentos oficiais
+            de forma rápida e precisa.</p>
+            <h3>Como usar o sistema:</h3>
+            <ol>
+                <li>Faça login com seu email e senha</li>
+                <li>Digite sua pergunta na caixa de chat</li>
+                <li>Receba respostas baseadas nos documentos oficiais</li>
+                <li>Use as citações para verificar as fontes</li>
+            </ol>
+
+            <p>Se tiver dúvidas, entre em contato com o administrador do sistema.</p>
+
+            <p>Acesse o sistema: <a href="{{ base_url }}">{{ base_url }}</a></p>
+        </div>
+
+        <div class="footer">
+            <p>Este é um email automático. Não responda a esta mensagem.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_WELCOME_TEXT = """\
+Bem-vindo ao Sistema de Documentos Inteligentes{{ municipality_text }}!
+
+Olá, {{ full_name }}!
+
+Seja bem-vindo ao Sistema de Documentos Inteligentes{{ municipality_text }}!
+
+Você agora tem acesso a uma ferramenta poderosa que utiliza inteligência
+artificial para ajudar você a encontrar informações em documentos oficiais
+de forma rápida e precisa.
+
+Como usar o sistema:
+1. Faça login com seu email e senha
+2. Digite sua pergunta na caixa de chat
+3. Receba respostas baseadas nos documentos oficiais
+4. Use as citações para verificar as fontes
+
+Se tiver dúvidas, entre em contato com o administrador do sistema.
+
+Acesse o sistema: {{ base_url }}
+
+---
+Este é um email automático. Não responda a esta mensagem.
+"""
+
+_ENV = Environment(
+    loader=DictLoader(
+        {
+            "invitation.html": _INVITATION_HTML,
+            "invitation.txt": _INVITATION_TEXT,
+            "password_reset.html": _PASSWORD_RESET_HTML,
+            "password_reset.txt": _PASSWORD_RESET_TEXT,
+            "account_activated.html": _ACCOUNT_ACTIVATED_HTML,
+            "account_activated.txt": _ACCOUNT_ACTIVATED_TEXT,
+            "welcome.html": _WELCOME_HTML,
+            "welcome.txt": _WELCOME_TEXT,
+        }
+    ),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+def render_email_template(name: str, **context) -> str:
+    """Renderiza template de email já compilado"""
+    return _ENV.get_template(name).render(**context)
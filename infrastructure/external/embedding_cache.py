@@ -0,0 +1,76 @@
+import hashlib
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import redis.asyncio as redis
+
+from domain.value_objects.embedding import Embedding
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MODEL = "text-embedding-3-small"
+_DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+class EmbeddingCache:
+    """Cache de embeddings no Redis indexado por sha256(modelo + texto normalizado)"""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        model: str = _DEFAULT_MODEL,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        key_prefix: str = "embedding:",
+    ):
+        self.redis = redis_client
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def hash_text(self, text: str) -> str:
+        """Gera o hash do texto normalizado (espaços colapsados) para o modelo"""
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{self.model}\n{normalized}".encode()).hexdigest()
+
+    async def get_many(self, hashes: Sequence[str]) -> List[Optional[Embedding]]:
+        """Busca embeddings com um único MGET; ausentes (ou erro) retornam None"""
+        if not hashes:
+            return []
+
+        try:
+            values = await self.redis.mget([self.key_prefix + h for h in hashes])
+        except Exception as e:
+            logger.warning(f"Erro ao ler cache de embeddings: {e}")
+            return [None] * len(hashes)
+
+        return [self._decode(value) if value else None for value in values]
+
+    async def set_many(self, embeddings: Dict[str, Embedding]) -> None:
+        """Grava embeddings com MSET + EXPIRE em um único pipeline"""
+        if not embeddings:
+            return
+
+        mapping = {
+            self.key_prefix + text_hash: self._encode(embedding)
+            for text_hash, embedding in embeddings.items()
+        }
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.mset(mapping)
+                for key in mapping:
+                    pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Erro ao gravar cache de embeddings: {e}")
+
+    async def close(self) -> None:
+        await self.redis.close()
+
+    def _encode(self, embedding: Embedding) -> bytes:
+        return np.asarray(embedding.vector, dtype=np.float32).tobytes()
+
+    def _decode(self, value: bytes) -> Embedding:
+        vector = np.frombuffer(value, dtype=np.float32).tolist()
+        return Embedding(vector=vector, model=self.model, dimensions=len(vector))
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import List
 
@@ -11,6 +12,10 @@ from domain.value_objects.embedding import Embedding
 
 load_dotenv()
 
+# Inputs por requisição de embeddings e requisições simultâneas
+_EMBEDDING_BATCH_SIZE = 256
+_EMBEDDING_CONCURRENCY = 8
+
 
 class OpenAIClient:
 
@@ -32,10 +37,27 @@ class OpenAIClient:
         except Exception as e:
             raise EmbeddingError(f"Failed to generate embedding: {e}")
 
-    async def generate_embeddings_batch(self, texts: List[str]) -> List[Embedding]:
+    async def generate_embeddings_batch(
+        self, texts: List[str], batch_size: int = _EMBEDDING_BATCH_SIZE
+    ) -> List[Embedding]:
         try:
-            vectors = self.embeddings.embed_documents(texts)
-            return [Embedding.from_openai(vector) for vector in vectors]
+            semaphore = asyncio.Semaphore(_EMBEDDING_CONCURRENCY)
+
+            async def embed(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    return await self.embeddings.aembed_documents(batch)
+
+            results = await asyncio.gather(
+                *(
+                    embed(texts[i : i + batch_size])
+                    for i in range(0, len(texts), batch_size)
+                )
+            )
+            return [
+                Embedding.from_openai(vector)
+                for vectors in results
+                for vector in vectors
+            ]
         except Exception as e:
             raise EmbeddingError(f"Failed to generate batch embeddings: {e}")
 
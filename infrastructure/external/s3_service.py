@@ -1,16 +1,116 @@
+import asyncio
+import functools
+import hashlib
+import hmac
 import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-
-import aioboto3
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+from typing import Callable, Optional, Sequence
+
+import botocore.session
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from boto3.s3.transfer import TransferConfig
+from botocore.auth import S3SigV4PostAuth
+from botocore.credentials import Credentials
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from botocore.hooks import HierarchicalEmitter
+from botocore.model import ServiceId
+from botocore.signers import RequestSigner, S3PostPresigner
 
 from domain.exceptions.business_exceptions import BusinessRuleViolationError
 from domain.value_objects.s3_key import S3Key
 
 logger = logging.getLogger(__name__)
 
+# O pool padrão do botocore é de 10 conexões, o que serializa chamadas concorrentes.
+# Erros transitórios (SlowDown, RequestTimeout, InternalError, 5xx, throttling)
+# são retentados pelo botocore com backoff e token bucket do modo adaptive
+_CLIENT_CONFIG_OPTIONS = {
+    "max_pool_connections": 64,
+    "retries": {"max_attempts": 10, "mode": "adaptive"},
+    "tcp_keepalive": True,
+}
+
+# Limite de conexões do aiohttp segue max_pool_connections; aqui só keep-alive e DNS
+_CONNECTOR_ARGS = {
+    "keepalive_timeout": 75,
+    "ttl_dns_cache": 300,
+}
+
+_CUSTOM_ENDPOINT_S3_OPTIONS = {
+    "addressing_style": "path",
+    "use_accelerate_endpoint": False,
+    "use_dualstack_endpoint": False,
+}
+
+_DELETE_BATCH_SIZE = 1000
+_DELETE_CONCURRENCY = 8
+# Limites das faixas listadas em paralelo no cleanup: as keys temporárias
+# começam pelo UUID do documento (hex), então cada faixa cobre ~1/16 das keys
+_LIST_RANGE_BOUNDS = "123456789abcdef"
+
+_MISSING_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+_HEAD_CACHE_SIZE = 4096
+_HEAD_CACHE_TTL_SECONDS = 60.0
+
+_CONNECTION_STATUS_TTL_SECONDS = 15.0
+
+
+@functools.lru_cache(maxsize=32)
+def _derive_signing_key(
+    secret_key: str, date_stamp: str, region: str, service: str
+) -> bytes:
+    """Deriva a signing key SigV4, válida pelo dia do date_stamp"""
+    key = f"AWS4{secret_key}".encode()
+    for msg in (date_stamp, region, service, "aws4_request"):
+        key = hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+    return key
+
+
+class _CachedKeyS3SigV4PostAuth(S3SigV4PostAuth):
+    """S3SigV4PostAuth que reaproveita a signing key derivada"""
+
+    def signature(self, string_to_sign, request):
+        signing_key = _derive_signing_key(
+            self.credentials.secret_key,
+            request.context["timestamp"][0:8],
+            self._region_name,
+            self._service_name,
+        )
+        return self._sign(signing_key, string_to_sign, hex=True)
+
+
+class _PresignRequestSigner(RequestSigner):
+    """RequestSigner que usa a assinatura de POST com signing key em cache"""
+
+    def get_auth_instance(
+        self,
+        signing_name,
+        region_name,
+        signature_version=None,
+        request_credentials=None,
+        **kwargs,
+    ):
+        if signature_version != "s3v4-presign-post":
+            return super().get_auth_instance(
+                signing_name,
+                region_name,
+                signature_version,
+                request_credentials,
+                **kwargs,
+            )
+        credentials = request_credentials or self._credentials
+        return _CachedKeyS3SigV4PostAuth(
+            credentials=credentials.get_frozen_credentials(),
+            region_name=region_name,
+            service_name=signing_name,
+        )
+
 
 class S3Service:
     """Serviço para operações S3"""
@@ -31,44 +131,126 @@ class S3Service:
         self.endpoint_url = endpoint_url
         self.public_endpoint_url = public_endpoint_url or endpoint_url
 
-        self._session_config = {}
-        if access_key and secret_key:
-            self._session_config = {
-                "aws_access_key_id": access_key,
-                "aws_secret_access_key": secret_key,
-            }
+        # Endpoint próprio (MinIO/LocalStack): path-style sem accelerate/dualstack
+        endpoint_options = {"s3": _CUSTOM_ENDPOINT_S3_OPTIONS} if endpoint_url else {}
 
-        self._sync_client = None
-        self._public_client = None
+        self._async_client_config = AioConfig(
+            connector_args=_CONNECTOR_ARGS,
+            **_CLIENT_CONFIG_OPTIONS,
+            **endpoint_options,
+        )
+        self._health_client_config = AioConfig(
+            connect_timeout=2,
+            read_timeout=2,
+            retries={"mode": "standard", "total_max_attempts": 1},
+            **endpoint_options,
+        )
 
-    def _get_sync_client(self):
-        """Retorna cliente S3 síncrono"""
-        if not self._sync_client:
-            self._sync_client = boto3.client(
-                "s3",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-                **self._session_config,
-            )
-        return self._sync_client
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=10,
+            io_chunksize=256 * 1024,
+            use_threads=True,
+        )
+
+        # Assinatura SigV4 é síncrona; o executor evita bloquear o event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="s3-presign"
+        )
 
-    def _get_public_client(self):
-        """Retorna cliente S3 para URLs públicas (presigned)"""
-        if not self._public_client:
-            self._public_client = boto3.client(
+        self._head_cache: OrderedDict[tuple[str, str], tuple[float, dict]] = (
+            OrderedDict()
+        )
+
+        # Credenciais estáticas resolvidas uma vez e compartilhadas por todos os clientes
+        self._credentials = (
+            Credentials(access_key, secret_key) if access_key and secret_key else None
+        )
+        self._aio_session = get_session()
+        if self._credentials:
+            self._aio_session.set_credentials(access_key, secret_key)
+
+        self._async_client = None
+        self._health_client = None
+        self._client_contexts: list = []
+        self._async_client_lock = asyncio.Lock()
+        self._connection_status: Optional[tuple[float, bool]] = None
+
+        self._presigner: Optional[S3PostPresigner] = None
+        self._presign_emitter: Optional[HierarchicalEmitter] = None
+
+    def _get_presigner(self) -> S3PostPresigner:
+        """Retorna presigner de POST S3, assinado localmente sem cliente HTTP"""
+        if self._presigner is None:
+            credentials = self._credentials
+            if credentials is None:
+                credentials = botocore.session.get_session().get_credentials()
+            if credentials is None:
+                raise NoCredentialsError()
+
+            # RequestSigner guarda apenas weakref do emitter
+            self._presign_emitter = HierarchicalEmitter()
+            signer = _PresignRequestSigner(
+                ServiceId("S3"),
+                self.region,
                 "s3",
-                region_name=self.region,
-                endpoint_url=self.public_endpoint_url,
-                **self._session_config,
+                "s3v4",
+                credentials,
+                self._presign_emitter,
             )
-        return self._public_client
+            self._presigner = S3PostPresigner(signer)
+        return self._presigner
+
+    def _get_upload_url(self, bucket: str) -> str:
+        """Retorna URL de upload do bucket no endpoint público"""
+        if self.public_endpoint_url:
+            return f"{self.public_endpoint_url.rstrip('/')}/{bucket}"
+        return f"https://{bucket}.s3.{self.region}.amazonaws.com/"
+
+    async def _open_client(self, config: AioConfig):
+        """Abre cliente S3 assíncrono e registra seu contexto para close()"""
+        context = self._aio_session.create_client(
+            "s3",
+            region_name=self.region,
+            endpoint_url=self.endpoint_url,
+            config=config,
+        )
+        client = await context.__aenter__()
+        self._client_contexts.append(context)
+        return client
 
     async def _get_async_client(self):
-        """Retorna cliente S3 assíncrono"""
-        session = aioboto3.Session(**self._session_config)
-        return session.client(
-            "s3", region_name=self.region, endpoint_url=self.endpoint_url
-        )
+        """Retorna cliente S3 assíncrono, criado uma única vez e reutilizado"""
+        if self._async_client is None:
+            async with self._async_client_lock:
+                if self._async_client is None:
+                    self._async_client = await self._open_client(
+                        self._async_client_config
+                    )
+        return self._async_client
+
+    async def _get_health_client(self):
+        """Retorna cliente S3 com timeouts curtos para health checks"""
+        if self._health_client is None:
+            async with self._async_client_lock:
+                if self._health_client is None:
+                    self._health_client = await self._open_client(
+                        self._health_client_config
+                    )
+        return self._health_client
+
+    async def close(self) -> None:
+        """Fecha os clientes S3 assíncronos e o pool de conexões"""
+        contexts = self._client_contexts
+        self._client_contexts = []
+        self._async_client = None
+        self._health_client = None
+
+        for context in contexts:
+            await context.__aexit__(None, None, None)
+
+        self._executor.shutdown(wait=False)
 
     def generate_presigned_upload_url(
         self, s3_key: S3Key, content_type: str, expires_in: int = 3600
@@ -80,8 +262,6 @@ class S3Service:
             tuple: (upload_url, expires_at, upload_fields)
         """
         try:
-            client = self._get_public_client()
-
             conditions = [
                 {"bucket": s3_key.bucket},
                 {"key": s3_key.key},
@@ -89,67 +269,156 @@ class S3Service:
                 ["content-length-range", 1, 5368709120],
             ]
 
-            response = client.generate_presigned_post(
-                Bucket=s3_key.bucket,
-                Key=s3_key.key,
-                Fields={"Content-Type": content_type},
-                Conditions=conditions,
-                ExpiresIn=expires_in,
+            response = self._get_presigner().generate_presigned_post(
+                request_dict={
+                    "url": self._get_upload_url(s3_key.bucket),
+                    "method": "POST",
+                    "headers": {},
+                    "body": b"",
+                    "context": {},
+                },
+                fields={"Content-Type": content_type, "key": s3_key.key},
+                conditions=conditions,
+                expires_in=expires_in,
             )
 
             expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
 
             logger.info(
-                f"Presigned URL gerada para {s3_key.key}, expira em {expires_at}"
+                "Presigned URL gerada para %s, expira em %s", s3_key.key, expires_at
             )
 
-            upload_url = response["url"]
-            upload_fields = response["fields"]
-
-            return upload_url, expires_at, upload_fields
+            return response["url"], expires_at, response["fields"]
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro ao gerar presigned URL: {e}")
+            logger.error("Erro ao gerar presigned URL: %s", e)
             raise BusinessRuleViolationError(f"Falha ao gerar URL de upload: {str(e)}")
 
+    async def generate_presigned_upload_url_async(
+        self, s3_key: S3Key, content_type: str, expires_in: int = 3600
+    ) -> tuple[str, datetime, dict]:
+        """
+        Versão assíncrona de generate_presigned_upload_url executada em thread pool
+
+        Returns:
+            tuple: (upload_url, expires_at, upload_fields)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self.generate_presigned_upload_url,
+                s3_key=s3_key,
+                content_type=content_type,
+                expires_in=expires_in,
+            ),
+        )
+
     async def download_file(self, s3_key: S3Key, local_path: str) -> bool:
         """
         Baixa arquivo do S3 para caminho local
 
+        Arquivos acima do multipart_threshold são baixados em ranges concorrentes
+
         Returns:
             bool: True se sucesso, False se falha
         """
         try:
-            async with await self._get_async_client() as client:
-                await client.download_file(s3_key.bucket, s3_key.key, local_path)
-
-            logger.info(f"Arquivo baixado: {s3_key.key} -> {local_path}")
+            client = await self._get_async_client()
+            head = await client.head_object(Bucket=s3_key.bucket, Key=s3_key.key)
+            size = head["ContentLength"]
+
+            with open(local_path, "wb") as file:
+                if size <= self._transfer_config.multipart_threshold:
+                    response = await client.get_object(
+                        Bucket=s3_key.bucket, Key=s3_key.key
+                    )
+                    await self._stream_body(
+                        response["Body"], 0, lambda _, chunk: file.write(chunk)
+                    )
+                else:
+
+                    def write_range(offset: int, data: bytes) -> None:
+                        file.seek(offset)
+                        file.write(data)
+
+                    await self._download_ranges(client, s3_key, size, write_range)
+
+            logger.info("Arquivo baixado: %s -> %s", s3_key.key, local_path)
             return True
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro ao baixar arquivo {s3_key.key}: {e}")
+            logger.error("Erro ao baixar arquivo %s: %s", s3_key.key, e)
             return False
 
     async def download_file_content(self, s3_key: S3Key) -> Optional[bytes]:
         """
         Baixa conteúdo do arquivo do S3 em memória
 
+        O conteúdo é gravado em um bytearray pré-alocado com o ContentLength;
+        arquivos acima do multipart_chunksize são baixados em ranges concorrentes
+
         Returns:
             bytes: Conteúdo do arquivo ou None se erro
         """
         try:
-            async with await self._get_async_client() as client:
+            client = await self._get_async_client()
+            head = await client.head_object(Bucket=s3_key.bucket, Key=s3_key.key)
+            size = head["ContentLength"]
+
+            buffer = bytearray(size)
+
+            def write_range(offset: int, data: bytes) -> None:
+                buffer[offset : offset + len(data)] = data
+
+            if size <= self._transfer_config.multipart_chunksize:
                 response = await client.get_object(Bucket=s3_key.bucket, Key=s3_key.key)
+                await self._stream_body(response["Body"], 0, write_range)
+            else:
+                await self._download_ranges(client, s3_key, size, write_range)
 
-                content = await response["Body"].read()
+            content = bytes(buffer)
 
-            logger.info(f"Conteúdo baixado: {s3_key.key} ({len(content)} bytes)")
+            logger.info("Conteúdo baixado: %s (%d bytes)", s3_key.key, len(content))
             return content
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro ao baixar conteúdo {s3_key.key}: {e}")
+            logger.error("Erro ao baixar conteúdo %s: %s", s3_key.key, e)
             return None
 
+    async def _download_ranges(
+        self,
+        client,
+        s3_key: S3Key,
+        size: int,
+        write_range: Callable[[int, bytes], None],
+    ) -> None:
+        """Baixa objeto em ranges concorrentes, entregando cada parte no seu offset"""
+        chunk_size = self._transfer_config.multipart_chunksize
+        semaphore = asyncio.Semaphore(self._transfer_config.max_request_concurrency)
+
+        async def fetch_range(start: int, end: int) -> None:
+            async with semaphore:
+                response = await client.get_object(
+                    Bucket=s3_key.bucket, Key=s3_key.key, Range=f"bytes={start}-{end}"
+                )
+                await self._stream_body(response["Body"], start, write_range)
+
+        await asyncio.gather(
+            *(
+                fetch_range(start, min(start + chunk_size, size) - 1)
+                for start in range(0, size, chunk_size)
+            )
+        )
+
+    async def _stream_body(
+        self, body, offset: int, write_range: Callable[[int, bytes], None]
+    ) -> None:
+        """Copia o corpo da resposta em blocos de io_chunksize a partir do offset"""
+        async for chunk in body.iter_chunks(self._transfer_config.io_chunksize):
+            write_range(offset, chunk)
+            offset += len(chunk)
+
     async def delete_file(self, s3_key: S3Key) -> bool:
         """
         Deleta arquivo do S3
@@ -158,16 +427,64 @@ class S3Service:
             bool: True se sucesso, False se falha
         """
         try:
-            async with await self._get_async_client() as client:
-                await client.delete_object(Bucket=s3_key.bucket, Key=s3_key.key)
+            client = await self._get_async_client()
+            await client.delete_object(Bucket=s3_key.bucket, Key=s3_key.key)
+            self.invalidate(s3_key)
 
-            logger.info(f"Arquivo deletado: {s3_key.key}")
+            logger.info("Arquivo deletado: %s", s3_key.key)
             return True
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro ao deletar arquivo {s3_key.key}: {e}")
+            logger.error("Erro ao deletar arquivo %s: %s", s3_key.key, e)
             return False
 
+    async def delete_files(self, keys: Sequence[S3Key]) -> list[S3Key]:
+        """
+        Deleta vários arquivos do S3 com delete_objects em lotes de até 1000 keys
+
+        Args:
+            keys: Chaves S3 a remover (podem ser de buckets diferentes)
+
+        Returns:
+            list[S3Key]: Chaves efetivamente removidas
+        """
+        by_bucket: dict[str, list[dict]] = {}
+        by_name: dict[tuple[str, str], S3Key] = {}
+        for s3_key in keys:
+            by_bucket.setdefault(s3_key.bucket, []).append({"Key": s3_key.key})
+            by_name[(s3_key.bucket, s3_key.key)] = s3_key
+
+        semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
+
+        async def delete_batch(bucket: str, batch: list[dict]) -> list[S3Key]:
+            async with semaphore:
+                client = await self._get_async_client()
+                deleted = await self._delete_objects(client, bucket, batch)
+            logger.info(
+                "Lote deletado em %s: %d/%d arquivos", bucket, len(deleted), len(batch)
+            )
+            return [by_name[(bucket, key)] for key in deleted]
+
+        results = await asyncio.gather(
+            *(
+                delete_batch(bucket, objects[i : i + _DELETE_BATCH_SIZE])
+                for bucket, objects in by_bucket.items()
+                for i in range(0, len(objects), _DELETE_BATCH_SIZE)
+            ),
+            return_exceptions=True,
+        )
+
+        deleted_keys: list[S3Key] = []
+        for result in results:
+            if isinstance(result, (BotoCoreError, ClientError)):
+                logger.error("Erro ao deletar lote de arquivos: %s", result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                deleted_keys.extend(result)
+
+        return deleted_keys
+
     async def file_exists(self, s3_key: S3Key) -> bool:
         """
         Verifica se arquivo existe no S3
@@ -176,17 +493,37 @@ class S3Service:
             bool: True se existe, False se não existe
         """
         try:
-            async with await self._get_async_client() as client:
-                await client.head_object(Bucket=s3_key.bucket, Key=s3_key.key)
+            await self._head_object(s3_key)
             return True
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
+            if e.response.get("Error", {}).get("Code") in _MISSING_CODES:
                 return False
-            logger.error(f"Erro ao verificar arquivo {s3_key.key}: {e}")
+            logger.error("Erro ao verificar arquivo %s: %s", s3_key.key, e)
             return False
         except BotoCoreError as e:
-            logger.error(f"Erro ao verificar arquivo {s3_key.key}: {e}")
+            logger.error("Erro ao verificar arquivo %s: %s", s3_key.key, e)
+            return False
+
+    async def file_exists_via_list(self, s3_key: S3Key) -> bool:
+        """
+        Verifica se arquivo existe no S3 via list_objects_v2, sem gerar 404
+
+        Returns:
+            bool: True se existe, False se não existe ou erro
+        """
+        try:
+            client = await self._get_async_client()
+            response = await client.list_objects_v2(
+                Bucket=s3_key.bucket, Prefix=s3_key.key, MaxKeys=1
+            )
+
+            # Prefix também casa keys mais longas; a exata vem primeiro se existir
+            contents = response.get("Contents", [])
+            return bool(contents) and contents[0]["Key"] == s3_key.key
+
+        except (BotoCoreError, ClientError) as e:
+            logger.error("Erro ao verificar arquivo %s: %s", s3_key.key, e)
             return False
 
     async def get_file_size(self, s3_key: S3Key) -> Optional[int]:
@@ -197,17 +534,100 @@ class S3Service:
             int: Tamanho em bytes ou None se erro
         """
         try:
-            async with await self._get_async_client() as client:
-                response = await client.head_object(
-                    Bucket=s3_key.bucket, Key=s3_key.key
-                )
+            response = await self._head_object(s3_key)
 
             return response["ContentLength"]
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro ao obter tamanho {s3_key.key}: {e}")
+            logger.error("Erro ao obter tamanho %s: %s", s3_key.key, e)
             return None
 
+    async def _head_object(self, s3_key: S3Key) -> dict:
+        """Executa head_object com cache LRU de curta duração"""
+        cache_key = (s3_key.bucket, s3_key.key)
+        cached = self._head_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _HEAD_CACHE_TTL_SECONDS:
+            self._head_cache.move_to_end(cache_key)
+            return cached[1]
+
+        client = await self._get_async_client()
+        response = await client.head_object(Bucket=s3_key.bucket, Key=s3_key.key)
+
+        self._head_cache[cache_key] = (time.monotonic(), response)
+        self._head_cache.move_to_end(cache_key)
+        if len(self._head_cache) > _HEAD_CACHE_SIZE:
+            self._head_cache.popitem(last=False)
+
+        return response
+
+    def invalidate(self, s3_key: S3Key) -> None:
+        """Remove metadados do arquivo do cache de head_object"""
+        self._head_cache.pop((s3_key.bucket, s3_key.key), None)
+
+    async def file_stats_batch(self, keys: list[S3Key]) -> dict[str, Optional[int]]:
+        """
+        Obtém tamanho de vários arquivos com list_objects_v2 agrupado por prefixo
+
+        Args:
+            keys: Chaves S3 a consultar
+
+        Returns:
+            dict: Tamanho em bytes por key, ou None se não existe ou erro
+        """
+        stats: dict[str, Optional[int]] = {s3_key.key: None for s3_key in keys}
+
+        groups: dict[tuple[str, str], set[str]] = {}
+        for s3_key in keys:
+            directory = s3_key.key.rpartition("/")[0]
+            groups.setdefault((s3_key.bucket, directory), set()).add(s3_key.key)
+
+        try:
+            client = await self._get_async_client()
+            for (bucket, _), wanted in groups.items():
+                stats.update(await self._list_sizes(client, bucket, wanted))
+
+            return stats
+
+        except (BotoCoreError, ClientError) as e:
+            logger.error("Erro ao obter tamanhos em lote: %s", e)
+            return stats
+
+    async def _list_sizes(self, client, bucket: str, wanted: set[str]) -> dict:
+        """Lista tamanhos das keys pedidas, parando ao passar da última delas"""
+        sizes = {}
+        last_key = max(wanted)
+        paginator = client.get_paginator("list_objects_v2")
+
+        # S3 lista em ordem lexicográfica, então nada depois de last_key interessa
+        async for page in paginator.paginate(
+            Bucket=bucket, Prefix=os.path.commonprefix(list(wanted))
+        ):
+            for obj in page.get("Contents", []):
+                if obj["Key"] in wanted:
+                    sizes[obj["Key"]] = obj["Size"]
+                if obj["Key"] >= last_key:
+                    return sizes
+
+        return sizes
+
+    async def _delete_objects(
+        self, client, bucket: str, objects: list[dict]
+    ) -> list[str]:
+        """Remove lote de objetos com uma única chamada delete_objects e retorna as keys removidas"""
+        response = await client.delete_objects(
+            Bucket=bucket, Delete={"Objects": objects}
+        )
+        for deleted in response.get("Deleted", []):
+            self._head_cache.pop((bucket, deleted["Key"]), None)
+        for error in response.get("Errors", []):
+            logger.warning(
+                "Falha ao deletar %s: %s %s",
+                error.get("Key"),
+                error.get("Code"),
+                error.get("Message"),
+            )
+        return [deleted["Key"] for deleted in response.get("Deleted", [])]
+
     async def cleanup_temp_files(
         self, prefix: str = "temp/", older_than_hours: int = 24
     ) -> int:
@@ -222,46 +642,94 @@ class S3Service:
             int: Número de arquivos removidos
         """
         try:
-            cutoff_time = datetime.utcnow() - timedelta(hours=older_than_hours)
-            deleted_count = 0
-
-            async with await self._get_async_client() as client:
-                paginator = client.get_paginator("list_objects_v2")
-
-                async for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
-                    if "Contents" not in page:
-                        continue
-
-                    for obj in page["Contents"]:
-                        if obj["LastModified"].replace(tzinfo=None) < cutoff_time:
-                            s3_key = S3Key(
-                                bucket=self.bucket, key=obj["Key"], region=self.region
-                            )
-
-                            if await self.delete_file(s3_key):
-                                deleted_count += 1
+            cutoff_ts = (
+                datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
+            ).timestamp()
+
+            client = await self._get_async_client()
+
+            # Faixas disjuntas (start_after, last_key] que cobrem todo o prefixo
+            bounds = [None] + [prefix + c for c in _LIST_RANGE_BOUNDS] + [None]
+            results = await asyncio.gather(
+                *(
+                    self._cleanup_key_range(client, prefix, cutoff_ts, start, end)
+                    for start, end in zip(bounds, bounds[1:])
+                )
+            )
+            deleted_count = sum(results)
 
-            logger.info(f"Cleanup S3: {deleted_count} arquivos temporários removidos")
+            logger.info("Cleanup S3: %d arquivos temporários removidos", deleted_count)
             return deleted_count
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro no cleanup S3: {e}")
+            logger.error("Erro no cleanup S3: %s", e)
             return 0
 
+    async def _cleanup_key_range(
+        self,
+        client,
+        prefix: str,
+        cutoff_ts: float,
+        start_after: Optional[str],
+        last_key: Optional[str],
+    ) -> int:
+        """Lista uma faixa de keys e remove as antigas a cada página"""
+        params = {
+            "Bucket": self.bucket,
+            "Prefix": prefix,
+            "PaginationConfig": {"PageSize": _DELETE_BATCH_SIZE},
+        }
+        if start_after:
+            params["StartAfter"] = start_after
+
+        deleted_count = 0
+        paginator = client.get_paginator("list_objects_v2")
+
+        # Cada página (até 1000 chaves) vira uma única chamada delete_objects
+        async for page in paginator.paginate(**params):
+            contents = page.get("Contents", [])
+            in_range = [
+                obj for obj in contents if last_key is None or obj["Key"] <= last_key
+            ]
+            expired = [
+                {"Key": obj["Key"]}
+                for obj in in_range
+                if obj["LastModified"].timestamp() < cutoff_ts
+            ]
+            if expired:
+                deleted = await self._delete_objects(client, self.bucket, expired)
+                deleted_count += len(deleted)
+                logger.debug("Cleanup S3: %d arquivos removidos", deleted_count)
+
+            if len(in_range) < len(contents):
+                break
+
+        return deleted_count
+
     async def test_connection(self) -> bool:
         """
         Testa conexão com S3
 
+        O resultado é reaproveitado por 15s para não sobrecarregar health checks
+
         Returns:
             bool: True se conectado, False se erro
         """
+        if self._connection_status is not None:
+            checked_at, ok = self._connection_status
+            if time.monotonic() - checked_at < _CONNECTION_STATUS_TTL_SECONDS:
+                return ok
+
         try:
-            async with await self._get_async_client() as client:
-                await client.head_bucket(Bucket=self.bucket)
+            client = await self._get_health_client()
+            await client.head_bucket(Bucket=self.bucket)
 
-            logger.info(f"Conexão S3 OK: bucket '{self.bucket}' acessível")
-            return True
+            logger.info("Conexão S3 OK: bucket '%s' acessível", self.bucket)
+            ok = True
 
         except (BotoCoreError, ClientError) as e:
-            logger.error(f"Erro na conexão S3: {e}")
-            return False
+            logger.error("Erro na conexão S3: %s", e)
+            ok = False
+
+        self._connection_status = (time.monotonic(), ok)
+        return ok
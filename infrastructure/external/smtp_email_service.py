@@ -1,18 +1,30 @@
+import asyncio
 import logging
 import re
-import smtplib
+import ssl
 import uuid
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate, make_msgid
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+import aiosmtplib
 
 from domain.exceptions.auth_exceptions import EmailDeliveryError
 from domain.services.email_service import EmailService
+from infrastructure.external.email_templates import render_email_template
 
 logger = logging.getLogger(__name__)
 
+# Conexões SMTP mantidas abertas e reaproveitadas entre envios
+_POOL_SIZE = 5
+_MAX_MESSAGES_PER_CONNECTION = 100
+
+# Relays lentos ou mortos não podem prender o envio indefinidamente
+_SMTP_TIMEOUT_SECONDS = 10
+_CONNECT_TIMEOUT_SECONDS = 12
+
 
 class SMTPEmailService(EmailService):
     """Implementação do EmailService usando SMTP"""
@@ -36,9 +48,40 @@ class SMTPEmailService(EmailService):
         self._from_email = from_email or smtp_username
         self._from_name = from_name
         self._base_url = base_url
-        
+
+        self._pool: Optional[asyncio.Queue] = None
+        self._pool_slots: Optional[asyncio.Semaphore] = None
+        self._messages_sent: dict[int, int] = {}
+        self._tls_context = ssl.create_default_context()
+
         # Validate configuration
         self._validate_configuration()
+        self._build_sender_headers()
+
+    def _build_sender_headers(self) -> None:
+        """Calcula uma vez os cabeçalhos de remetente, iguais em todo envio"""
+        host_domain = self._smtp_host if "." in self._smtp_host else "localhost"
+
+        if "@" in self._smtp_username:
+            sender_email = self._smtp_username
+        elif self._from_email:
+            sender_email = self._from_email
+        else:
+            sender_email = f"noreply@{host_domain}"
+
+        if "@" in self._smtp_username:
+            self._message_id_domain = self._smtp_username.split("@")[1]
+        elif self._from_email and "@" in self._from_email:
+            self._message_id_domain = self._from_email.split("@")[1]
+        else:
+            self._message_id_domain = host_domain
+
+        self._from_header = f"{self._from_name} <{sender_email}>"
+        self._reply_to_header = (
+            f"{self._from_name} <{self._from_email}>"
+            if self._from_email and self._from_email != sender_email
+            else None
+        )
 
     def _validate_configuration(self) -> None:
         """Validate SMTP configuration to prevent common issues"""
@@ -49,11 +92,13 @@ class SMTPEmailService(EmailService):
         if not self._smtp_password:
             raise ValueError("SMTP_PASSWORD is required")
         if self._from_email and not self._is_valid_email(self._from_email):
-            raise ValueError(f"SMTP_FROM_EMAIL must be a valid email: {self._from_email}")
+            raise ValueError(
+                f"SMTP_FROM_EMAIL must be a valid email: {self._from_email}"
+            )
 
     def _is_valid_email(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
         return bool(re.match(pattern, email))
 
     def _validate_email_input(self, email: str, full_name: str) -> None:
@@ -72,7 +117,62 @@ class SMTPEmailService(EmailService):
         municipality_name: Optional[str] = None,
     ) -> bool:
         """Envia email de convite para ativação de conta"""
-        
+
+        return await self._send_invitation(
+            email=email,
+            full_name=full_name,
+            invitation_token=invitation_token,
+            invited_by_name=invited_by_name,
+            municipality_name=municipality_name,
+        )
+
+    async def send_invitation_emails(self, invitations: List[Dict[str, Any]]) -> int:
+        """
+        Envia vários convites em sequência na mesma conexão SMTP
+
+        Cada item recebe os mesmos argumentos de send_invitation_email. Falhas
+        individuais são registradas sem interromper os demais envios; se a
+        conexão cair ou atingir o limite de mensagens, outra é obtida do pool.
+
+        Returns:
+            int: Quantidade de convites enviados
+        """
+        if not invitations:
+            return 0
+
+        sent = 0
+        connection = await self._acquire()
+        try:
+            for invitation in invitations:
+                if not self._is_reusable(connection):
+                    released, connection = connection, None
+                    await self._release(released, released.is_connected)
+                    connection = await self._acquire()
+                try:
+                    await self._send_invitation(**invitation, connection=connection)
+                    sent += 1
+                except EmailDeliveryError as e:
+                    logger.warning(
+                        "bulk_invitation_failed",
+                        extra={"to_email": invitation.get("email"), "error": str(e)},
+                    )
+        finally:
+            if connection is not None:
+                await self._release(connection, connection.is_connected)
+
+        return sent
+
+    async def _send_invitation(
+        self,
+        email: str,
+        full_name: str,
+        invitation_token: str,
+        invited_by_name: str,
+        municipality_name: Optional[str] = None,
+        connection: Optional[aiosmtplib.SMTP] = None,
+    ) -> bool:
+        """Monta e envia convite, opcionalmente em conexão já adquirida"""
+
         self._validate_email_input(email, full_name)
         if not invitation_token or len(invitation_token.strip()) < 8:
             raise EmailDeliveryError("Invalid invitation token")
@@ -102,6 +202,7 @@ class SMTPEmailService(EmailService):
             subject=subject,
             html_content=html_content,
             text_content=text_content,
+            connection=connection,
         )
 
     async def send_password_reset_email(
@@ -111,7 +212,7 @@ class SMTPEmailService(EmailService):
         reset_token: str,
     ) -> bool:
         """Envia email de redefinição de senha"""
-        
+
         self._validate_email_input(email, full_name)
         if not reset_token or len(reset_token.strip()) < 8:
             raise EmailDeliveryError("Invalid reset token")
@@ -144,7 +245,7 @@ class SMTPEmailService(EmailService):
         full_name: str,
     ) -> bool:
         """Envia email de confirmação de ativação de conta"""
-        
+
         self._validate_email_input(email, full_name)
 
         subject = "Conta ativada com sucesso!"
@@ -167,7 +268,7 @@ class SMTPEmailService(EmailService):
         municipality_name: Optional[str] = None,
     ) -> bool:
         """Envia email de boas-vindas após ativação"""
-        
+
         self._validate_email_input(email, full_name)
 
         municipality_text = f" da {municipality_name}" if municipality_name else ""
@@ -198,37 +299,22 @@ class SMTPEmailService(EmailService):
         subject: str,
         html_content: str,
         text_content: str,
+        connection: Optional[aiosmtplib.SMTP] = None,
     ) -> bool:
-        """Envia email via SMTP"""
+        """Envia email via SMTP, usando a conexão informada ou uma do pool"""
 
         try:
+            # MIMEMultipart já define MIME-Version
             msg = MIMEMultipart("alternative")
             msg["Subject"] = subject
-            if "@" in self._smtp_username:
-                from_email = self._smtp_username
-            elif self._from_email:
-                from_email = self._from_email
-            else:
-                host_domain = self._smtp_host if "." in self._smtp_host else "localhost"
-                from_email = f"noreply@{host_domain}"
-            
-            msg["From"] = f"{self._from_name} <{from_email}>"
+            msg["From"] = self._from_header
             msg["To"] = f"{to_name} <{to_email}>"
             msg["Date"] = formatdate(localtime=True)
-            
-            if "@" in self._smtp_username:
-                domain = self._smtp_username.split("@")[1]
-            elif self._from_email and "@" in self._from_email:
-                domain = self._from_email.split("@")[1]
-            else:
-                domain = self._smtp_host if "." in self._smtp_host else "localhost"
-            
-            msg["Message-ID"] = make_msgid(domain=domain)
+            msg["Message-ID"] = make_msgid(domain=self._message_id_domain)
             msg["X-Mailer"] = "Sistema de Documentos Inteligentes v2.0"
-            msg["MIME-Version"] = "1.0"
-            
-            if self._from_email and self._from_email != from_email:
-                msg["Reply-To"] = f"{self._from_name} <{self._from_email}>"
+
+            if self._reply_to_header:
+                msg["Reply-To"] = self._reply_to_header
 
             text_part = MIMEText(text_content, "plain", "utf-8")
             html_part = MIMEText(html_content, "html", "utf-8")
@@ -236,12 +322,18 @@ class SMTPEmailService(EmailService):
             msg.attach(text_part)
             msg.attach(html_part)
 
-            with smtplib.SMTP(self._smtp_host, self._smtp_port) as server:
-                if self._smtp_use_tls:
-                    server.starttls()
-
-                server.login(self._smtp_username, self._smtp_password)
-                server.send_message(msg)
+            if connection is not None:
+                await connection.send_message(msg)
+                self._record_sent(connection)
+            else:
+                connection = await self._acquire()
+                healthy = False
+                try:
+                    await connection.send_message(msg)
+                    self._record_sent(connection)
+                    healthy = True
+                finally:
+                    await self._release(connection, healthy)
 
             logger.info(
                 "email_sent_successfully",
@@ -254,7 +346,7 @@ class SMTPEmailService(EmailService):
 
             return True
 
-        except smtplib.SMTPAuthenticationError as e:
+        except aiosmtplib.SMTPAuthenticationError as e:
             logger.error(
                 "smtp_authentication_failed",
                 extra={
@@ -265,9 +357,11 @@ class SMTPEmailService(EmailService):
                     "smtp_username": self._smtp_username,
                 },
             )
-            raise EmailDeliveryError(f"Falha na autenticação SMTP. Verifique SMTP_USERNAME e SMTP_PASSWORD: {str(e)}")
-        
-        except smtplib.SMTPRecipientsRefused as e:
+            raise EmailDeliveryError(
+                f"Falha na autenticação SMTP. Verifique SMTP_USERNAME e SMTP_PASSWORD: {str(e)}"
+            )
+
+        except aiosmtplib.SMTPRecipientsRefused as e:
             logger.error(
                 "smtp_recipients_refused",
                 extra={
@@ -278,8 +372,8 @@ class SMTPEmailService(EmailService):
                 },
             )
             raise EmailDeliveryError(f"Email de destino rejeitado: {to_email}")
-        
-        except smtplib.SMTPServerDisconnected as e:
+
+        except aiosmtplib.SMTPServerDisconnected as e:
             logger.error(
                 "smtp_server_disconnected",
                 extra={
@@ -289,8 +383,24 @@ class SMTPEmailService(EmailService):
                     "smtp_host": self._smtp_host,
                 },
             )
-            raise EmailDeliveryError(f"Conexão SMTP perdida. Verifique SMTP_HOST e SMTP_PORT: {str(e)}")
-        
+            raise EmailDeliveryError(
+                f"Conexão SMTP perdida. Verifique SMTP_HOST e SMTP_PORT: {str(e)}"
+            )
+
+        except TimeoutError as e:
+            logger.error(
+                "smtp_timeout",
+                extra={
+                    "to_email": to_email,
+                    "subject": subject,
+                    "error": str(e),
+                    "smtp_host": self._smtp_host,
+                },
+            )
+            raise EmailDeliveryError(
+                f"Tempo esgotado na comunicação SMTP com {self._smtp_host}"
+            )
+
         except Exception as e:
             logger.error(
                 "email_send_failed",
@@ -303,6 +413,88 @@ class SMTPEmailService(EmailService):
             )
             raise EmailDeliveryError(f"Falha ao enviar email: {str(e)}")
 
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Abre conexão SMTP autenticada"""
+        connection = aiosmtplib.SMTP(
+            hostname=self._smtp_host,
+            port=self._smtp_port,
+            start_tls=self._smtp_use_tls,
+            timeout=_SMTP_TIMEOUT_SECONDS,
+            tls_context=self._tls_context,
+        )
+        try:
+            await connection.connect()
+            await connection.login(self._smtp_username, self._smtp_password)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        """Obtém conexão do pool, validando com NOOP ou reconectando"""
+        if self._pool is None:
+            self._pool = asyncio.Queue(maxsize=_POOL_SIZE)
+            self._pool_slots = asyncio.Semaphore(_POOL_SIZE)
+
+        await self._pool_slots.acquire()
+        try:
+            while not self._pool.empty():
+                connection = self._pool.get_nowait()
+                try:
+                    await connection.noop()
+                    return connection
+                except aiosmtplib.SMTPException:
+                    await self._discard(connection)
+
+            # Limita handshake TCP + STARTTLS + LOGIN como um todo
+            connection = await asyncio.wait_for(
+                self._connect(), timeout=_CONNECT_TIMEOUT_SECONDS
+            )
+            self._messages_sent[id(connection)] = 0
+            return connection
+        except BaseException:
+            self._pool_slots.release()
+            raise
+
+    def _record_sent(self, connection: aiosmtplib.SMTP) -> None:
+        """Conta uma mensagem enviada pela conexão"""
+        self._messages_sent[id(connection)] = (
+            self._messages_sent.get(id(connection), 0) + 1
+        )
+
+    def _is_reusable(self, connection: aiosmtplib.SMTP) -> bool:
+        """Conexão ainda aberta e abaixo do limite de mensagens"""
+        return (
+            connection.is_connected
+            and self._messages_sent.get(id(connection), 0)
+            < _MAX_MESSAGES_PER_CONNECTION
+        )
+
+    async def _release(self, connection: aiosmtplib.SMTP, healthy: bool) -> None:
+        """Devolve conexão ao pool ou a descarta após erro ou uso excessivo"""
+        try:
+            if healthy and self._is_reusable(connection):
+                self._pool.put_nowait(connection)
+            else:
+                await self._discard(connection)
+        finally:
+            self._pool_slots.release()
+
+    async def _discard(self, connection: aiosmtplib.SMTP) -> None:
+        """Encerra conexão SMTP ignorando falhas"""
+        self._messages_sent.pop(id(connection), None)
+        try:
+            await connection.quit()
+        except aiosmtplib.SMTPException:
+            connection.close()
+
+    async def aclose(self) -> None:
+        """Fecha todas as conexões ociosas do pool"""
+        if self._pool is None:
+            return
+        while not self._pool.empty():
+            await self._discard(self._pool.get_nowait())
+
     def _create_invitation_html(
         self,
         full_name: str,
@@ -314,65 +506,13 @@ class SMTPEmailService(EmailService):
 
         municipality_text = f" da {municipality_name}" if municipality_name else ""
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Convite para o Sistema</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #2c3e50; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; background: #f8f9fa; }}
-                .button {{
-                    display: inline-block;
-                    background: #3498db;
-                    color: white;
-                    padding: 12px 24px;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .footer {{ padding: 20px; text-align: center; color: #666; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Sistema de Documentos Inteligentes{municipality_text}</h1>
-                </div>
-
-                <div class="content">
-                    <h2>Olá, {full_name}!</h2>
-
-                    <p>Você foi convidado por <strong>{invited_by_name}</strong> para acessar o Sistema de Documentos Inteligentes{municipality_text}.</p>
-                    <p>Este sistema permite que você:</p>
-                    <ul>
-                        <li>Faça perguntas sobre documentos oficiais</li>
-                        <li>Obtenha respostas inteligentes baseadas em IA</li>
-                        <li>Acesse informações de forma rápida e eficiente</li>
-                    </ul>
-
-                    <p>Para ativar sua conta, clique no botão abaixo:</p>
-
-                    <div style="text-align: center;">
-                        <a href="{activation_url}" class="button">Ativar Minha Conta</a>
-                    </div>
-
-                    <p><small>Se o botão não funcionar, copie e cole este link no seu navegador:<br>
-                    <a href="{activation_url}">{activation_url}</a></small></p>
-
-                    <p><strong>Importante:</strong> Este convite expira em 7 dias.</p>
-                </div>
-
-                <div class="footer">
-                    <p>Este é um email automático. Não responda a esta mensagem.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return render_email_template(
+            "invitation.html",
+            full_name=full_name,
+            invited_by_name=invited_by_name,
+            activation_url=activation_url,
+            municipality_text=municipality_text,
+        )
 
     def _create_invitation_text(
         self,
@@ -385,173 +525,49 @@ class SMTPEmailService(EmailService):
 
         municipality_text = f" da {municipality_name}" if municipality_name else ""
 
-        return f"""
-Sistema de Documentos Inteligentes{municipality_text}
-
-Olá, {full_name}!
-
-Você foi convidado por {invited_by_name} para acessar o Sistema de Documentos Inteligentes{municipality_text}.
-
-Este sistema permite que você:
-- Faça perguntas sobre documentos oficiais
-- Obtenha respostas inteligentes baseadas em IA
-- Acesse informações de forma rápida e eficiente
-
-Para ativar sua conta, acesse o link abaixo:
-{activation_url}
-
-IMPORTANTE: Este convite expira em 7 dias.
-
----
-Este é um email automático. Não responda a esta mensagem.
-        """
+        return render_email_template(
+            "invitation.txt",
+            full_name=full_name,
+            invited_by_name=invited_by_name,
+            activation_url=activation_url,
+            municipality_text=municipality_text,
+        )
 
     def _create_password_reset_html(self, full_name: str, reset_url: str) -> str:
         """Cria conteúdo HTML do email de redefinição de senha"""
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Redefinição de Senha</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #e74c3c; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; background: #f8f9fa; }}
-                .button {{
-                    display: inline-block;
-                    background: #e74c3c;
-                    color: white;
-                    padding: 12px 24px;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .footer {{ padding: 20px; text-align: center; color: #666; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Redefinição de Senha</h1>
-                </div>
-
-                <div class="content">
-                    <h2>Olá, {full_name}!</h2>
-
-                    <p>Recebemos uma solicitação para redefinir a senha da sua conta.</p>
-
-                    <p>Se você fez esta solicitação, clique no botão abaixo para criar uma nova senha:</p>
-
-                    <div style="text-align: center;">
-                        <a href="{reset_url}" class="button">Redefinir Senha</a>
-                    </div>
-
-                    <p><small>Se o botão não funcionar, copie e cole este link no seu navegador:<br>
-                    <a href="{reset_url}">{reset_url}</a></small></p>
-
-                    <p><strong>Se você não solicitou esta redefinição, ignore este email.</strong> Sua senha permanecerá inalterada.</p>
-
-                    <p><small>Este link expira em 1 hora por segurança.</small></p>
-                </div>
-
-                <div class="footer">
-                    <p>Este é um email automático. Não responda a esta mensagem.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return render_email_template(
+            "password_reset.html",
+            full_name=full_name,
+            reset_url=reset_url,
+        )
 
     def _create_password_reset_text(self, full_name: str, reset_url: str) -> str:
         """Cria conteúdo texto do email de redefinição de senha"""
 
-        return f"""
-Redefinição de Senha
-
-Olá, {full_name}!
-
-Recebemos uma solicitação para redefinir a senha da sua conta.
-
-Se você fez esta solicitação, acesse o link abaixo para criar uma nova senha:
-{reset_url}
-
-Se você não solicitou esta redefinição, ignore este email. Sua senha permanecerá inalterada.
-
-IMPORTANTE: Este link expira em 1 hora por segurança.
-
----
-Este é um email automático. Não responda a esta mensagem.
-        """
+        return render_email_template(
+            "password_reset.txt",
+            full_name=full_name,
+            reset_url=reset_url,
+        )
 
     def _create_account_activated_html(self, full_name: str) -> str:
         """Cria conteúdo HTML do email de confirmação de ativação"""
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Conta Ativada</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #27ae60; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; background: #f8f9fa; }}
-                .footer {{ padding: 20px; text-align: center; color: #666; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>✅ Conta Ativada com Sucesso!</h1>
-                </div>
-
-                <div class="content">
-                    <h2>Parabéns, {full_name}!</h2>
-
-                    <p>Sua conta foi ativada com sucesso no Sistema de Documentos Inteligentes.</p>
-
-                    <p>Agora você pode:</p>
-                    <ul>
-                        <li>Fazer login no sistema</li>
-                        <li>Fazer perguntas sobre documentos</li>
-                        <li>Acessar todas as funcionalidades disponíveis</li>
-                    </ul>
-
-                    <p>Acesse o sistema em: <a href="{self._base_url}">{self._base_url}</a></p>
-                </div>
-
-                <div class="footer">
-                    <p>Este é um email automático. Não responda a esta mensagem.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return render_email_template(
+            "account_activated.html",
+            full_name=full_name,
+            base_url=self._base_url,
+        )
 
     def _create_account_activated_text(self, full_name: str) -> str:
         """Cria conteúdo texto do email de confirmação de ativação"""
 
-        return f"""
-Conta Ativada com Sucesso!
-
-Parabéns, {full_name}!
-
-Sua conta foi ativada com sucesso no Sistema de Documentos Inteligentes.
-
-Agora você pode:
-- Fazer login no sistema
-- Fazer perguntas sobre documentos
-- Acessar todas as funcionalidades disponíveis
-
-Acesse o sistema em: {self._base_url}
-
----
-Este é um email automático. Não responda a esta mensagem.
-        """
+        return render_email_template(
+            "account_activated.txt",
+            full_name=full_name,
+            base_url=self._base_url,
+        )
 
     def _create_welcome_html(
         self, full_name: str, municipality_name: Optional[str] = None
@@ -560,52 +576,12 @@ Este é um email automático. Não responda a esta mensagem.
 
         municipality_text = f" da {municipality_name}" if municipality_name else ""
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Bem-vindo</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #3498db; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; background: #f8f9fa; }}
-                .footer {{ padding: 20px; text-align: center; color: #666; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎉 Bem-vindo ao Sistema!</h1>
-                </div>
-
-                <div class="content">
-                    <h2>Olá, {full_name}!</h2>
-
-                    <p>Seja bem-vindo ao Sistema de Documentos Inteligentes{municipality_text}!</p>
-
-                    <p>Você agora tem acesso a uma ferramenta poderosa que utiliza inteligência artificial para ajudar você a encontrar informações em documentos oficiais de forma rápida e precisa.</p>
-                    <h3>Como usar o sistema:</h3>
-                    <ol>
-                        <li>Faça login com seu email e senha</li>
-                        <li>Digite sua pergunta na caixa de chat</li>
-                        <li>Receba respostas baseadas nos documentos oficiais</li>
-                        <li>Use as citações para verificar as fontes</li>
-                    </ol>
-
-                    <p>Se tiver dúvidas, entre em contato com o administrador do sistema.</p>
-
-                    <p>Acesse o sistema: <a href="{self._base_url}">{self._base_url}</a></p>
-                </div>
-
-                <div class="footer">
-                    <p>Este é um email automático. Não responda a esta mensagem.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return render_email_template(
+            "welcome.html",
+            full_name=full_name,
+            municipality_text=municipality_text,
+            base_url=self._base_url,
+        )
 
     def _create_welcome_text(
         self, full_name: str, municipality_name: Optional[str] = None
@@ -614,25 +590,9 @@ Este é um email automático. Não responda a esta mensagem.
 
         municipality_text = f" da {municipality_name}" if municipality_name else ""
 
-        return f"""
-Bem-vindo ao Sistema de Documentos Inteligentes{municipality_text}!
-
-Olá, {full_name}!
-
-Seja bem-vindo ao Sistema de Documentos Inteligentes{municipality_text}!
-
-Você agora tem acesso a uma ferramenta poderosa que utiliza inteligência artificial para ajudar você a encontrar informações em documentos oficiais de forma rápida e precisa.
-
-Como usar o sistema:
-1. Faça login com seu email e senha
-2. Digite sua pergunta na caixa de chat
-3. Receba respostas baseadas nos documentos oficiais
-4. Use as citações para verificar as fontes
-
-Se tiver dúvidas, entre em contato com o administrador do sistema.
-
-Acesse o sistema: {self._base_url}
-
----
-Este é um email automático. Não responda a esta mensagem.
-        """
+        return render_email_template(
+            "welcome.txt",
+            full_name=full_name,
+            municipality_text=municipality_text,
+            base_url=self._base_url,
+        )
@@ -1,22 +1,24 @@
+import functools
 import re
-from typing import Any, Dict, Optional
+from bisect import bisect_left
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
+
+import ahocorasick
+
+_LANGUAGE_DECISION_MARGIN = 5
 
 
 class ContextGenerator:
 
-    def __init__(self):
-        self.content_patterns = {
-            "legal": ["artigo", "lei", "decreto", "resolução", "parágrafo", "inciso"],
-            "financial": [
-                "receita",
-                "despesa",
-                "orçamento",
-                "valor",
-                "custo",
-                "preço",
-                "proposta",
-            ],
-            "administrative": [
+    CONTENT_PATTERNS: ClassVar[Dict[str, FrozenSet[str]]] = {
+        "legal": frozenset(
+            {"artigo", "lei", "decreto", "resolução", "parágrafo", "inciso"}
+        ),
+        "financial": frozenset(
+            {"receita", "despesa", "orçamento", "valor", "custo", "preço", "proposta"}
+        ),
+        "administrative": frozenset(
+            {
                 "ofício",
                 "memorando",
                 "circular",
@@ -26,19 +28,58 @@ class ContextGenerator:
                 "câmara",
                 "vereador",
                 "prefeito",
-            ],
-            "technical": ["função", "método", "algoritmo", "sistema", "processo"],
-            "medical": ["paciente", "diagnóstico", "tratamento", "medicamento"],
-            "academic": ["pesquisa", "estudo", "análise", "conclusão", "bibliografia"],
-        }
-
-        self.section_indicators = [
-            r"^#{1,6}\s+(.+)$",
-            r"^[A-Z][^.]*:$",
-            r"^\d+\.\s+(.+)$",
-            r"^[IVX]+\.\s+(.+)$",
-            r"^[a-z]\)\s+(.+)$",
-        ]
+            }
+        ),
+        "technical": frozenset(
+            {"função", "método", "algoritmo", "sistema", "processo"}
+        ),
+        "medical": frozenset({"paciente", "diagnóstico", "tratamento", "medicamento"}),
+        "academic": frozenset(
+            {"pesquisa", "estudo", "análise", "conclusão", "bibliografia"}
+        ),
+    }
+
+    SECTION_INDICATORS: ClassVar[Tuple[str, ...]] = (
+        r"^#{1,6}\s+(.+)$",
+        r"^[A-Z][^.]*:$",
+        r"^\d+\.\s+(.+)$",
+        r"^[IVX]+\.\s+(.+)$",
+        r"^[a-z]\)\s+(.+)$",
+    )
+
+    PORTUGUESE_WORDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"que", "para", "com", "uma", "dos", "são", "este", "pela"}
+    )
+    ENGLISH_WORDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"the", "and", "that", "have", "for", "not", "with", "you"}
+    )
+
+    _SECTION_RES = [re.compile(pattern, re.MULTILINE) for pattern in SECTION_INDICATORS]
+    _SECTION_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in SECTION_INDICATORS), re.MULTILINE
+    )
+    _MONEY_RE = re.compile(r"\$\d+|R\$\s*\d+|\€\d+")
+    _DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}|\d{4}-\d{2}-\d{2}")
+    _NUMBERED_RE = re.compile(r"^\d+\.", re.MULTILINE)
+    _TITLE_RE = re.compile(r"^[ \t]*([A-ZÀ-Ý][^.\n]{9,97}[^.\s])[ \t]*$", re.MULTILINE)
+    _TABLE_RE = re.compile(r"\|.*\|.*\|")
+    _BULLET_LIST_RE = re.compile(r"^\s*[-*•]\s+", re.MULTILINE)
+    _NUMBERED_LIST_RE = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+    _WORD_RE = re.compile(r"[a-záéíóúâêôãõç]+")
+
+    def __init__(self):
+        self._content_automaton = self._build_content_automaton()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_content_automaton(cls):
+        """Monta autômato Aho–Corasick com os padrões de todas as categorias"""
+        automaton = ahocorasick.Automaton()
+        for content_type, patterns in cls.CONTENT_PATTERNS.items():
+            for pattern in patterns:
+                automaton.add_word(pattern, content_type)
+        automaton.make_automaton()
+        return automaton
 
     def generate_context(
         self, chunk: str, metadata: Dict[str, Any], position_info: Dict[str, Any]
@@ -49,7 +90,7 @@ class ContextGenerator:
         if doc_context:
             context_parts.append(doc_context)
 
-        section_context = self._get_section_context(chunk, position_info)
+        section_context = self._get_section_context(chunk, position_info, metadata)
         if section_context:
             context_parts.append(section_context)
 
@@ -82,15 +123,17 @@ class ContextGenerator:
         return " | ".join(context_parts) if context_parts else None
 
     def _get_section_context(
-        self, chunk: str, position_info: Dict[str, Any]
+        self,
+        chunk: str,
+        position_info: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> Optional[str]:
-        for pattern in self.section_indicators:
-            matches = re.findall(pattern, chunk, re.MULTILINE)
-            if matches:
-                header = matches[0][:20]
-                if len(matches[0]) > 20:
-                    header += "..."
-                return f"Seção: {header}"
+        title = self._find_section_title(chunk, position_info, metadata or {})
+        if title:
+            header = title[:20]
+            if len(title) > 20:
+                header += "..."
+            return f"Seção: {header}"
 
         chunk_index = position_info.get("chunk_index", 0)
         total_chunks = position_info.get("total_chunks", 1)
@@ -108,26 +151,53 @@ class ContextGenerator:
 
         return None
 
+    def _find_section_title(
+        self, chunk: str, position_info: Dict[str, Any], metadata: Dict[str, Any]
+    ) -> Optional[str]:
+        """Retorna o cabeçalho dentro do chunk ou, se houver offsets, o anterior"""
+        offsets = metadata.get("_header_offsets")
+        start_char = position_info.get("start_char")
+        if offsets is None or start_char is None:
+            match = self._SECTION_RE.search(chunk)
+            return self._header_title(match) if match else None
+
+        titles = metadata["_header_titles"]
+        end_char = position_info.get("end_char", start_char + len(chunk))
+        index = bisect_left(offsets, start_char)
+        if index < len(offsets) and offsets[index] < end_char:
+            return titles[index]
+        if index > 0:
+            return titles[index - 1]
+        return None
+
+    def _header_title(self, match: re.Match) -> str:
+        """Extrai o título do cabeçalho encontrado"""
+        return next(
+            (group for group in match.groups() if group is not None),
+            match.group(0),
+        )
+
     def _get_content_type_context(self, chunk: str) -> Optional[str]:
         chunk_lower = chunk.lower()
 
-        type_scores = {}
-        for content_type, patterns in self.content_patterns.items():
-            score = sum(chunk_lower.count(pattern) for pattern in patterns)
-            if score > 0:
-                type_scores[content_type] = score
+        # Mantém a ordem das categorias para desempate igual ao da contagem
+        counts = dict.fromkeys(self.CONTENT_PATTERNS, 0)
+        for _, content_type in self._content_automaton.iter(chunk_lower):
+            counts[content_type] += 1
+        type_scores = {t: score for t, score in counts.items() if score > 0}
 
         if type_scores:
             best_type = max(type_scores, key=type_scores.get)
             return f"Conteúdo: {best_type.title()}"
 
-        if re.search(r"\$\d+|R\$\s*\d+|\€\d+", chunk):
+        # Testes de pertinência baratos evitam o regex na maioria dos chunks
+        if ("$" in chunk or "€" in chunk) and self._MONEY_RE.search(chunk):
             return "Conteúdo: Financeiro"
-        elif re.search(r"\d{2}/\d{2}/\d{4}|\d{4}-\d{2}-\d{2}", chunk):
+        elif ("/" in chunk or "-" in chunk) and self._DATE_RE.search(chunk):
             return "Conteúdo: Datas"
         elif chunk.count("?") > 2:
             return "Conteúdo: Perguntas"
-        elif re.search(r"^\d+\.", chunk, re.MULTILINE):
+        elif "." in chunk and self._NUMBERED_RE.search(chunk):
             return "Conteúdo: Lista numerada"
 
         return None
@@ -146,6 +216,12 @@ class ContextGenerator:
         if language:
             enhanced_metadata["language"] = language
 
+        headers = list(self._SECTION_RE.finditer(full_text))
+        enhanced_metadata["_header_offsets"] = [match.start() for match in headers]
+        enhanced_metadata["_header_titles"] = [
+            self._header_title(match) for match in headers
+        ]
+
         enhanced_metadata["headers_count"] = self._count_headers(full_text)
         enhanced_metadata["has_tables"] = self._has_tables(full_text)
         enhanced_metadata["has_lists"] = self._has_lists(full_text)
@@ -153,42 +229,35 @@ class ContextGenerator:
         return enhanced_metadata
 
     def _extract_title_from_text(self, text: str) -> Optional[str]:
-        lines = text.split("\n")[:10]
-
-        for line in lines:
-            line = line.strip()
-            if len(line) > 10 and len(line) < 100:
-                if (
-                    line.isupper()
-                    or line.count(" ") < 8
-                    or re.match(r"^[A-Z][^.]*$", line)
-                ):
-                    return line
-
-        return None
+        match = self._TITLE_RE.search(text[:1024])
+        return match.group(1) if match else None
 
     def _detect_language(self, text: str) -> str:
-        sample = text[:1000].lower()
-
-        portuguese_words = ["que", "para", "com", "uma", "dos", "são", "este", "pela"]
-        english_words = ["the", "and", "that", "have", "for", "not", "with", "you"]
+        pt_count = 0
+        en_count = 0
+
+        for match in self._WORD_RE.finditer(text[:1000].lower()):
+            word = match.group()
+            if word in self.PORTUGUESE_WORDS:
+                pt_count += 1
+            elif word in self.ENGLISH_WORDS:
+                en_count += 1
+            else:
+                continue
 
-        pt_count = sum(sample.count(word) for word in portuguese_words)
-        en_count = sum(sample.count(word) for word in english_words)
+            # Vantagem suficiente já decide o idioma
+            if abs(pt_count - en_count) > _LANGUAGE_DECISION_MARGIN:
+                break
 
         return "portuguese" if pt_count > en_count else "english"
 
     def _count_headers(self, text: str) -> int:
-        count = 0
-        for pattern in self.section_indicators:
-            count += len(re.findall(pattern, text, re.MULTILINE))
-        return count
+        return sum(len(pattern.findall(text)) for pattern in self._SECTION_RES)
 
     def _has_tables(self, text: str) -> bool:
-        return bool(re.search(r"\|.*\|.*\|", text) or text.count("\t") > 10)
+        return bool(self._TABLE_RE.search(text) or text.count("\t") > 10)
 
     def _has_lists(self, text: str) -> bool:
         return bool(
-            re.search(r"^\s*[-*•]\s+", text, re.MULTILINE)
-            or re.search(r"^\s*\d+\.\s+", text, re.MULTILINE)
+            self._BULLET_LIST_RE.search(text) or self._NUMBERED_LIST_RE.search(text)
         )
@@ -1,7 +1,7 @@
-from typing import Dict, List
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Tuple
 
 import tiktoken
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from domain.entities.document import DocumentChunk
 from domain.exceptions.document_exceptions import ChunkingError
@@ -29,22 +29,93 @@ class TextChunker:
             ContextGenerator() if use_contextual_retrieval else None
         )
 
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=self._tiktoken_len,
-            separators=["\n\n", "\n", ". ", " ", ""],
-        )
-
-    def _tiktoken_len(self, text: str) -> int:
-        try:
-            return len(self.encoding.encode(text))
-        except Exception:
-            return len(text.split())
+        if chunk_overlap >= chunk_size:
+            raise ValueError(
+                f"Got a larger chunk overlap ({chunk_overlap}) than chunk size "
+                f"({chunk_size}), should be smaller."
+            )
+
+        self.separators = ["\n\n", "\n", ". ", " "]
+
+    def _estimate_token_count(self, text: str) -> int:
+        # cl100k_base fica em torno de 4 caracteres por token em português
+        return len(text) // 4
+
+    def split_text(self, content: str) -> List[str]:
+        """Divide o texto em janelas de até chunk_size tokens"""
+        return [content[start:end] for start, end in self._split_spans(content)]
+
+    def _split_spans(self, content: str) -> List[Tuple[int, int]]:
+        """
+        Retorna as posições (início, fim) de cada chunk no texto
+
+        O documento é tokenizado uma única vez; cada janela recua até o último
+        separador preferencial (parágrafo, linha, frase, palavra) dentro dela.
+        """
+        tokens = self.encoding.encode_ordinary(content)
+        if not tokens:
+            return []
+
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        offsets.append(len(content))
+        total_tokens = len(tokens)
+
+        spans = []
+        start = 0
+        while start < total_tokens:
+            end = min(start + self.chunk_size, total_tokens)
+            if end < total_tokens:
+                end = self._find_break(content, offsets, start, end)
+
+            span_start, span_end = offsets[start], offsets[end]
+            while span_start < span_end and content[span_start].isspace():
+                span_start += 1
+            while span_end > span_start and content[span_end - 1].isspace():
+                span_end -= 1
+            if span_start < span_end:
+                spans.append((span_start, span_end))
+
+            if end >= total_tokens:
+                break
+            start = max(end - self.chunk_overlap, start + 1)
+
+        return spans
+
+    def _find_break(
+        self, content: str, offsets: List[int], start: int, end: int
+    ) -> int:
+        """
+        Retorna o token onde a janela deve terminar, no melhor separador
+
+        Só aceita separadores depois da metade da janela; um título curto
+        seguido de parágrafo longo não vira um chunk minúsculo.
+        """
+        window_start = offsets[start]
+        window = content[window_start : offsets[end]]
+        min_cut = len(window) // 2
+
+        for separator in self.separators:
+            cut = window.rfind(separator)
+            if cut > 0 and cut >= min_cut:
+                position = window_start + cut + len(separator.rstrip())
+                return bisect_left(offsets, position, start + 1, end)
+
+        return end
 
     def chunk_document_content(
         self, content: str, document_id: str, metadata: Dict
     ) -> List[DocumentChunk]:
+        return list(self.iter_chunk_document_content(content, document_id, metadata))
+
+    def iter_chunk_document_content(
+        self, content: str, document_id: str, metadata: Dict
+    ) -> Iterator[DocumentChunk]:
+        """
+        Gera os chunks do documento um a um
+
+        Apenas as posições dos chunks são calculadas antecipadamente; o texto
+        contextualizado e o DocumentChunk são criados sob demanda.
+        """
         try:
             if self.use_contextual_retrieval and self.context_generator:
                 enhanced_metadata = self.context_generator.extract_document_metadata(
@@ -53,31 +124,29 @@ class TextChunker:
             else:
                 enhanced_metadata = metadata.copy()
 
-            text_chunks = self.splitter.split_text(content)
-
-            document_chunks = []
-            start_char = 0
-
-            for i, chunk_text in enumerate(text_chunks):
-                end_char = start_char + len(chunk_text)
-
-                chunk_metadata = enhanced_metadata.copy()
-                chunk_metadata.update(
-                    {
-                        "chunk_id": f"{document_id}_{i}",
-                        "chunk_index": i,
-                        "total_chunks": len(text_chunks),
-                    }
-                )
-
-                if self.use_contextual_retrieval and self.context_generator:
-                    position_info = {
-                        "chunk_index": i,
-                        "total_chunks": len(text_chunks),
-                        "relative_position": (
-                            i / len(text_chunks) if len(text_chunks) > 1 else 0
-                        ),
-                    }
+            spans = self._split_spans(content)
+            total_chunks = len(spans)
+            use_context = bool(self.use_contextual_retrieval and self.context_generator)
+
+            # Reaproveitado entre iterações; generate_context não guarda referência
+            position_info = {
+                "chunk_index": 0,
+                "total_chunks": total_chunks,
+                "relative_position": 0,
+                "start_char": 0,
+                "end_char": 0,
+            }
+
+            for i, (start_char, end_char) in enumerate(spans):
+                chunk_text = content[start_char:end_char]
+
+                if use_context:
+                    position_info["chunk_index"] = i
+                    position_info["relative_position"] = (
+                        i / total_chunks if total_chunks > 1 else 0
+                    )
+                    position_info["start_char"] = start_char
+                    position_info["end_char"] = end_char
 
                     contextualized_text = self.context_generator.generate_context(
                         chunk_text, enhanced_metadata, position_info
@@ -85,7 +154,7 @@ class TextChunker:
                 else:
                     contextualized_text = chunk_text
 
-                chunk = DocumentChunk(
+                yield DocumentChunk(
                     id=None,
                     document_id=document_id,
                     content=contextualized_text,
@@ -95,14 +164,9 @@ class TextChunker:
                     end_char=end_char,
                 )
 
-                document_chunks.append(chunk)
-                start_char = end_char
-
-            return document_chunks
-
         except Exception as e:
             raise ChunkingError(f"Failed to chunk document content: {e}")
 
     def estimate_chunk_count(self, content: str) -> int:
-        token_count = self._tiktoken_len(content)
+        token_count = self._estimate_token_count(content)
         return max(1, (token_count + self.chunk_size - 1) // self.chunk_size)
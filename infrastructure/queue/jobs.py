@@ -1,49 +1,138 @@
 import asyncio
+import functools
 import logging
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+import redis.asyncio as redis
 from rq import get_current_job
+from sqlalchemy import and_, delete, exists, select
+
+from domain.services.document_processor import DocumentProcessor
+from domain.services.document_service import DocumentService
+from domain.value_objects.s3_key import S3Key
+from infrastructure.config.settings import settings
+from infrastructure.database.connection import db_connection, get_async_session
+from infrastructure.database.models import DocumentProcessingJobModel, FileUploadModel
+from infrastructure.external.embedding_cache import EmbeddingCache
+from infrastructure.external.openai_client import OpenAIClient
+from infrastructure.external.s3_service import S3Service
+from infrastructure.external.smtp_email_service import SMTPEmailService
+from infrastructure.processors.text_chunker import TextChunker
+from infrastructure.repositories.postgres_document_processing_job_repository import (
+    PostgresDocumentProcessingJobRepository,
+)
+from infrastructure.repositories.postgres_document_repository import (
+    PostgresDocumentChunkRepository,
+    PostgresDocumentRepository,
+)
+from infrastructure.repositories.postgres_file_upload_repository import (
+    PostgresFileUploadRepository,
+)
+from infrastructure.repositories.postgres_vector_repository import (
+    PostgresVectorRepository,
+)
 
 logger = logging.getLogger(__name__)
 
+# Linhas lidas por vez na limpeza (limite do delete_objects do S3)
+_CLEANUP_PARTITION_SIZE = 1000
+
+# Loop único por processo: o engine SQLAlchemy e os pools HTTP ficam presos ao
+# loop em que foram criados, então recriá-lo a cada job descarta as conexões
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro):
+    """Executa a corrotina no event loop persistente do worker"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+@functools.lru_cache(maxsize=1)
+def _s3():
+    """S3Service compartilhado pelos jobs do processo"""
+    return S3Service(
+        bucket=settings.s3_bucket,
+        region=settings.s3_region,
+        access_key=settings.aws_access_key,
+        secret_key=settings.aws_secret_key,
+        endpoint_url=settings.s3_endpoint_url,
+        public_endpoint_url=getattr(
+            settings, "s3_public_endpoint_url", settings.s3_endpoint_url
+        ),
+    )
 
-async def _cleanup_orphaned_s3_file(file_upload_id: str):
-    """Limpa arquivo S3 órfão após esgotar tentativas"""
-    try:
-        from uuid import UUID
 
-        from infrastructure.config.settings import settings
-        from infrastructure.database.connection import get_async_session
-        from infrastructure.external.s3_service import S3Service
-        from infrastructure.repositories.postgres_file_upload_repository import (
-            PostgresFileUploadRepository,
-        )
+@functools.lru_cache(maxsize=1)
+def _openai():
+    """OpenAIClient compartilhado pelos jobs do processo"""
+    return OpenAIClient()
 
-        async with get_async_session() as session:
-            file_upload_repo = PostgresFileUploadRepository(session)
-            file_upload = await file_upload_repo.find_by_id(UUID(file_upload_id))
 
-            if file_upload and file_upload.s3_key:
-                s3_service = S3Service(
-                    bucket=settings.s3_bucket,
-                    region=settings.s3_region,
-                    access_key=settings.aws_access_key,
-                    secret_key=settings.aws_secret_key,
-                    endpoint_url=settings.s3_endpoint_url,
-                )
+@functools.lru_cache(maxsize=1)
+def _chunker():
+    """TextChunker compartilhado pelos jobs do processo"""
+    return TextChunker(
+        chunk_size=getattr(settings, "chunk_size", 500),
+        chunk_overlap=getattr(settings, "chunk_overlap", 50),
+        use_contextual_retrieval=getattr(settings, "use_contextual_retrieval", True),
+    )
 
-                success = await s3_service.delete_file(file_upload.s3_key)
-                if success:
-                    logger.info(f"Arquivo S3 órfão removido: {file_upload.s3_key.key}")
-                else:
-                    logger.warning(
-                        f"Falha na remoção do arquivo S3 órfão: {file_upload.s3_key.key}"
-                    )
 
-    except Exception as e:
-        logger.error(f"Erro na limpeza de arquivo S3 órfão: {e}")
+@functools.lru_cache(maxsize=1)
+def _embedding_cache():
+    """EmbeddingCache compartilhado pelos jobs do processo"""
+    return EmbeddingCache(redis.from_url(settings.get_redis_url()))
+
+
+@functools.lru_cache(maxsize=1)
+def _email_service():
+    """SMTPEmailService compartilhado pelos jobs; mantém o pool de conexões SMTP"""
+    return SMTPEmailService(
+        smtp_host=settings.smtp_host,
+        smtp_port=settings.smtp_port,
+        smtp_username=settings.smtp_username,
+        smtp_password=settings.smtp_password,
+        smtp_use_tls=settings.smtp_use_tls,
+        from_email=settings.smtp_from_email,
+        base_url=getattr(settings, "base_url", "http://localhost:8000"),
+    )
+
+
+async def _close_services() -> None:
+    """Fecha os clientes compartilhados e o pool do banco"""
+    if _s3.cache_info().currsize:
+        await _s3().close()
+    _s3.cache_clear()
+    if _embedding_cache.cache_info().currsize:
+        await _embedding_cache().close()
+    _embedding_cache.cache_clear()
+    if _email_service.cache_info().currsize:
+        await _email_service().aclose()
+    _email_service.cache_clear()
+    _openai.cache_clear()
+    _chunker.cache_clear()
+    await db_connection.close()
+
+
+def shutdown_event_loop() -> None:
+    """Fecha clientes, pool do banco e o event loop no encerramento do worker"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+
+    try:
+        _loop.run_until_complete(_close_services())
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+    finally:
+        _loop.close()
+        _loop = None
 
 
 def process_document_job(file_upload_id: str, processing_job_id: str) -> Dict[str, Any]:
@@ -63,7 +152,7 @@ def process_document_job(file_upload_id: str, processing_job_id: str) -> Dict[st
     logger.info(f"Iniciando processamento de documento - Job: {job.id}")
 
     try:
-        result = asyncio.run(_process_document_async(file_upload_id, processing_job_id))
+        result = _run(_process_document_async(file_upload_id, processing_job_id))
 
         logger.info(f"Documento processado com sucesso - Job: {job.id}")
         return {
@@ -78,13 +167,11 @@ def process_document_job(file_upload_id: str, processing_job_id: str) -> Dict[st
     except Exception as e:
         logger.error(f"Erro no processamento do documento - Job: {job.id}, Erro: {e}")
 
-        asyncio.run(_update_job_with_error(processing_job_id, str(e)))
-
-        if job.retries_left == 0:
-            logger.info(
-                f"Última tentativa falhada - limpando arquivo S3 órfão: {file_upload_id}"
+        _run(
+            _handle_job_failure(
+                processing_job_id, file_upload_id, str(e), job.retries_left == 0
             )
-            asyncio.run(_cleanup_orphaned_s3_file(file_upload_id))
+        )
 
         raise
 
@@ -102,126 +189,91 @@ async def _process_document_async(
     Returns:
         dict: Resultado do processamento
     """
-    from domain.services.document_processor import DocumentProcessor
-    from domain.services.document_service import DocumentService
-    from infrastructure.config.settings import settings
-    from infrastructure.database.connection import get_async_session
-    from infrastructure.external.openai_client import OpenAIClient
-    from infrastructure.external.s3_service import S3Service
-    from infrastructure.processors.text_chunker import TextChunker
-    from infrastructure.repositories.postgres_document_processing_job_repository import (
-        PostgresDocumentProcessingJobRepository,
-    )
-    from infrastructure.repositories.postgres_document_repository import (
-        PostgresDocumentChunkRepository,
-        PostgresDocumentRepository,
-    )
-    from infrastructure.repositories.postgres_file_upload_repository import (
-        PostgresFileUploadRepository,
-    )
-    from infrastructure.repositories.postgres_vector_repository import (
-        PostgresVectorRepository,
-    )
-
-    start_time = datetime.now(timezone.utc)
+    start_time = time.monotonic()
+    upload_uuid = UUID(file_upload_id)
+    job_uuid = UUID(processing_job_id)
 
     # Load initial data with separate session to avoid transaction conflicts
     async with get_async_session() as session:
         file_upload_repo = PostgresFileUploadRepository(session)
         job_repo = PostgresDocumentProcessingJobRepository(session)
 
-        file_upload = await file_upload_repo.find_by_id(UUID(file_upload_id))
+        file_upload = await file_upload_repo.find_by_id(upload_uuid)
         if not file_upload:
             raise ValueError(f"FileUpload não encontrado: {file_upload_id}")
 
-        processing_job = await job_repo.find_by_id(UUID(processing_job_id))
+        processing_job = await job_repo.find_by_id(job_uuid)
         if not processing_job:
             raise ValueError(
                 f"DocumentProcessingJob não encontrado: {processing_job_id}"
             )
 
     # Process document with a fresh session for the main processing
-    try:
-        async with get_async_session() as session:
-            document_repo = PostgresDocumentRepository(session)
-            vector_repo = PostgresVectorRepository(session)
-            chunk_repo = PostgresDocumentChunkRepository(session)
-            job_repo = PostgresDocumentProcessingJobRepository(session)
-
-            s3_service = S3Service(
-                bucket=settings.s3_bucket,
-                region=settings.s3_region,
-                access_key=settings.aws_access_key,
-                secret_key=settings.aws_secret_key,
-                endpoint_url=settings.s3_endpoint_url,
-                public_endpoint_url=getattr(
-                    settings, "s3_public_endpoint_url", settings.s3_endpoint_url
-                ),
-            )
-            openai_client = OpenAIClient()
-            text_chunker = TextChunker(
-                chunk_size=getattr(settings, "chunk_size", 500),
-                chunk_overlap=getattr(settings, "chunk_overlap", 50),
-                use_contextual_retrieval=getattr(
-                    settings, "use_contextual_retrieval", True
-                ),
-            )
+    async with get_async_session() as session:
+        document_repo = PostgresDocumentRepository(session)
+        vector_repo = PostgresVectorRepository(session)
+        chunk_repo = PostgresDocumentChunkRepository(session)
+        job_repo = PostgresDocumentProcessingJobRepository(session)
 
-            document_service = DocumentService(
-                document_repository=document_repo, document_chunk_repository=chunk_repo
-            )
+        s3_service = _s3()
+        openai_client = _openai()
+        text_chunker = _chunker()
 
-            document_processor = DocumentProcessor(
-                document_service=document_service,
-                vector_repository=vector_repo,
-                text_chunker=text_chunker,
-                openai_client=openai_client,
-                s3_service=s3_service,
-                document_repository=document_repo,
-            )
+        document_service = DocumentService(
+            document_repository=document_repo, document_chunk_repository=chunk_repo
+        )
 
-            # Reload processing job in this session to avoid detached instance issues
-            processing_job = await job_repo.find_by_id(UUID(processing_job_id))
-            if not processing_job:
-                raise ValueError(
-                    f"DocumentProcessingJob não encontrado: {processing_job_id}"
-                )
+        document_processor = DocumentProcessor(
+            document_service=document_service,
+            vector_repository=vector_repo,
+            text_chunker=text_chunker,
+            openai_client=openai_client,
+            s3_service=s3_service,
+            document_repository=document_repo,
+            embedding_cache=_embedding_cache(),
+        )
 
-            document = await document_processor.process_uploaded_document(
-                file_upload, processing_job
+        # Reload processing job in this session to avoid detached instance issues
+        processing_job = await job_repo.find_by_id(job_uuid)
+        if not processing_job:
+            raise ValueError(
+                f"DocumentProcessingJob não encontrado: {processing_job_id}"
             )
 
-            end_time = datetime.now(timezone.utc)
-            processing_time = (end_time - start_time).total_seconds()
+        document = await document_processor.process_uploaded_document(
+            file_upload, processing_job
+        )
 
-            processing_job.processing_time_seconds = int(processing_time)
-            await job_repo.save(processing_job)
+        processing_time = time.monotonic() - start_time
 
-            return {
-                "document_id": str(document.id),
-                "processing_time": processing_time,
-                "chunks_created": processing_job.total_chunks,
-                "embeddings_generated": processing_job.chunks_processed,
-            }
-    except Exception as e:
-        # Update job status with error using a separate session
-        await _update_job_with_error(processing_job_id, str(e))
-        raise
+        processing_job.processing_time_seconds = int(processing_time)
+        await job_repo.save(processing_job)
+
+        return {
+            "document_id": str(document.id),
+            "processing_time": processing_time,
+            "chunks_created": processing_job.total_chunks,
+            "embeddings_generated": processing_job.chunks_processed,
+        }
 
 
-async def _update_job_with_error(processing_job_id: str, error_message: str) -> None:
+async def _handle_job_failure(
+    processing_job_id: str,
+    file_upload_id: str,
+    error_message: str,
+    last_attempt: bool,
+) -> None:
     """
-    Atualiza job de processamento com erro
+    Registra a falha do job e, na última tentativa, remove o arquivo S3 órfão
+
+    Usa uma única sessão para atualizar o job e buscar o upload
 
     Args:
         processing_job_id: ID do DocumentProcessingJob
+        file_upload_id: ID do FileUpload
         error_message: Mensagem de erro
+        last_attempt: Se não restam novas tentativas
     """
-    from infrastructure.database.connection import get_async_session
-    from infrastructure.repositories.postgres_document_processing_job_repository import (
-        PostgresDocumentProcessingJobRepository,
-    )
-
     async with get_async_session() as session:
         job_repo = PostgresDocumentProcessingJobRepository(session)
 
@@ -230,6 +282,29 @@ async def _update_job_with_error(processing_job_id: str, error_message: str) ->
             processing_job.fail_with_error(error_message)
             await job_repo.save(processing_job)
 
+        if not last_attempt:
+            return
+
+        logger.info(
+            f"Última tentativa falhada - limpando arquivo S3 órfão: {file_upload_id}"
+        )
+        try:
+            file_upload_repo = PostgresFileUploadRepository(session)
+            file_upload = await file_upload_repo.find_by_id(UUID(file_upload_id))
+
+            if file_upload and file_upload.s3_key:
+                success = await _s3().delete_file(file_upload.s3_key)
+
+                if success:
+                    logger.info(f"Arquivo S3 órfão removido: {file_upload.s3_key.key}")
+                else:
+                    logger.warning(
+                        f"Falha na remoção do arquivo S3 órfão: {file_upload.s3_key.key}"
+                    )
+
+        except Exception as e:
+            logger.error(f"Erro na limpeza de arquivo S3 órfão: {e}")
+
 
 def cleanup_task_job(task_type: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -247,11 +322,11 @@ def cleanup_task_job(task_type: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         if task_type == "s3_cleanup":
-            result = asyncio.run(_cleanup_s3_files(**kwargs))
+            result = _run(_cleanup_s3_files(**kwargs))
         elif task_type == "orphaned_files":
-            result = asyncio.run(_cleanup_orphaned_files(**kwargs))
+            result = _run(_cleanup_orphaned_files(**kwargs))
         elif task_type == "expired_uploads":
-            result = asyncio.run(_cleanup_expired_uploads(**kwargs))
+            result = _run(_cleanup_expired_uploads(**kwargs))
         else:
             raise ValueError(f"Tipo de tarefa desconhecido: {task_type}")
 
@@ -275,10 +350,7 @@ async def _cleanup_s3_files(older_than_hours: int = 24) -> Dict[str, Any]:
     Returns:
         dict: Resultado da limpeza
     """
-    from infrastructure.external.s3_service import S3Service
-
-    s3_service = S3Service()
-    deleted_count = await s3_service.cleanup_temp_files(
+    deleted_count = await _s3().cleanup_temp_files(
         prefix="temp/", older_than_hours=older_than_hours
     )
 
@@ -290,42 +362,112 @@ async def _cleanup_s3_files(older_than_hours: int = 24) -> Dict[str, Any]:
     }
 
 
-async def _cleanup_orphaned_files(**kwargs) -> Dict[str, Any]:
+async def _delete_uploads_s3_objects(uploads) -> set:
     """
-    Remove registros de uploads órfãos (sem job de processamento)
+    Remove do S3, em lote, os arquivos das linhas de upload informadas
 
     Returns:
-        dict: Resultado da limpeza
+        set: Pares (bucket, key) que o S3 não conseguiu remover
     """
-    from datetime import datetime, timedelta
+    keys = {
+        (upload.s3_bucket, upload.s3_key): S3Key(
+            bucket=upload.s3_bucket, key=upload.s3_key, region=upload.s3_region
+        )
+        for upload in uploads
+        if upload.s3_bucket and upload.s3_key
+    }
+    if not keys:
+        return set()
 
-    from sqlalchemy import and_, select
+    # delete_files registra e engole falhas; só as keys removidas voltam
+    deleted = await _s3().delete_files(list(keys.values()))
+    return keys.keys() - {(s3_key.bucket, s3_key.key) for s3_key in deleted}
 
-    from infrastructure.database.connection import get_async_session
-    from infrastructure.database.models import (
-        DocumentProcessingJobModel,
-        FileUploadModel,
-    )
 
-    async with get_async_session() as session:
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=1)
+async def _delete_uploads(session, where) -> int:
+    """
+    Remove os uploads filtrados e seus arquivos S3 em partições
 
-        stmt = select(FileUploadModel).where(
-            and_(
-                FileUploadModel.created_at < cutoff_time,
-                ~FileUploadModel.id.in_(select(DocumentProcessingJobModel.upload_id)),
+    Cada DELETE ... RETURNING devolve as keys S3 das linhas removidas, que são
+    apagadas em lote antes do commit da partição. Linhas cujo arquivo o S3 não
+    removeu voltam com rollback e ficam de fora das próximas partições, para
+    que uma key com falha permanente não trave a limpeza
+
+    Returns:
+        int: Número de uploads removidos
+    """
+    skipped_ids: set = set()
+    deleted_count = 0
+    while True:
+        partition = select(FileUploadModel.id).where(where)
+        if skipped_ids:
+            partition = partition.where(FileUploadModel.id.not_in(skipped_ids))
+        stmt = (
+            delete(FileUploadModel)
+            .where(
+                FileUploadModel.id.in_(
+                    partition.limit(_CLEANUP_PARTITION_SIZE).scalar_subquery()
+                )
             )
+            .returning(
+                FileUploadModel.id,
+                FileUploadModel.s3_bucket,
+                FileUploadModel.s3_key,
+                FileUploadModel.s3_region,
+            )
+            .execution_options(synchronize_session=False)
         )
-
         result = await session.execute(stmt)
-        orphaned_uploads = result.scalars().all()
+        rows = result.all()
+
+        try:
+            failed_keys = await _delete_uploads_s3_objects(rows)
+            removed_ids = [
+                row.id for row in rows if (row.s3_bucket, row.s3_key) not in failed_keys
+            ]
+            if failed_keys:
+                # O rollback devolve todas as linhas; as já limpas no S3 saem por id
+                await session.rollback()
+                skipped_ids.update(
+                    row.id for row in rows if (row.s3_bucket, row.s3_key) in failed_keys
+                )
+                logger.warning(
+                    f"{len(failed_keys)} arquivos S3 não foram removidos; "
+                    f"uploads mantidos para a próxima limpeza"
+                )
+                if removed_ids:
+                    await session.execute(
+                        delete(FileUploadModel)
+                        .where(FileUploadModel.id.in_(removed_ids))
+                        .execution_options(synchronize_session=False)
+                    )
+        except Exception:
+            await session.rollback()
+            raise
+        await session.commit()
 
-        deleted_count = 0
-        for upload in orphaned_uploads:
-            await session.delete(upload)
-            deleted_count += 1
+        deleted_count += len(removed_ids)
+        if len(rows) < _CLEANUP_PARTITION_SIZE:
+            return deleted_count
 
-        await session.commit()
+
+async def _cleanup_orphaned_files(**kwargs) -> Dict[str, Any]:
+    """
+    Remove registros de uploads órfãos (sem job de processamento)
+
+    Returns:
+        dict: Resultado da limpeza
+    """
+    async with get_async_session() as session:
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=1)
+
+        # NOT EXISTS vira anti-join no Postgres (usa idx_processing_job_upload_id)
+        orphaned = and_(
+            FileUploadModel.created_at < cutoff_time,
+            ~exists().where(DocumentProcessingJobModel.upload_id == FileUploadModel.id),
+        )
+
+        deleted_count = await _delete_uploads(session, orphaned)
 
         return {
             "task_type": "orphaned_files",
@@ -341,32 +483,15 @@ async def _cleanup_expired_uploads(**kwargs) -> Dict[str, Any]:
     Returns:
         dict: Resultado da limpeza
     """
-    from datetime import datetime
-
-    from sqlalchemy import and_, select
-
-    from infrastructure.database.connection import get_async_session
-    from infrastructure.database.models import FileUploadModel
-
     async with get_async_session() as session:
         now = datetime.utcnow()
 
-        stmt = select(FileUploadModel).where(
-            and_(
-                FileUploadModel.expires_at.is_not(None),
-                FileUploadModel.expires_at < now,
-            )
+        expired = and_(
+            FileUploadModel.expires_at.is_not(None),
+            FileUploadModel.expires_at < now,
         )
 
-        result = await session.execute(stmt)
-        expired_uploads = result.scalars().all()
-
-        deleted_count = 0
-        for upload in expired_uploads:
-            await session.delete(upload)
-            deleted_count += 1
-
-        await session.commit()
+        deleted_count = await _delete_uploads(session, expired)
 
         return {
             "task_type": "expired_uploads",
@@ -410,8 +535,10 @@ def send_email_job(
     )
 
     try:
-        result = asyncio.run(
-            _send_email_async(email_type, recipient_email, recipient_name, template_data)
+        result = _run(
+            _send_email_async(
+                email_type, recipient_email, recipient_name, template_data
+            )
         )
 
         logger.info(
@@ -465,18 +592,7 @@ async def _send_email_async(
         ValueError: Se tipo de email for desconhecido
         EmailDeliveryError: Se falhar o envio do email
     """
-    from infrastructure.config.settings import settings
-    from infrastructure.external.smtp_email_service import SMTPEmailService
-
-    email_service = SMTPEmailService(
-        smtp_host=settings.smtp_host,
-        smtp_port=settings.smtp_port,
-        smtp_username=settings.smtp_username,
-        smtp_password=settings.smtp_password,
-        smtp_use_tls=settings.smtp_use_tls,
-        from_email=settings.smtp_from_email,
-        base_url=getattr(settings, "base_url", "http://localhost:8000"),
-    )
+    email_service = _email_service()
 
     if email_type == "invitation":
         return await email_service.send_invitation_email(
@@ -1,8 +1,12 @@
+import functools
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from redis import Redis
+from redis import ConnectionPool, Redis
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import BusyLoadingError, ConnectionError, TimeoutError
+from redis.retry import Retry as RedisRetry
 from rq import Queue, Retry
 from rq.job import Job
 
@@ -11,19 +15,24 @@ from infrastructure.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _connection_pool() -> ConnectionPool:
+    """Pool Redis do processo, com retry e backoff em falhas transitórias"""
+    return ConnectionPool.from_url(
+        settings.get_redis_url(),
+        decode_responses=False,
+        max_connections=50,
+        socket_keepalive=True,
+        retry=RedisRetry(ExponentialBackoff(cap=10, base=1), 3),
+        retry_on_error=[BusyLoadingError, ConnectionError, TimeoutError],
+    )
+
+
 class RedisQueueService:
     """Serviço para gerenciar filas Redis usando RQ"""
 
     def __init__(self):
-        if settings.redis_url:
-            self.redis_conn = Redis.from_url(settings.redis_url, decode_responses=False)
-        else:
-            self.redis_conn = Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                decode_responses=False,
-            )
+        self.redis_conn = Redis(connection_pool=_connection_pool())
 
         self.document_queue = Queue(
             "document_processing", connection=self.redis_conn, default_timeout="30m"
@@ -75,6 +84,45 @@ class RedisQueueService:
             logger.error(f"Erro ao enfileirar job: {e}")
             raise
 
+    def enqueue_document_processing_many(
+        self, items: List[Tuple[UUID, UUID, str]]
+    ) -> List[str]:
+        """
+        Enfileira vários jobs de processamento em um único pipeline Redis
+
+        Args:
+            items: Tuplas (ID do upload, ID do job de processamento, prioridade)
+
+        Returns:
+            List[str]: IDs dos jobs Redis, na mesma ordem dos itens
+        """
+        try:
+            from infrastructure.queue.jobs import process_document_job
+
+            data = [
+                Queue.prepare_data(
+                    process_document_job,
+                    args=(str(file_upload_id), str(job_id)),
+                    timeout="30m",
+                    retry=Retry(max=3),
+                    meta={
+                        "priority": priority,
+                        "type": "document_processing",
+                        "file_upload_id": str(file_upload_id),
+                        "processing_job_id": str(job_id),
+                    },
+                )
+                for file_upload_id, job_id, priority in items
+            ]
+            jobs = self.document_queue.enqueue_many(data)
+
+            logger.info(f"{len(jobs)} jobs de processamento enfileirados")
+            return [job.id for job in jobs]
+
+        except Exception as e:
+            logger.error(f"Erro ao enfileirar jobs em lote: {e}")
+            raise
+
     def enqueue_cleanup_task(self, task_type: str, **kwargs) -> str:
         """
         Enfileira tarefa de limpeza (S3, arquivos órfãos, etc.)
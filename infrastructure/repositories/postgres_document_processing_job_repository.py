@@ -1,10 +1,11 @@
 import logging
-from datetime import timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from domain.entities.document_processing_job import DocumentProcessingJob
 from domain.repositories.document_processing_job_repository import (
@@ -12,10 +13,19 @@ from domain.repositories.document_processing_job_repository import (
 )
 from domain.value_objects.content_hash import ContentHash
 from domain.value_objects.processing_status import ProcessingStatus
-from infrastructure.database.models import DocumentProcessingJobModel
+from infrastructure.database.models import (
+    IN_FLIGHT_JOB_STATUSES,
+    DocumentProcessingJobModel,
+)
 
 logger = logging.getLogger(__name__)
 
+# Linhas buscadas por vez nas listagens: converte e libera os models aos poucos
+_YIELD_PER = 50
+
+# Colunas definidas na criação do job e preservadas no upsert
+_IMMUTABLE_COLUMNS = {"id", "document_id", "upload_id", "created_at"}
+
 
 class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
     """Implementação PostgreSQL do repositório de DocumentProcessingJob"""
@@ -26,57 +36,9 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
     async def save(self, job: DocumentProcessingJob) -> None:
         """Salva um DocumentProcessingJob"""
         try:
-            stmt = select(DocumentProcessingJobModel).where(
-                DocumentProcessingJobModel.id == job.id
-            )
-            result = await self.session.execute(stmt)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                existing.status = job.status.value
-                existing.current_step = job.current_step
-                existing.progress = job.progress
-                existing.chunks_processed = job.chunks_processed
-                existing.total_chunks = job.total_chunks
-                existing.processing_time_seconds = job.processing_time_seconds
-                existing.s3_file_deleted = job.s3_file_deleted
-                existing.duplicate_of = job.duplicate_of
-                existing.content_hash_algorithm = (
-                    job.content_hash.algorithm if job.content_hash else None
-                )
-                existing.content_hash_value = (
-                    job.content_hash.value if job.content_hash else None
-                )
-                existing.error_message = job.error_message
-                existing.meta_data = job.metadata
-                existing.started_at = job.started_at
-                existing.completed_at = job.completed_at
-            else:
-                model = DocumentProcessingJobModel(
-                    id=job.id,
-                    document_id=job.document_id,
-                    upload_id=job.upload_id,
-                    status=job.status.value,
-                    current_step=job.current_step,
-                    progress=job.progress,
-                    chunks_processed=job.chunks_processed,
-                    total_chunks=job.total_chunks,
-                    processing_time_seconds=job.processing_time_seconds,
-                    s3_file_deleted=job.s3_file_deleted,
-                    duplicate_of=job.duplicate_of,
-                    content_hash_algorithm=(
-                        job.content_hash.algorithm if job.content_hash else None
-                    ),
-                    content_hash_value=(
-                        job.content_hash.value if job.content_hash else None
-                    ),
-                    error_message=job.error_message,
-                    meta_data=job.metadata,
-                    created_at=job.created_at,
-                    started_at=job.started_at,
-                    completed_at=job.completed_at,
-                )
-                self.session.add(model)
+            row = self._entity_to_row(job)
+            await self.session.execute(self._upsert_statement([row]))
+            self._refresh_loaded([row])
 
             await self.session.commit()
             logger.info(
@@ -88,6 +50,24 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
             logger.error(f"Erro ao salvar DocumentProcessingJob {job.id}: {e}")
             raise
 
+    async def save_many(self, jobs: Sequence[DocumentProcessingJob]) -> None:
+        """Salva vários DocumentProcessingJobs com um único upsert e commit"""
+        if not jobs:
+            return
+
+        try:
+            rows = [self._entity_to_row(job) for job in jobs]
+            await self.session.execute(self._upsert_statement(rows))
+            self._refresh_loaded(rows)
+
+            await self.session.commit()
+            logger.info(f"{len(jobs)} DocumentProcessingJobs salvos")
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Erro ao salvar DocumentProcessingJobs em lote: {e}")
+            raise
+
     async def find_by_id(self, job_id: UUID) -> Optional[DocumentProcessingJob]:
         """Busca job por ID"""
         try:
@@ -159,11 +139,11 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
                 select(DocumentProcessingJobModel)
                 .where(DocumentProcessingJobModel.status == status.value)
                 .limit(limit)
+                .execution_options(yield_per=_YIELD_PER)
             )
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            models = await self.session.stream_scalars(stmt)
 
-            return [self._model_to_entity(model) for model in models]
+            return [self._model_to_entity(model) async for model in models]
 
         except Exception as e:
             logger.error(
@@ -176,21 +156,22 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
     ) -> List[DocumentProcessingJob]:
         """Busca jobs em processamento"""
         try:
-            processing_statuses = [
-                "extracting",
-                "checking_duplicates",
-                "chunking",
-                "embedding",
-            ]
+            # Valores literais no SQL para o planner casar o índice parcial
+            processing_statuses = bindparam(
+                "processing_statuses",
+                list(IN_FLIGHT_JOB_STATUSES),
+                expanding=True,
+                literal_execute=True,
+            )
             stmt = (
                 select(DocumentProcessingJobModel)
                 .where(DocumentProcessingJobModel.status.in_(processing_statuses))
                 .limit(limit)
+                .execution_options(yield_per=_YIELD_PER)
             )
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            models = await self.session.stream_scalars(stmt)
 
-            return [self._model_to_entity(model) for model in models]
+            return [self._model_to_entity(model) async for model in models]
 
         except Exception as e:
             logger.error(f"Erro ao buscar DocumentProcessingJobs em processamento: {e}")
@@ -216,6 +197,60 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
             logger.error(f"Erro ao remover DocumentProcessingJob {job_id}: {e}")
             return False
 
+    def _upsert_statement(self, rows: List[Dict[str, Any]]):
+        """INSERT ... ON CONFLICT (id) DO UPDATE em uma única ida ao banco, sem RETURNING"""
+        stmt = insert(DocumentProcessingJobModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DocumentProcessingJobModel.id],
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0]
+                if column not in _IMMUTABLE_COLUMNS
+            },
+        )
+        return stmt
+
+    def _refresh_loaded(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Aplica os valores gravados aos models já carregados na sessão
+
+        Sem expirar (lazy load fora de greenlet) nem marcar o model como sujo
+        """
+        for row in rows:
+            loaded = self.session.identity_map.get(
+                self.session.identity_key(DocumentProcessingJobModel, row["id"])
+            )
+            if loaded is None:
+                continue
+            for column, value in row.items():
+                if column not in _IMMUTABLE_COLUMNS:
+                    set_committed_value(loaded, column, value)
+
+    def _entity_to_row(self, job: DocumentProcessingJob) -> Dict[str, Any]:
+        """Converte entidade de domínio para valores da tabela"""
+        return {
+            "id": job.id,
+            "document_id": job.document_id,
+            "upload_id": job.upload_id,
+            "status": job.status.value,
+            "current_step": job.current_step,
+            "progress": job.progress,
+            "chunks_processed": job.chunks_processed,
+            "total_chunks": job.total_chunks,
+            "processing_time_seconds": job.processing_time_seconds,
+            "s3_file_deleted": job.s3_file_deleted,
+            "duplicate_of": job.duplicate_of,
+            "content_hash_algorithm": (
+                job.content_hash.algorithm if job.content_hash else None
+            ),
+            "content_hash_value": job.content_hash.value if job.content_hash else None,
+            "error_message": job.error_message,
+            "meta_data": job.metadata,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+        }
+
     def _model_to_entity(
         self, model: DocumentProcessingJobModel
     ) -> DocumentProcessingJob:
@@ -226,19 +261,6 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
                 algorithm=model.content_hash_algorithm, value=model.content_hash_value
             )
 
-        # Ensure datetime fields are timezone-aware
-        created_at = model.created_at
-        if created_at and created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-
-        started_at = model.started_at
-        if started_at and started_at.tzinfo is None:
-            started_at = started_at.replace(tzinfo=timezone.utc)
-
-        completed_at = model.completed_at
-        if completed_at and completed_at.tzinfo is None:
-            completed_at = completed_at.replace(tzinfo=timezone.utc)
-
         job = DocumentProcessingJob(
             id=model.id,
             document_id=model.document_id,
@@ -254,9 +276,10 @@ class PostgresDocumentProcessingJobRepository(DocumentProcessingJobRepository):
             content_hash=content_hash,
             error_message=model.error_message,
             metadata=model.meta_data or {},
-            created_at=created_at,
-            started_at=started_at,
-            completed_at=completed_at,
+            # Colunas TIMESTAMPTZ: o asyncpg já devolve datetimes com timezone
+            created_at=model.created_at,
+            started_at=model.started_at,
+            completed_at=model.completed_at,
         )
 
         return job
@@ -1,10 +1,23 @@
-import hashlib
 import logging
-from typing import Dict, List, Optional
-
-from sqlalchemy import delete, func, or_, select, update
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    delete,
+    exists,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from domain.entities.document import Document, DocumentChunk
 from domain.exceptions.document_exceptions import DocumentProcessingError
@@ -12,12 +25,51 @@ from domain.repositories.document_repository import (
     DocumentChunkRepository,
     DocumentRepository,
 )
+from domain.value_objects.content_hash import sha256_hexdigest
 from domain.value_objects.document_metadata import DocumentMetadata
 from domain.value_objects.embedding import Embedding
 from infrastructure.database.models import DocumentChunkModel, DocumentModel
 
 logger = logging.getLogger(__name__)
 
+# Mesma expressão dos índices idx_documento_metadata_source/_source_unique. A
+# chave vai literal no SQL: como parâmetro, o plano genérico do prepared
+# statement do asyncpg não casa com o índice de expressão e faz seq scan
+_SOURCE_EXPRESSION = func.json_extract_path_text(
+    DocumentModel.meta_data, literal_column("'source'")
+)
+
+# Colunas lidas por _model_to_entity. As listagens selecionam só elas e recebem
+# Rows simples, sem instanciar models nem passar pelo identity map da sessão
+_ENTITY_COLUMNS = (
+    DocumentModel.id,
+    DocumentModel.title,
+    DocumentModel.content,
+    DocumentModel.meta_data,
+    DocumentModel.created_at,
+    DocumentModel.updated_at,
+)
+
+# Listagens sem o texto: content volta vazio em vez de trazer o documento inteiro
+_SUMMARY_COLUMNS = (
+    DocumentModel.id,
+    DocumentModel.title,
+    literal_column("''").label("content"),
+    DocumentModel.meta_data,
+    DocumentModel.created_at,
+    DocumentModel.updated_at,
+)
+
+_CHUNK_ENTITY_COLUMNS = (
+    DocumentChunkModel.id,
+    DocumentChunkModel.document_id,
+    DocumentChunkModel.content,
+    DocumentChunkModel.chunk_index,
+    DocumentChunkModel.start_char,
+    DocumentChunkModel.end_char,
+    DocumentChunkModel.created_at,
+)
+
 
 class PostgresDocumentRepository(DocumentRepository):
     """Implementação PostgreSQL do repositório de Document"""
@@ -27,42 +79,45 @@ class PostgresDocumentRepository(DocumentRepository):
 
     async def save(self, document: Document) -> Document:
         """Salva um documento"""
+        self._ensure_content_loaded(document)
         try:
-            file_hash = (
-                self._calculate_file_hash(document.content)
-                if document.content
-                else None
+            values = {
+                "title": document.title,
+                "content": document.content,
+                "file_path": document.metadata.source,
+                "file_hash": document.content_hash,
+                "meta_data": self._metadata_to_dict(document.metadata),
+                "updated_at": document.updated_at,
+            }
+
+            # Upsert em uma única ida ao banco, sem RETURNING: o texto não
+            # precisa voltar pela rede só para atualizar a sessão
+            stmt = pg_insert(DocumentModel).values(
+                id=document.id, created_at=document.created_at, **values
             )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DocumentModel.id],
+                set_={
+                    DocumentModel.title: stmt.excluded.title,
+                    DocumentModel.content: stmt.excluded.content,
+                    DocumentModel.file_path: stmt.excluded.file_path,
+                    DocumentModel.file_hash: stmt.excluded.file_hash,
+                    DocumentModel.meta_data: stmt.excluded["metadata"],
+                    DocumentModel.updated_at: stmt.excluded.updated_at,
+                },
+            )
+            await self._session.execute(stmt)
 
-            existing_stmt = select(DocumentModel).where(DocumentModel.id == document.id)
-            existing_result = await self._session.execute(existing_stmt)
-            existing_model = existing_result.scalar_one_or_none()
-
-            if existing_model:
-                existing_model.title = document.title
-                existing_model.content = document.content
-                existing_model.file_path = document.metadata.source
-                existing_model.file_hash = file_hash
-                existing_model.meta_data = self._metadata_to_dict(document.metadata)
-                existing_model.updated_at = document.updated_at
-
-                await self._session.flush()
-                return document
-            else:
-                model = DocumentModel(
-                    id=document.id,
-                    title=document.title,
-                    content=document.content,
-                    file_path=document.metadata.source,
-                    file_hash=file_hash,
-                    meta_data=self._metadata_to_dict(document.metadata),
-                    created_at=document.created_at,
-                    updated_at=document.updated_at,
-                )
+            # Model já carregado na sessão recebe os valores gravados, sem
+            # expirar (lazy load fora de greenlet) nem ficar marcado como sujo
+            loaded = self._session.identity_map.get(
+                self._session.identity_key(DocumentModel, document.id)
+            )
+            if loaded is not None:
+                for attribute, value in values.items():
+                    set_committed_value(loaded, attribute, value)
 
-                self._session.add(model)
-                await self._session.flush()
-                return document
+            return document
 
         except IntegrityError as e:
             await self._session.rollback()
@@ -88,11 +143,20 @@ class PostgresDocumentRepository(DocumentRepository):
 
         return self._model_to_entity(model)
 
+    async def find_by_ids(self, document_ids: List[UUID]) -> List[Document]:
+        """Busca vários documentos por ID, na ordem pedida"""
+        if not document_ids:
+            return []
+
+        stmt = select(*_ENTITY_COLUMNS).where(DocumentModel.id.in_(document_ids))
+        result = await self._session.execute(stmt)
+        by_id = {row.id: self._model_to_entity(row) for row in result.all()}
+
+        return [by_id[doc_id] for doc_id in document_ids if doc_id in by_id]
+
     async def find_by_source(self, source: str) -> Optional[Document]:
         """Busca documento por source"""
-        stmt = select(DocumentModel).where(
-            func.json_extract_path_text(DocumentModel.meta_data, "source") == source
-        )
+        stmt = select(DocumentModel).where(_SOURCE_EXPRESSION == source)
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
 
@@ -102,42 +166,57 @@ class PostgresDocumentRepository(DocumentRepository):
         return self._model_to_entity(model)
 
     async def find_all(
-        self, limit: Optional[int] = None, offset: int = 0
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        with_content: bool = True,
     ) -> List[Document]:
-        """Lista todos os documentos"""
-        stmt = select(DocumentModel).order_by(DocumentModel.created_at.desc())
+        """
+        Lista todos os documentos, do mais recente para o mais antigo
+
+        cursor é o (created_at, id) do último documento da página anterior:
+        a próxima página começa logo depois dele pelo índice, sem o custo do
+        OFFSET de varrer e descartar as linhas já vistas. Com with_content=False
+        os documentos vêm sem o texto (content_loaded=False)
+        """
+        stmt = select(*self._list_columns(with_content)).order_by(
+            DocumentModel.created_at.desc(), DocumentModel.id.desc()
+        )
 
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(DocumentModel.created_at, DocumentModel.id) < tuple_(*cursor)
+            )
         if limit:
             stmt = stmt.limit(limit)
         if offset > 0:
             stmt = stmt.offset(offset)
 
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._model_to_entity(model) for model in models]
+        return self._rows_to_entities(result.all(), with_content)
 
     async def find_by_title_similarity(
-        self, title: str, threshold: float = 0.8
+        self, title: str, threshold: float = 0.8, with_content: bool = True
     ) -> List[Document]:
         """Busca documentos por similaridade de título"""
         stmt = (
-            select(DocumentModel)
+            select(*self._list_columns(with_content))
             .where(func.similarity(DocumentModel.title, title) > threshold)
             .order_by(func.similarity(DocumentModel.title, title).desc())
         )
 
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._model_to_entity(model) for model in models]
+        return self._rows_to_entities(result.all(), with_content)
 
     async def find_by_content_search(
-        self, search_term: str, limit: int = 10
+        self, search_term: str, limit: int = 10, with_content: bool = True
     ) -> List[Document]:
         """Busca documentos por termo no conteúdo"""
         stmt = (
-            select(DocumentModel)
+            select(*self._list_columns(with_content))
             .where(
                 or_(
                     DocumentModel.title.ilike(f"%{search_term}%"),
@@ -149,18 +228,14 @@ class PostgresDocumentRepository(DocumentRepository):
         )
 
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._model_to_entity(model) for model in models]
+        return self._rows_to_entities(result.all(), with_content)
 
     async def update(self, document: Document) -> Document:
         """Atualiza um documento"""
+        self._ensure_content_loaded(document)
         try:
-            file_hash = (
-                self._calculate_file_hash(document.content)
-                if document.content
-                else None
-            )
+            file_hash = document.content_hash
 
             stmt = (
                 update(DocumentModel)
@@ -203,22 +278,23 @@ class PostgresDocumentRepository(DocumentRepository):
 
     async def exists(self, source: str) -> bool:
         """Verifica se existe documento com o source"""
-        stmt = select(func.count(DocumentModel.id)).where(
-            func.json_extract_path_text(DocumentModel.meta_data, "source") == source
-        )
+        stmt = select(exists().where(_SOURCE_EXPRESSION == source))
         result = await self._session.execute(stmt)
-        count = result.scalar()
-        return count > 0
-
-    async def exists_by_content_hash(self, content: str) -> bool:
-        """Verifica se existe documento com conteúdo idêntico"""
-        file_hash = self._calculate_file_hash(content)
-        stmt = select(func.count(DocumentModel.id)).where(
-            DocumentModel.file_hash == file_hash
-        )
+        return bool(result.scalar())
+
+    async def exists_by_content_hash(
+        self, content: str, content_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Verifica se existe documento com conteúdo idêntico
+
+        Quem já tem o Document pode passar document.content_hash e evitar
+        recalcular o hash do conteúdo
+        """
+        file_hash = content_hash or self._calculate_file_hash(content)
+        stmt = select(exists().where(DocumentModel.file_hash == file_hash))
         result = await self._session.execute(stmt)
-        count = result.scalar()
-        return count > 0
+        return bool(result.scalar())
 
     async def count(self) -> int:
         """Conta total de documentos"""
@@ -239,7 +315,7 @@ class PostgresDocumentRepository(DocumentRepository):
 
     def _calculate_file_hash(self, content: str) -> str:
         """Calcula hash SHA256 do conteúdo"""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return sha256_hexdigest(content)
 
     def _metadata_to_dict(self, metadata: DocumentMetadata) -> Dict:
         """Converte DocumentMetadata para dict"""
@@ -248,14 +324,9 @@ class PostgresDocumentRepository(DocumentRepository):
             "document_type": metadata.file_type,
             "language": metadata.language,
             "author": metadata.author,
-            "created_date": (
-                metadata.creation_date.isoformat() if metadata.creation_date else None
-            ),
-            "modified_date": (
-                metadata.modification_date.isoformat()
-                if metadata.modification_date
-                else None
-            ),
+            # O serializer JSON do engine grava datetimes em ISO 8601
+            "created_date": metadata.creation_date,
+            "modified_date": metadata.modification_date,
             "file_size": metadata.file_size,
             "page_count": metadata.page_count,
             "word_count": metadata.word_count,
@@ -266,8 +337,6 @@ class PostgresDocumentRepository(DocumentRepository):
 
     def _dict_to_metadata(self, data: Dict) -> DocumentMetadata:
         """Converte dict para DocumentMetadata"""
-        from datetime import datetime
-
         return DocumentMetadata(
             source=data.get("source", ""),
             file_type=data.get("document_type", "unknown"),
@@ -276,23 +345,46 @@ class PostgresDocumentRepository(DocumentRepository):
             author=data.get("author"),
             title=data.get("title"),
             subject=data.get("subject"),
-            creation_date=(
-                datetime.fromisoformat(data["created_date"])
-                if data.get("created_date")
-                else None
-            ),
-            modification_date=(
-                datetime.fromisoformat(data["modified_date"])
-                if data.get("modified_date")
-                else None
-            ),
+            creation_date=self._parse_datetime(data.get("created_date")),
+            modification_date=self._parse_datetime(data.get("modified_date")),
             page_count=data.get("page_count"),
             word_count=data.get("word_count"),
             custom_fields=data.get("custom_fields", {}),
         )
 
+    @staticmethod
+    def _parse_datetime(value) -> Optional[datetime]:
+        """Lê datas do metadata: ISO 8601 vindo do banco ou datetime já pronto"""
+        if not value:
+            return None
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value)
+
+    @staticmethod
+    def _list_columns(with_content: bool) -> tuple:
+        """Colunas das listagens, com ou sem o texto do documento"""
+        return _ENTITY_COLUMNS if with_content else _SUMMARY_COLUMNS
+
+    def _rows_to_entities(self, rows, with_content: bool) -> List[Document]:
+        """Converte as linhas de uma listagem, marcando se o texto veio junto"""
+        documents = [self._model_to_entity(row) for row in rows]
+        if not with_content:
+            for document in documents:
+                document.content_loaded = False
+        return documents
+
+    @staticmethod
+    def _ensure_content_loaded(document: Document) -> None:
+        """Impede que um documento listado sem texto apague o conteúdo salvo"""
+        if not document.content_loaded:
+            raise DocumentProcessingError(
+                f"Documento {document.id} foi carregado sem conteúdo e não pode "
+                "ser salvo"
+            )
+
     def _model_to_entity(self, model: DocumentModel) -> Document:
-        """Converte model para entidade"""
+        """Converte model (ou Row com _ENTITY_COLUMNS) para entidade"""
         metadata = self._dict_to_metadata(model.meta_data or {})
 
         return Document(
@@ -340,6 +432,37 @@ class PostgresDocumentChunkRepository(DocumentChunkRepository):
                 )
             raise DocumentProcessingError(f"Erro ao salvar chunk: {e}")
 
+    async def save_chunks(self, chunks: List[DocumentChunk]) -> List[DocumentChunk]:
+        """Salva vários chunks com um único INSERT em lote"""
+        if not chunks:
+            return chunks
+
+        rows = [
+            {
+                "id": chunk.id,
+                "document_id": chunk.document_id,
+                "content": chunk.content,
+                "chunk_index": chunk.chunk_index,
+                "start_char": chunk.start_char,
+                "end_char": chunk.end_char,
+                "meta_data": {},
+                "created_at": chunk.created_at,
+            }
+            for chunk in chunks
+        ]
+
+        try:
+            await self._session.execute(insert(DocumentChunkModel), rows)
+            return chunks
+
+        except IntegrityError as e:
+            await self._session.rollback()
+            if "unique constraint" in str(e).lower():
+                raise DocumentProcessingError(
+                    f"Chunks já existem para documento {chunks[0].document_id}"
+                )
+            raise DocumentProcessingError(f"Erro ao salvar chunks: {e}")
+
     async def find_chunk_by_id(self, chunk_id) -> Optional[DocumentChunk]:
         """Busca chunk por ID"""
         stmt = select(DocumentChunkModel).where(DocumentChunkModel.id == chunk_id)
@@ -354,15 +477,36 @@ class PostgresDocumentChunkRepository(DocumentChunkRepository):
     async def find_chunks_by_document_id(self, document_id) -> List[DocumentChunk]:
         """Busca chunks de um documento"""
         stmt = (
-            select(DocumentChunkModel)
+            select(*_CHUNK_ENTITY_COLUMNS)
             .where(DocumentChunkModel.document_id == document_id)
             .order_by(DocumentChunkModel.chunk_index)
         )
 
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._model_to_entity(model) for model in models]
+        return [self._model_to_entity(row) for row in result.all()]
+
+    async def find_chunks_by_document_ids(
+        self, document_ids: List[UUID]
+    ) -> Dict[UUID, List[DocumentChunk]]:
+        """Busca chunks de vários documentos, agrupados por documento"""
+        chunks_by_document: Dict[UUID, List[DocumentChunk]] = {
+            document_id: [] for document_id in document_ids
+        }
+        if not document_ids:
+            return chunks_by_document
+
+        stmt = (
+            select(*_CHUNK_ENTITY_COLUMNS)
+            .where(DocumentChunkModel.document_id.in_(document_ids))
+            .order_by(DocumentChunkModel.document_id, DocumentChunkModel.chunk_index)
+        )
+        result = await self._session.execute(stmt)
+
+        for row in result.all():
+            chunks_by_document[row.document_id].append(self._model_to_entity(row))
+
+        return chunks_by_document
 
     async def delete_chunks_by_document_id(self, document_id) -> int:
         """Remove chunks de um documento"""
@@ -377,7 +521,7 @@ class PostgresDocumentChunkRepository(DocumentChunkRepository):
         return True
 
     def _model_to_entity(self, model: DocumentChunkModel) -> DocumentChunk:
-        """Converte model para entidade"""
+        """Converte model (ou Row com _CHUNK_ENTITY_COLUMNS) para entidade"""
         return DocumentChunk(
             id=model.id,
             document_id=model.document_id,
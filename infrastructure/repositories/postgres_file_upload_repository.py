@@ -22,9 +22,8 @@ class PostgresFileUploadRepository(FileUploadRepository):
     async def save(self, file_upload: FileUpload) -> None:
         """Salva um FileUpload"""
         try:
-            stmt = select(FileUploadModel).where(FileUploadModel.id == file_upload.id)
-            result = await self.session.execute(stmt)
-            existing = result.scalar_one_or_none()
+            # get() usa o identity map: sem SELECT se o upload já foi carregado
+            existing = await self.session.get(FileUploadModel, file_upload.id)
 
             if existing:
                 existing.filename = file_upload.filename
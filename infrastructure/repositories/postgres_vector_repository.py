@@ -1,9 +1,13 @@
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 import numpy as np
 from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +23,41 @@ from infrastructure.database.models import (
 
 logger = logging.getLogger(__name__)
 
+# O vetor vai ao pgvector como texto e é gravado em float32: mais casas só
+# aumentam o payload (vetores vindos do cache float32 teriam ~17 dígitos).
+# Erro absoluto <= 5e-9, desprezível na similaridade de cosseno
+_VECTOR_DECIMALS = 8
+
+_SEARCH_CACHE_SIZE = 1024
+_SEARCH_CACHE_TTL_SECONDS = 60.0
+
+# Compartilhado entre instâncias: o repositório é criado por request/sessão
+_search_cache: "OrderedDict[tuple, Tuple[float, List[SearchResult]]]" = OrderedDict()
+
+
+def _search_cache_key(
+    query_embedding: Embedding,
+    n_results: int,
+    similarity_threshold: float,
+    metadata_filter: Optional[Dict],
+) -> tuple:
+    """Chave da busca: hash do embedding quantizado em float16 + parâmetros"""
+    vector_hash = hashlib.blake2b(
+        np.asarray(query_embedding.vector, dtype=np.float16).tobytes(),
+        digest_size=16,
+    ).digest()
+    return (
+        vector_hash,
+        n_results,
+        similarity_threshold,
+        frozenset((metadata_filter or {}).items()),
+    )
+
+
+def clear_search_cache() -> None:
+    """Descarta resultados de busca em cache (após escrita de embeddings)"""
+    _search_cache.clear()
+
 
 class PostgresVectorRepository(VectorRepository):
     """Implementação PostgreSQL com pgvector do repositório de vetores"""
@@ -46,6 +85,7 @@ class PostgresVectorRepository(VectorRepository):
 
             self._session.add(model)
             await self._session.flush()
+            clear_search_cache()
 
             logger.debug(f"Embedding adicionado para chunk {chunk_id}")
             return True
@@ -60,6 +100,34 @@ class PostgresVectorRepository(VectorRepository):
             )
             raise DocumentProcessingError(f"Erro ao processar embedding: {e}")
 
+    async def add_chunk_embeddings(
+        self, embeddings: List[Tuple[UUID, Embedding]]
+    ) -> int:
+        """Adiciona embeddings de vários chunks com um único INSERT ... ON CONFLICT"""
+        if not embeddings:
+            return 0
+
+        rows = [
+            {"chunk_id": chunk_id, "embedding": self._embedding_to_vector(embedding)}
+            for chunk_id, embedding in embeddings
+        ]
+        stmt = insert(DocumentEmbeddingModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DocumentEmbeddingModel.chunk_id],
+            set_={"embedding": stmt.excluded.embedding},
+        )
+
+        try:
+            await self._session.execute(stmt)
+            clear_search_cache()
+            logger.debug(f"{len(rows)} embeddings adicionados")
+            return len(rows)
+
+        except IntegrityError as e:
+            await self._session.rollback()
+            logger.error(f"Erro ao adicionar embeddings em lote: {e}")
+            raise DocumentProcessingError(f"Erro ao adicionar embeddings: {e}")
+
     async def search_similar_chunks(
         self,
         query_embedding: Embedding,
@@ -68,92 +136,164 @@ class PostgresVectorRepository(VectorRepository):
         metadata_filter: Dict = None,
     ) -> List[SearchResult]:
         """Busca chunks similares usando pgvector"""
+        cache_key = _search_cache_key(
+            query_embedding, n_results, similarity_threshold, metadata_filter
+        )
+        cached = _search_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+            _search_cache.move_to_end(cache_key)
+            return list(cached[1])
+
         try:
-            query_vector = self._embedding_to_vector(query_embedding)
-
-            stmt = select(
-                DocumentEmbeddingModel.embedding,
-                DocumentChunkModel.id,
-                DocumentChunkModel.content,
-                DocumentChunkModel.document_id,
-                DocumentChunkModel.chunk_index,
-                DocumentChunkModel.start_char,
-                DocumentChunkModel.end_char,
-                DocumentChunkModel.created_at,
-                DocumentModel.title,
-                DocumentModel.meta_data,
-                (
-                    1 - DocumentEmbeddingModel.embedding.cosine_distance(query_vector)
-                ).label("similarity_score"),
-            ).select_from(
-                DocumentEmbeddingModel.__table__.join(
-                    DocumentChunkModel.__table__,
-                    DocumentEmbeddingModel.chunk_id == DocumentChunkModel.id,
-                ).join(
-                    DocumentModel.__table__,
-                    DocumentChunkModel.document_id == DocumentModel.id,
+            if metadata_filter and set(metadata_filter) == {"document_id"}:
+                search_results = await self._search_within_document(
+                    query_embedding,
+                    UUID(str(metadata_filter["document_id"])),
+                    n_results,
+                    similarity_threshold,
                 )
-            )
-
-            if similarity_threshold > 0:
-                stmt = stmt.where(
-                    (1 - DocumentEmbeddingModel.embedding.cosine_distance(query_vector))
-                    >= similarity_threshold
+            else:
+                search_results = await self._search_nearest(
+                    query_embedding, n_results, similarity_threshold, metadata_filter
                 )
 
-            if metadata_filter:
-                for key, value in metadata_filter.items():
-                    stmt = stmt.where(
-                        func.json_extract_path_text(DocumentModel.meta_data, key)
-                        == value
-                    )
+            logger.debug(f"Encontrados {len(search_results)} chunks similares")
 
-            stmt = stmt.order_by(
-                (
-                    1 - DocumentEmbeddingModel.embedding.cosine_distance(query_vector)
-                ).desc()
-            ).limit(n_results)
+        except Exception as e:
+            logger.error(f"Erro na busca de similaridade: {e}")
+            raise DocumentProcessingError(f"Erro na busca vetorial: {e}")
 
-            result = await self._session.execute(stmt)
-            rows = result.fetchall()
-
-            search_results = []
-            for row in rows:
-                chunk = DocumentChunk(
-                    id=row.id,
-                    document_id=row.document_id,
-                    content=row.content,
-                    original_content=row.content,
-                    chunk_index=row.chunk_index,
-                    start_char=row.start_char,
-                    end_char=row.end_char,
-                    embedding=self._vector_to_embedding(row.embedding),
-                    created_at=row.created_at,
-                )
+        _search_cache[cache_key] = (time.monotonic(), search_results)
+        _search_cache.move_to_end(cache_key)
+        if len(_search_cache) > _SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
 
-                similarity_score = float(row.similarity_score)
-                distance = 1.0 - similarity_score
+        return list(search_results)
 
-                doc_metadata = {
-                    "document_title": row.title,
-                    "document_metadata": row.meta_data or {},
-                }
+    async def _search_nearest(
+        self,
+        query_embedding: Embedding,
+        n_results: int,
+        similarity_threshold: float,
+        metadata_filter: Optional[Dict],
+    ) -> List[SearchResult]:
+        """Busca aproximada (ivfflat) em todos os embeddings"""
+        query_vector = self._embedding_to_vector(query_embedding)
+        # Ordena pela distância crua (<=>) para o planner usar o índice ivfflat
+        distance = DocumentEmbeddingModel.embedding.cosine_distance(query_vector)
 
-                search_result = SearchResult(
-                    chunk=chunk,
-                    similarity_score=similarity_score,
-                    distance=distance,
-                    metadata=doc_metadata,
+        stmt = self._search_select(distance.label("distance"))
+
+        if similarity_threshold > 0:
+            stmt = stmt.where(distance <= 1 - similarity_threshold)
+
+        if metadata_filter:
+            for key, value in metadata_filter.items():
+                stmt = stmt.where(
+                    func.json_extract_path_text(DocumentModel.meta_data, key) == value
                 )
 
-                search_results.append(search_result)
+        stmt = stmt.order_by(distance).limit(n_results)
 
-            logger.debug(f"Encontrados {len(search_results)} chunks similares")
-            return search_results
+        result = await self._session.execute(stmt)
+        return [
+            self._row_to_search_result(row, float(row.distance))
+            for row in result.fetchall()
+        ]
 
-        except Exception as e:
-            logger.error(f"Erro na busca de similaridade: {e}")
-            raise DocumentProcessingError(f"Erro na busca vetorial: {e}")
+    async def _search_within_document(
+        self,
+        query_embedding: Embedding,
+        document_id: UUID,
+        n_results: int,
+        similarity_threshold: float,
+    ) -> List[SearchResult]:
+        """
+        Busca exata nos chunks de um único documento
+
+        Filtro seletivo: o ivfflat descartaria quase todos os candidatos depois
+        do ANN (e poderia devolver menos que n_results), então os poucos
+        embeddings do documento são lidos pelo idx_chunk_document e ranqueados
+        por cosseno com NumPy
+        """
+        stmt = self._search_select().where(
+            DocumentChunkModel.document_id == document_id
+        )
+        result = await self._session.execute(stmt)
+        rows = result.fetchall()
+        if not rows:
+            return []
+
+        matrix = np.asarray([row.embedding for row in rows], dtype=np.float32)
+        query = np.asarray(query_embedding.vector, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        similarities = (matrix @ query) / np.where(norms == 0, 1.0, norms)
+
+        if similarity_threshold > 0:
+            candidates = np.nonzero(similarities >= similarity_threshold)[0]
+        else:
+            candidates = np.arange(len(rows))
+
+        if len(candidates) > n_results:
+            candidates = candidates[
+                np.argpartition(-similarities[candidates], n_results - 1)[:n_results]
+            ]
+        candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
+
+        return [
+            self._row_to_search_result(rows[i], 1.0 - float(similarities[i]))
+            for i in candidates
+        ]
+
+    def _search_select(self, *extra_columns):
+        """SELECT de embedding + chunk + documento usado pelas buscas"""
+        return select(
+            DocumentEmbeddingModel.embedding,
+            DocumentChunkModel.id,
+            DocumentChunkModel.content,
+            DocumentChunkModel.document_id,
+            DocumentChunkModel.chunk_index,
+            DocumentChunkModel.start_char,
+            DocumentChunkModel.end_char,
+            DocumentChunkModel.created_at,
+            DocumentModel.title,
+            DocumentModel.meta_data,
+            *extra_columns,
+        ).select_from(
+            DocumentEmbeddingModel.__table__.join(
+                DocumentChunkModel.__table__,
+                DocumentEmbeddingModel.chunk_id == DocumentChunkModel.id,
+            ).join(
+                DocumentModel.__table__,
+                DocumentChunkModel.document_id == DocumentModel.id,
+            )
+        )
+
+    def _row_to_search_result(self, row, distance: float) -> SearchResult:
+        """Converte linha da busca para SearchResult"""
+        chunk = DocumentChunk(
+            id=row.id,
+            document_id=row.document_id,
+            content=row.content,
+            original_content=row.content,
+            chunk_index=row.chunk_index,
+            start_char=row.start_char,
+            end_char=row.end_char,
+            embedding=self._vector_to_embedding(row.embedding),
+            created_at=row.created_at,
+        )
+
+        doc_metadata = {
+            "document_title": row.title,
+            "document_metadata": row.meta_data or {},
+        }
+
+        return SearchResult(
+            chunk=chunk,
+            similarity_score=1.0 - distance,
+            distance=distance,
+            metadata=doc_metadata,
+        )
 
     async def delete_chunk_embedding(self, chunk_id: UUID) -> bool:
         """Remove embedding de um chunk"""
@@ -162,19 +302,15 @@ class PostgresVectorRepository(VectorRepository):
     async def delete_document_embeddings(self, document_id: UUID) -> int:
         """Remove todos os embeddings de um documento"""
         try:
-            chunk_stmt = select(DocumentChunkModel.id).where(
+            # Um único DELETE com subquery, sem trazer os ids dos chunks
+            chunk_ids = select(DocumentChunkModel.id).where(
                 DocumentChunkModel.document_id == document_id
             )
-            chunk_result = await self._session.execute(chunk_stmt)
-            chunk_ids = [row.id for row in chunk_result.fetchall()]
-
-            if not chunk_ids:
-                return 0
-
             delete_stmt = delete(DocumentEmbeddingModel).where(
-                DocumentEmbeddingModel.chunk_id.in_(chunk_ids)
+                DocumentEmbeddingModel.chunk_id.in_(chunk_ids.scalar_subquery())
             )
             result = await self._session.execute(delete_stmt)
+            clear_search_cache()
 
             deleted_count = result.rowcount
             logger.debug(
@@ -243,6 +379,7 @@ class PostgresVectorRepository(VectorRepository):
                 DocumentEmbeddingModel.chunk_id == chunk_id
             )
             result = await self._session.execute(stmt)
+            clear_search_cache()
             return result.rowcount > 0
         except Exception as e:
             logger.error(f"Erro ao remover embedding do chunk {chunk_id}: {e}")
@@ -263,15 +400,15 @@ class PostgresVectorRepository(VectorRepository):
 
     def _embedding_to_vector(self, embedding: Embedding) -> List[float]:
         """Converte Embedding para formato pgvector"""
-        if isinstance(embedding.vector, np.ndarray):
-            return embedding.vector.tolist()
-        elif isinstance(embedding.vector, list):
-            return embedding.vector
-        else:
+        if not isinstance(embedding.vector, (np.ndarray, list)):
             raise DocumentProcessingError(
                 f"Formato de embedding não suportado: {type(embedding.vector)}"
             )
 
+        return np.round(
+            np.asarray(embedding.vector, dtype=np.float64), _VECTOR_DECIMALS
+        ).tolist()
+
     def _vector_to_embedding(self, vector_data) -> Embedding:
         """Converte dados pgvector para Embedding"""
         try:
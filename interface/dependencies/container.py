@@ -277,6 +277,7 @@ class Container:
         """Email rate limiter using Redis"""
         if "email_rate_limiter" not in self._instances:
             from infrastructure.queue.redis_queue import redis_queue_service
+
             self._instances["email_rate_limiter"] = EmailRateLimiter(
                 redis_client=redis_queue_service.redis_conn
             )
@@ -312,6 +313,12 @@ class Container:
         if "redis_client" in self._instances:
             await self._instances["redis_client"].close()
 
+        if "s3_service" in self._instances:
+            await self._instances["s3_service"].close()
+
+        if "email_service" in self._instances:
+            await self._instances["email_service"].aclose()
+
         await db_connection.close()
 
 
@@ -262,6 +262,7 @@ class MockServiceFactory:
         """Create a mock vector repository with common methods"""
         mock = Mock()
         mock.add_chunk_embedding = AsyncMock()
+        mock.add_chunk_embeddings = AsyncMock()
         mock.search_similar_chunks = AsyncMock()
         mock.delete_chunk_embedding = AsyncMock()
         mock.delete_document_embeddings = AsyncMock()
@@ -16,7 +16,7 @@ class TestCreatePresignedUploadUseCase:
     def mock_s3_service(self):
         mock = Mock()
         mock.bucket = "test-bucket"
-        mock.generate_presigned_upload_url = Mock()
+        mock.generate_presigned_upload_url_async = AsyncMock()
         return mock
 
     @pytest.fixture
@@ -48,7 +48,7 @@ class TestCreatePresignedUploadUseCase:
         upload_url = "https://test-bucket.s3.amazonaws.com/presigned-url"
         expires_at = datetime.now(timezone.utc)
         upload_fields = {"key": "value"}
-        mock_s3_service.generate_presigned_upload_url.return_value = (
+        mock_s3_service.generate_presigned_upload_url_async.return_value = (
             upload_url,
             expires_at,
             upload_fields,
@@ -62,7 +62,7 @@ class TestCreatePresignedUploadUseCase:
         assert result.expires_in == 3600
         assert result.document_id is not None
         assert result.upload_id is not None
-        mock_s3_service.generate_presigned_upload_url.assert_called_once()
+        mock_s3_service.generate_presigned_upload_url_async.assert_called_once()
         mock_file_upload_repository.save.assert_called_once()
 
     @pytest.mark.asyncio
@@ -75,7 +75,7 @@ class TestCreatePresignedUploadUseCase:
         upload_url = "https://test-bucket.s3.amazonaws.com/presigned-url"
         expires_at = datetime.now(timezone.utc)
         upload_fields = {}
-        mock_s3_service.generate_presigned_upload_url.return_value = (
+        mock_s3_service.generate_presigned_upload_url_async.return_value = (
             upload_url,
             expires_at,
             upload_fields,
@@ -90,7 +90,7 @@ class TestCreatePresignedUploadUseCase:
     async def test_execute_s3_service_error(
         self, use_case, valid_request, mock_s3_service, mock_file_upload_repository
     ):
-        mock_s3_service.generate_presigned_upload_url.side_effect = Exception(
+        mock_s3_service.generate_presigned_upload_url_async.side_effect = Exception(
             "S3 error"
         )
         mock_file_upload_repository.save = AsyncMock()
@@ -106,7 +106,7 @@ class TestCreatePresignedUploadUseCase:
         upload_url = "https://test-bucket.s3.amazonaws.com/presigned-url"
         expires_at = datetime.now(timezone.utc)
         upload_fields = {}
-        mock_s3_service.generate_presigned_upload_url.return_value = (
+        mock_s3_service.generate_presigned_upload_url_async.return_value = (
             upload_url,
             expires_at,
             upload_fields,
@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 from uuid import uuid4
 
@@ -101,3 +102,35 @@ class TestDocument:
         assert doc.id is not None
         assert doc.created_at is not None
         assert doc.updated_at is not None
+
+    def test_content_hash_is_cached_until_content_changes(
+        self, sample_document_metadata
+    ):
+        doc = Document(
+            id=uuid4(),
+            title="Test",
+            content="Conteúdo",
+            file_path="/test.pdf",
+            metadata=sample_document_metadata,
+            chunks=[],
+        )
+        expected = hashlib.sha256("Conteúdo".encode("utf-8")).hexdigest()
+        assert doc.content_hash == expected
+        assert doc.__dict__["_content_hash"] == ("Conteúdo", expected)
+
+        doc.content = "Outro conteúdo"
+        assert (
+            doc.content_hash
+            == hashlib.sha256("Outro conteúdo".encode("utf-8")).hexdigest()
+        )
+
+    def test_content_hash_empty_content(self, sample_document_metadata):
+        doc = Document(
+            id=uuid4(),
+            title="Test",
+            content="",
+            file_path="/test.pdf",
+            metadata=sample_document_metadata,
+            chunks=[],
+        )
+        assert doc.content_hash is None
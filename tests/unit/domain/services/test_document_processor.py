@@ -9,6 +9,7 @@ from domain.entities.file_upload import FileUpload
 from domain.exceptions.business_exceptions import BusinessRuleViolationError
 from domain.services.document_processor import DocumentProcessor
 from domain.value_objects.document_metadata import DocumentMetadata
+from domain.value_objects.embedding import Embedding
 from domain.value_objects.processing_status import ProcessingStatus
 from domain.value_objects.s3_key import S3Key
 
@@ -148,7 +149,7 @@ class TestDocumentProcessor:
         mock_openai_client.generate_embeddings_batch = AsyncMock(
             return_value=embeddings
         )
-        mock_vector_repository.add_chunk_embedding = AsyncMock()
+        mock_vector_repository.add_chunk_embeddings = AsyncMock()
         mock_s3_service.delete_file = AsyncMock(return_value=True)
         with patch.object(
             document_processor, "_download_and_extract_text", return_value=text_content
@@ -522,13 +523,16 @@ class TestDocumentProcessor:
         mock_openai_client.generate_embeddings_batch = AsyncMock(
             return_value=embeddings
         )
-        mock_vector_repository.add_chunk_embedding = AsyncMock()
+        mock_vector_repository.add_chunk_embeddings = AsyncMock()
         await document_processor._generate_and_save_embeddings(
             sample_document, sample_processing_job
         )
         mock_openai_client.generate_embeddings_batch.assert_called_once()
-        assert mock_vector_repository.add_chunk_embedding.call_count == len(
-            sample_chunks
+        mock_vector_repository.add_chunk_embeddings.assert_awaited_once_with(
+            [
+                (chunk.id, embedding)
+                for chunk, embedding in zip(sample_chunks, embeddings)
+            ]
         )
 
     @pytest.mark.asyncio
@@ -592,19 +596,82 @@ class TestDocumentProcessor:
                 end_char=(i + 1) * 20,
             )
             large_chunks.append(chunk)
-        embeddings_batch1 = [[0.1, 0.2, 0.3]] * 20
-        embeddings_batch2 = [[0.4, 0.5, 0.6]] * 20
-        embeddings_batch3 = [[0.7, 0.8, 0.9]] * 5
+        embeddings = [[0.1, 0.2, 0.3]] * 45
         mock_document_service.get_document_chunks = AsyncMock(return_value=large_chunks)
         mock_openai_client.generate_embeddings_batch = AsyncMock(
-            side_effect=[embeddings_batch1, embeddings_batch2, embeddings_batch3]
+            return_value=embeddings
         )
-        mock_vector_repository.add_chunk_embedding = AsyncMock()
+        mock_vector_repository.add_chunk_embeddings = AsyncMock()
         await document_processor._generate_and_save_embeddings(
             sample_document, sample_processing_job
         )
-        assert mock_openai_client.generate_embeddings_batch.call_count == 3
-        assert mock_vector_repository.add_chunk_embedding.call_count == 45
+        mock_openai_client.generate_embeddings_batch.assert_awaited_once_with(
+            [chunk.content for chunk in large_chunks]
+        )
+        assert mock_vector_repository.add_chunk_embeddings.await_count == 3
+        assert sample_processing_job.chunks_processed == 45
+
+    @pytest.mark.asyncio
+    async def test_generate_and_save_embeddings_pipelines_groups(
+        self,
+        document_processor,
+        sample_document,
+        sample_processing_job,
+        sample_chunks,
+        mock_document_service,
+        mock_openai_client,
+        mock_vector_repository,
+    ):
+        events = []
+
+        async def embed(texts):
+            events.append(("embed", texts))
+            return [[0.1, 0.2, 0.3]] * len(texts)
+
+        async def save(embeddings):
+            events.extend(("save", chunk_id) for chunk_id, _ in embeddings)
+
+        mock_document_service.get_document_chunks = AsyncMock(
+            return_value=sample_chunks
+        )
+        mock_openai_client.generate_embeddings_batch = AsyncMock(side_effect=embed)
+        mock_vector_repository.add_chunk_embeddings = AsyncMock(side_effect=save)
+
+        with patch("domain.services.document_processor._EMBEDDING_GROUP_SIZE", 1):
+            await document_processor._generate_and_save_embeddings(
+                sample_document, sample_processing_job
+            )
+
+        assert events == [
+            ("embed", ["First chunk content"]),
+            ("embed", ["Second chunk content"]),
+            ("save", sample_chunks[0].id),
+            ("save", sample_chunks[1].id),
+        ]
+        assert sample_processing_job.chunks_processed == 2
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_only_requests_cache_misses(
+        self,
+        document_processor,
+        mock_openai_client,
+    ):
+        cached = Embedding.from_openai([0.1, 0.2, 0.3])
+        generated = Embedding.from_openai([0.4, 0.5, 0.6])
+        cache = Mock()
+        cache.hash_text = Mock(side_effect=lambda text: f"hash-{text}")
+        cache.get_many = AsyncMock(return_value=[cached, None])
+        cache.set_many = AsyncMock()
+        document_processor.embedding_cache = cache
+        mock_openai_client.generate_embeddings_batch = AsyncMock(
+            return_value=[generated]
+        )
+
+        result = await document_processor._get_embeddings(["a", "b"])
+
+        assert result == [cached, generated]
+        mock_openai_client.generate_embeddings_batch.assert_awaited_once_with(["b"])
+        cache.set_many.assert_awaited_once_with({"hash-b": generated})
 
     @pytest.mark.asyncio
     async def test_cleanup_s3_file_success(
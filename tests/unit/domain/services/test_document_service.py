@@ -1,3 +1,4 @@
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
@@ -139,7 +140,9 @@ class TestDocumentService:
         documents = [sample_document]
         mock_document_repository.find_all = AsyncMock(return_value=documents)
         result = await document_service.list_documents(limit=10, offset=0)
-        mock_document_repository.find_all.assert_called_once_with(limit=10, offset=0)
+        mock_document_repository.find_all.assert_called_once_with(
+            limit=10, offset=0, cursor=None, with_content=True
+        )
         assert result == documents
 
     @pytest.mark.asyncio
@@ -259,7 +262,7 @@ class TestDocumentService:
         self, mock_document_repository, sample_document, mock_data_factory
     ):
         mock_chunk_repository = Mock()
-        mock_chunk_repository.save_chunk = AsyncMock()
+        mock_chunk_repository.save_chunks = AsyncMock()
         document_service = DocumentService(
             document_repository=mock_document_repository,
             document_chunk_repository=mock_chunk_repository,
@@ -272,7 +275,7 @@ class TestDocumentService:
         mock_document_repository.find_by_id = AsyncMock(return_value=sample_document)
         result = await document_service.add_chunks_to_document(document_id, chunks)
         assert result == sample_document
-        assert mock_chunk_repository.save_chunk.call_count == len(chunks)
+        mock_chunk_repository.save_chunks.assert_awaited_once_with(chunks)
         for chunk in chunks:
             assert chunk.document_id == document_id
 
@@ -371,9 +374,22 @@ class TestDocumentService:
         documents = [Mock(), Mock(), Mock()]
         mock_document_repository.find_all = AsyncMock(return_value=documents)
         result = await document_service.list_documents(limit=5, offset=10)
-        mock_document_repository.find_all.assert_called_once_with(limit=5, offset=10)
+        mock_document_repository.find_all.assert_called_once_with(
+            limit=5, offset=10, cursor=None, with_content=True
+        )
         assert result == documents
 
+    @pytest.mark.asyncio
+    async def test_list_documents_with_cursor(
+        self, document_service, mock_document_repository
+    ):
+        cursor = (datetime(2024, 1, 1), uuid4())
+        mock_document_repository.find_all = AsyncMock(return_value=[])
+        await document_service.list_documents(limit=5, cursor=cursor)
+        mock_document_repository.find_all.assert_called_once_with(
+            limit=5, offset=0, cursor=cursor, with_content=True
+        )
+
     @pytest.mark.asyncio
     async def test_list_documents_no_pagination(
         self, document_service, mock_document_repository
@@ -381,5 +397,7 @@ class TestDocumentService:
         documents = [Mock(), Mock()]
         mock_document_repository.find_all = AsyncMock(return_value=documents)
         result = await document_service.list_documents()
-        mock_document_repository.find_all.assert_called_once_with(limit=None, offset=0)
+        mock_document_repository.find_all.assert_called_once_with(
+            limit=None, offset=0, cursor=None, with_content=True
+        )
         assert result == documents
@@ -1,7 +1,10 @@
+import hashlib
+from unittest.mock import patch
+
 import pytest
 
 from domain.exceptions.business_exceptions import BusinessRuleViolationError
-from domain.value_objects.content_hash import ContentHash
+from domain.value_objects.content_hash import ContentHash, sha256_hexdigest
 
 
 class TestContentHash:
@@ -176,3 +179,10 @@ class TestContentHash:
             content_hash.algorithm = "md5"
         with pytest.raises(AttributeError):
             content_hash.value = "b" * 64
+
+    def test_sha256_hexdigest_in_chunks_matches_full_encoding(self):
+        text = "ação " * 10 + "🙂"
+        expected = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with patch("domain.value_objects.content_hash._HASH_CHUNK_CHARS", 3):
+            assert sha256_hexdigest(text) == expected
+        assert sha256_hexdigest("") == hashlib.sha256(b"").hexdigest()
@@ -0,0 +1,42 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import orjson
+
+from infrastructure.database.connection import DatabaseConnection, _orjson_serializer
+
+
+class TestDatabaseConnection:
+    @patch("infrastructure.database.connection.settings")
+    @patch("infrastructure.database.connection.create_async_engine")
+    def test_pooled_engine_settings(self, mock_create_engine, mock_settings):
+        mock_settings.debug = False
+
+        DatabaseConnection().initialize()
+
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["pool_size"] == 20
+        assert kwargs["max_overflow"] == 10
+        assert kwargs["pool_pre_ping"] is False
+        assert kwargs["query_cache_size"] == 1200
+        assert kwargs["connect_args"] == {"prepared_statement_cache_size": 500}
+        assert kwargs["json_serializer"] is _orjson_serializer
+        assert kwargs["json_deserializer"] is orjson.loads
+
+    def test_orjson_serializer_returns_str(self):
+        value = {"source": "a.pdf", 1: "x", "date": datetime(2024, 1, 2)}
+
+        assert _orjson_serializer(value) == (
+            '{"source":"a.pdf","1":"x","date":"2024-01-02T00:00:00"}'
+        )
+
+    @patch("infrastructure.database.connection.settings")
+    @patch("infrastructure.database.connection.create_async_engine")
+    def test_initialize_once(self, mock_create_engine, mock_settings):
+        mock_settings.debug = False
+        connection = DatabaseConnection()
+
+        connection.initialize()
+        connection.initialize()
+
+        mock_create_engine.assert_called_once()
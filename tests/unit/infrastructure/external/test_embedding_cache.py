@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from domain.value_objects.embedding import Embedding
+from infrastructure.external.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def mock_redis():
+    redis_client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    redis_client.pipe = pipe
+    return redis_client
+
+
+class TestEmbeddingCache:
+    """Testes unitários para EmbeddingCache"""
+
+    def test_hash_normalizes_whitespace(self, mock_redis):
+        """Deve gerar o mesmo hash para textos que diferem só em espaços"""
+        cache = EmbeddingCache(mock_redis)
+
+        assert cache.hash_text("Lei  nº 1\n de 2024 ") == cache.hash_text(
+            "Lei nº 1 de 2024"
+        )
+        assert cache.hash_text("a") != EmbeddingCache(
+            mock_redis, model="other"
+        ).hash_text("a")
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self, mock_redis):
+        """Deve buscar todos os hashes com um MGET e decodificar float32"""
+        vector = np.array([0.5, -1.0, 0.25], dtype=np.float32).tobytes()
+        mock_redis.mget = AsyncMock(return_value=[vector, None])
+        cache = EmbeddingCache(mock_redis)
+
+        result = await cache.get_many(["h1", "h2"])
+
+        mock_redis.mget.assert_awaited_once_with(["embedding:h1", "embedding:h2"])
+        assert result[0].vector == [0.5, -1.0, 0.25]
+        assert result[0].dimensions == 3
+        assert result[1] is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_misses_on_redis_error(self, mock_redis):
+        """Deve tratar falha do Redis como ausência no cache"""
+        mock_redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        cache = EmbeddingCache(mock_redis)
+
+        assert await cache.get_many(["h1", "h2"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_set_many_writes_with_ttl(self, mock_redis):
+        """Deve gravar com MSET e EXPIRE em um único pipeline"""
+        cache = EmbeddingCache(mock_redis, ttl_seconds=60)
+
+        await cache.set_many({"h1": Embedding.from_openai([0.5, 0.25])})
+
+        mapping = mock_redis.pipe.mset.call_args.args[0]
+        assert np.frombuffer(mapping["embedding:h1"], dtype=np.float32).tolist() == [
+            0.5,
+            0.25,
+        ]
+        mock_redis.pipe.expire.assert_called_once_with("embedding:h1", 60)
+        mock_redis.pipe.execute.assert_awaited_once()
@@ -0,0 +1,24 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from infrastructure.external.openai_client import OpenAIClient
+
+
+class TestOpenAIClientEmbeddings:
+    """Testes unitários para a geração de embeddings em lote"""
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_splits_requests(self):
+        """Deve dividir os textos em lotes e manter a ordem dos vetores"""
+        client = OpenAIClient(api_key="test-key")
+        client.embeddings = Mock()
+        client.embeddings.aembed_documents = AsyncMock(
+            side_effect=lambda batch: [[float(text), 0.0] for text in batch]
+        )
+
+        texts = [str(i) for i in range(5)]
+        result = await client.generate_embeddings_batch(texts, batch_size=2)
+
+        assert client.embeddings.aembed_documents.await_count == 3
+        assert [embedding.vector[0] for embedding in result] == [0, 1, 2, 3, 4]
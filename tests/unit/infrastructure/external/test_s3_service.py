@@ -0,0 +1,414 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.auth import S3SigV4PostAuth
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+
+from domain.value_objects.s3_key import S3Key
+from infrastructure.external.s3_service import (
+    S3Service,
+    _CachedKeyS3SigV4PostAuth,
+    _derive_signing_key,
+)
+
+
+class TestS3Service:
+    """Testes para S3Service"""
+
+    @pytest.fixture
+    def s3_service(self):
+        """Fixture para S3Service"""
+        return S3Service(
+            bucket="documents",
+            region="us-east-1",
+            access_key="test-access-key",
+            secret_key="test-secret-key",
+            endpoint_url="http://localhost:4566",
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_pool_config(self, s3_service):
+        """Testa que o cliente assíncrono usa pool de conexões ampliado"""
+        client = await s3_service._get_async_client()
+
+        assert client.meta.config.max_pool_connections == 64
+        assert client.meta.config.tcp_keepalive is True
+        assert client.meta.config.retries["mode"] == "adaptive"
+        assert client.meta.config.retries["total_max_attempts"] == 11
+        assert client.meta.config.connector_args["keepalive_timeout"] == 75
+        assert client.meta.config.connector_args["ttl_dns_cache"] == 300
+        await s3_service.close()
+
+    @pytest.mark.asyncio
+    async def test_async_client_is_reused(self, s3_service):
+        """Testa que o cliente assíncrono é criado uma vez e reutilizado"""
+        first = await s3_service._get_async_client()
+        second = await s3_service._get_async_client()
+
+        assert first is second
+        await s3_service.close()
+        assert s3_service._async_client is None
+
+    @staticmethod
+    def _mock_async_client(s3_service, pages):
+        """Substitui o cliente assíncrono por um mock com paginação"""
+
+        async def paginate(**kwargs):
+            start_after = kwargs.get("StartAfter", "")
+            for page in pages:
+                yield {
+                    "Contents": [
+                        obj
+                        for obj in page.get("Contents", [])
+                        if obj["Key"] > start_after
+                    ]
+                }
+
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.side_effect = paginate
+        client.delete_objects = AsyncMock(
+            side_effect=lambda Bucket, Delete: {"Deleted": Delete["Objects"]}
+        )
+
+        s3_service._get_async_client = AsyncMock(return_value=client)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_cleanup_temp_files_deletes_per_page(self, s3_service):
+        """Testa que o cleanup remove arquivos antigos com uma chamada por página"""
+        old = datetime.now(timezone.utc) - timedelta(hours=48)
+        recent = datetime.now(timezone.utc)
+        pages = [
+            {
+                "Contents": [
+                    {"Key": f"temp/old-{i}.pdf", "LastModified": old}
+                    for i in range(600)
+                ]
+                + [{"Key": "temp/recent.pdf", "LastModified": recent}]
+            },
+            {},
+        ]
+        client = self._mock_async_client(s3_service, pages)
+
+        deleted = await s3_service.cleanup_temp_files(older_than_hours=24)
+
+        assert deleted == 600
+        assert client.delete_objects.await_count == 1
+        deleted_keys = {
+            obj["Key"]
+            for call in client.delete_objects.await_args_list
+            for obj in call.kwargs["Delete"]["Objects"]
+        }
+        assert "temp/recent.pdf" not in deleted_keys
+
+    @pytest.mark.asyncio
+    async def test_cleanup_temp_files_lists_key_ranges_in_parallel(self, s3_service):
+        """Testa que o cleanup lista faixas disjuntas e remove cada key uma vez"""
+        old = datetime.now(timezone.utc) - timedelta(hours=48)
+        keys = sorted(
+            [f"temp/{c}{i}/file.pdf" for c in "0123456789abcdef" for i in range(3)]
+            + ["temp/1", "temp/zz/file.pdf"]
+        )
+        pages = [{"Contents": [{"Key": key, "LastModified": old} for key in keys]}]
+        client = self._mock_async_client(s3_service, pages)
+
+        deleted = await s3_service.cleanup_temp_files(older_than_hours=24)
+
+        deleted_keys = [
+            obj["Key"]
+            for call in client.delete_objects.await_args_list
+            for obj in call.kwargs["Delete"]["Objects"]
+        ]
+        assert deleted == len(keys)
+        assert sorted(deleted_keys) == keys
+        assert client.get_paginator.return_value.paginate.call_count == 16
+
+    @pytest.mark.asyncio
+    async def test_generate_presigned_upload_url_async(self, s3_service):
+        """Testa geração assíncrona de URL presigned via thread pool"""
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+
+        upload_url, expires_at, upload_fields = (
+            await s3_service.generate_presigned_upload_url_async(
+                s3_key=s3_key, content_type="application/pdf", expires_in=600
+            )
+        )
+
+        assert upload_url == "http://localhost:4566/documents"
+        assert expires_at > datetime.now(timezone.utc)
+        assert upload_fields["key"] == "temp/doc/file.pdf"
+        assert upload_fields["Content-Type"] == "application/pdf"
+        assert upload_fields["x-amz-algorithm"] == "AWS4-HMAC-SHA256"
+
+    @staticmethod
+    def _mock_ranged_get_object(client, payload):
+        """Simula get_object respeitando o header Range"""
+
+        async def get_object(Bucket, Key, Range=None):
+            start, end = 0, len(payload) - 1
+            if Range:
+                start, end = map(int, Range.removeprefix("bytes=").split("-"))
+            data = payload[start : end + 1]
+
+            async def iter_chunks(chunk_size):
+                for i in range(0, len(data), 3):
+                    yield data[i : i + 3]
+
+            body = MagicMock()
+            body.iter_chunks = iter_chunks
+            return {"Body": body}
+
+        client.head_object = AsyncMock(return_value={"ContentLength": len(payload)})
+        client.get_object = AsyncMock(side_effect=get_object)
+
+    @pytest.mark.asyncio
+    async def test_download_file_uses_ranges(self, s3_service, tmp_path):
+        """Testa download para disco em ranges concorrentes"""
+        payload = b"0123456789"
+        client = self._mock_async_client(s3_service, [])
+        self._mock_ranged_get_object(client, payload)
+        s3_service._transfer_config.multipart_threshold = 4
+        s3_service._transfer_config.multipart_chunksize = 4
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+        local_path = tmp_path / "file.pdf"
+
+        result = await s3_service.download_file(s3_key, str(local_path))
+
+        assert result is True
+        assert local_path.read_bytes() == payload
+        assert client.get_object.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_download_file_content_uses_ranges(self, s3_service):
+        """Testa download em ranges concorrentes para arquivos grandes"""
+        payload = b"0123456789"
+        client = self._mock_async_client(s3_service, [])
+        self._mock_ranged_get_object(client, payload)
+        s3_service._transfer_config.multipart_chunksize = 4
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+
+        content = await s3_service.download_file_content(s3_key)
+
+        assert content == payload
+        assert client.get_object.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_download_file_content_fills_preallocated_buffer(self, s3_service):
+        """Testa download em memória de arquivo pequeno em blocos"""
+        payload = b"0123456789"
+        client = self._mock_async_client(s3_service, [])
+        self._mock_ranged_get_object(client, payload)
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+
+        content = await s3_service.download_file_content(s3_key)
+
+        assert content == payload
+        assert isinstance(content, bytes)
+        client.get_object.assert_awaited_once_with(
+            Bucket="documents", Key="temp/doc/file.pdf"
+        )
+
+    def test_generate_presigned_upload_url_uses_requested_expiry(self, s3_service):
+        """Testa que cada chamada assina uma URL com a validade pedida"""
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+        presigner = s3_service._get_presigner()
+
+        with patch.object(
+            presigner,
+            "generate_presigned_post",
+            wraps=presigner.generate_presigned_post,
+        ) as mock_presign:
+            s3_service.generate_presigned_upload_url(s3_key, "application/pdf")
+            _, expires_at, _ = s3_service.generate_presigned_upload_url(
+                s3_key, "application/pdf", expires_in=60
+            )
+
+        assert mock_presign.call_count == 2
+        assert mock_presign.call_args.kwargs["expires_in"] == 60
+        assert expires_at - datetime.now(timezone.utc) <= timedelta(seconds=60)
+
+    def test_presigned_post_reuses_signing_key(self, s3_service):
+        """Testa que a signing key SigV4 é derivada uma vez por dia/região"""
+        _derive_signing_key.cache_clear()
+
+        for i in range(3):
+            s3_service.generate_presigned_upload_url(
+                S3Key(bucket="documents", key=f"temp/doc/{i}.pdf"), "application/pdf"
+            )
+
+        assert _derive_signing_key.cache_info().misses == 1
+        assert _derive_signing_key.cache_info().hits == 2
+
+    def test_cached_signing_key_matches_botocore_signature(self):
+        """Testa que a assinatura com key em cache é igual à do botocore"""
+        credentials = Credentials("test-access-key", "test-secret-key")
+        request = MagicMock(context={"timestamp": "20240101T000000Z"})
+        kwargs = {
+            "credentials": credentials,
+            "region_name": "us-east-1",
+            "service_name": "s3",
+        }
+
+        cached = _CachedKeyS3SigV4PostAuth(**kwargs).signature("policy", request)
+
+        assert cached == S3SigV4PostAuth(**kwargs).signature("policy", request)
+
+    @pytest.mark.asyncio
+    async def test_file_stats_batch(self, s3_service):
+        """Testa obtenção de tamanhos em lote com uma listagem por prefixo"""
+        pages = [
+            {
+                "Contents": [
+                    {"Key": "temp/doc/a.pdf", "Size": 10},
+                    {"Key": "temp/doc/b.pdf", "Size": 20},
+                    {"Key": "temp/doc/c.pdf", "Size": 30},
+                ]
+            }
+        ]
+        client = self._mock_async_client(s3_service, pages)
+        keys = [
+            S3Key(bucket="documents", key="temp/doc/a.pdf"),
+            S3Key(bucket="documents", key="temp/doc/c.pdf"),
+            S3Key(bucket="documents", key="temp/doc/missing.pdf"),
+        ]
+
+        stats = await s3_service.file_stats_batch(keys)
+
+        assert stats == {
+            "temp/doc/a.pdf": 10,
+            "temp/doc/c.pdf": 30,
+            "temp/doc/missing.pdf": None,
+        }
+        client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="documents", Prefix="temp/doc/"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("code", ["404", "NoSuchKey", "NotFound"])
+    async def test_file_exists_missing_codes(self, s3_service, code):
+        """Testa que códigos de objeto ausente retornam False"""
+        client = self._mock_async_client(s3_service, [])
+        client.head_object = AsyncMock(
+            side_effect=ClientError({"Error": {"Code": code}}, "HeadObject")
+        )
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+
+        assert await s3_service.file_exists(s3_key) is False
+
+    @pytest.mark.asyncio
+    async def test_file_exists_via_list(self, s3_service):
+        """Testa verificação de existência via listagem com prefixo exato"""
+        client = self._mock_async_client(s3_service, [])
+        client.list_objects_v2 = AsyncMock(
+            return_value={"KeyCount": 1, "Contents": [{"Key": "temp/doc/file.pdf.bak"}]}
+        )
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+
+        assert await s3_service.file_exists_via_list(s3_key) is False
+        client.list_objects_v2.assert_awaited_once_with(
+            Bucket="documents", Prefix="temp/doc/file.pdf", MaxKeys=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_file_size_uses_head_cache(self, s3_service):
+        """Testa que head_object repetido é servido do cache até a remoção"""
+        client = self._mock_async_client(s3_service, [])
+        client.head_object = AsyncMock(return_value={"ContentLength": 42})
+        client.delete_object = AsyncMock()
+        s3_key = S3Key(bucket="documents", key="temp/doc/file.pdf")
+
+        assert await s3_service.get_file_size(s3_key) == 42
+        assert await s3_service.file_exists(s3_key) is True
+        assert client.head_object.await_count == 1
+
+        await s3_service.delete_file(s3_key)
+        await s3_service.get_file_size(s3_key)
+
+        assert client.head_object.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_test_connection_caches_result(self, s3_service):
+        """Testa que o resultado do health check é reaproveitado"""
+        client = MagicMock()
+        client.head_bucket = AsyncMock()
+        s3_service._get_health_client = AsyncMock(return_value=client)
+
+        assert await s3_service.test_connection() is True
+        assert await s3_service.test_connection() is True
+        client.head_bucket.assert_awaited_once_with(Bucket="documents")
+
+    @pytest.mark.asyncio
+    async def test_health_client_uses_short_timeouts(self, s3_service):
+        """Testa que o cliente de health check usa timeouts curtos sem retry"""
+        client = await s3_service._get_health_client()
+
+        assert client.meta.config.connect_timeout == 2
+        assert client.meta.config.read_timeout == 2
+        assert client.meta.config.retries["total_max_attempts"] == 1
+        await s3_service.close()
+
+    @pytest.mark.asyncio
+    async def test_custom_endpoint_uses_path_style(self, s3_service):
+        """Testa que endpoint próprio usa endereçamento path-style"""
+        client = await s3_service._get_async_client()
+
+        assert client.meta.config.s3["addressing_style"] == "path"
+        assert client.meta.config.s3["use_dualstack_endpoint"] is False
+        await s3_service.close()
+
+    def test_aws_endpoint_keeps_default_addressing(self):
+        """Testa que sem endpoint próprio a resolução padrão é mantida"""
+        s3_service = S3Service(bucket="documents")
+
+        assert s3_service._async_client_config.s3 is None
+
+    @pytest.mark.asyncio
+    async def test_delete_files_batches_per_bucket(self, s3_service):
+        """Testa remoção em lote agrupada por bucket e limitada a 1000 keys"""
+        client = self._mock_async_client(s3_service, [])
+        keys = [
+            S3Key(bucket="documents", key=f"temp/doc/{i}.pdf") for i in range(1500)
+        ] + [S3Key(bucket="archive", key="temp/doc/old.pdf")]
+
+        deleted = await s3_service.delete_files(keys)
+
+        assert len(deleted) == 1501
+        assert set(deleted) == set(keys)
+        batches = [
+            (call.kwargs["Bucket"], len(call.kwargs["Delete"]["Objects"]))
+            for call in client.delete_objects.await_args_list
+        ]
+        assert sorted(batches) == [
+            ("archive", 1),
+            ("documents", 500),
+            ("documents", 1000),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delete_files_returns_only_removed_keys(self, s3_service):
+        """Testa que keys recusadas pelo S3 ficam fora do retorno"""
+        client = self._mock_async_client(s3_service, [])
+        client.delete_objects = AsyncMock(
+            return_value={
+                "Deleted": [{"Key": "temp/doc/a.pdf"}],
+                "Errors": [{"Key": "temp/doc/b.pdf", "Code": "AccessDenied"}],
+            }
+        )
+        keys = [
+            S3Key(bucket="documents", key="temp/doc/a.pdf"),
+            S3Key(bucket="documents", key="temp/doc/b.pdf"),
+        ]
+
+        deleted = await s3_service.delete_files(keys)
+
+        assert deleted == [keys[0]]
+
+    @pytest.mark.asyncio
+    async def test_credentials_preloaded_on_session(self, s3_service):
+        """Testa que credenciais estáticas são carregadas na construção"""
+        credentials = await s3_service._aio_session.get_credentials()
+
+        assert credentials.access_key == "test-access-key"
+        assert s3_service._credentials.secret_key == "test-secret-key"
@@ -1,6 +1,8 @@
+import asyncio
 from email.mime.multipart import MIMEMultipart
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiosmtplib
 import pytest
 
 from domain.exceptions.auth_exceptions import EmailDeliveryError
@@ -24,13 +26,21 @@ class TestSMTPEmailService:
             base_url="http://localhost:8000",
         )
 
+    @staticmethod
+    def _mock_server(mock_smtp):
+        """Configura conexão aiosmtplib simulada"""
+        mock_server = MagicMock()
+        for method in ("connect", "login", "noop", "send_message", "quit"):
+            setattr(mock_server, method, AsyncMock())
+        mock_smtp.return_value = mock_server
+        return mock_server
+
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_invitation_email_success(self, mock_smtp, email_service):
         """Testa envio bem-sucedido de email de convite"""
         # Arrange
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         # Act
         result = await email_service.send_invitation_email(
             email="user@example.com",
@@ -41,26 +51,33 @@ class TestSMTPEmailService:
         )
         # Assert
         assert result is True
-        mock_smtp.assert_called_once_with("smtp.gmail.com", 587)
-        mock_server.starttls.assert_called_once()
-        mock_server.login.assert_called_once_with("test@example.com", "password123")
-        mock_server.send_message.assert_called_once()
+        mock_smtp.assert_called_once()
+        assert mock_smtp.call_args.kwargs["hostname"] == "smtp.gmail.com"
+        assert mock_smtp.call_args.kwargs["port"] == 587
+        assert mock_smtp.call_args.kwargs["start_tls"] is True
+        assert mock_smtp.call_args.kwargs["timeout"] == 10
+        mock_server.connect.assert_awaited_once()
+        mock_server.login.assert_awaited_once_with("test@example.com", "password123")
+        mock_server.send_message.assert_awaited_once()
         # Verifica se a mensagem foi criada corretamente
         call_args = mock_server.send_message.call_args[0][0]
         assert isinstance(call_args, MIMEMultipart)
         assert "João Silva" in call_args["To"]
         assert "user@example.com" in call_args["To"]
         assert "Convite para acessar o Sistema" in call_args["Subject"]
+        assert call_args["From"] == "Test System <test@example.com>"
+        assert call_args["Reply-To"] == "Test System <noreply@example.com>"
+        assert call_args["Message-ID"].endswith("@example.com>")
+        assert call_args.get_all("MIME-Version") == ["1.0"]
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_invitation_email_without_municipality(
         self, mock_smtp, email_service
     ):
         """Testa envio de email de convite sem prefeitura"""
         # Arrange
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         # Act
         result = await email_service.send_invitation_email(
             email="user@example.com",
@@ -74,12 +91,11 @@ class TestSMTPEmailService:
         assert "da Prefeitura" not in call_args["Subject"]
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_password_reset_email_success(self, mock_smtp, email_service):
         """Testa envio bem-sucedido de email de redefinição de senha"""
         # Arrange
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         # Act
         result = await email_service.send_password_reset_email(
             email="user@example.com",
@@ -92,12 +108,11 @@ class TestSMTPEmailService:
         assert "Redefinição de senha" in call_args["Subject"]
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_account_activated_email_success(self, mock_smtp, email_service):
         """Testa envio bem-sucedido de email de confirmação de ativação"""
         # Arrange
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         # Act
         result = await email_service.send_account_activated_email(
             email="user@example.com",
@@ -109,12 +124,11 @@ class TestSMTPEmailService:
         assert "Conta ativada com sucesso" in call_args["Subject"]
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_welcome_email_success(self, mock_smtp, email_service):
         """Testa envio bem-sucedido de email de boas-vindas"""
         # Arrange
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         # Act
         result = await email_service.send_welcome_email(
             email="user@example.com",
@@ -128,7 +142,7 @@ class TestSMTPEmailService:
         assert "da Prefeitura de São Paulo" in call_args["Subject"]
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_email_smtp_connection_error(self, mock_smtp, email_service):
         """Testa falha na conexão SMTP"""
         # Arrange
@@ -145,12 +159,11 @@ class TestSMTPEmailService:
         assert "Connection failed" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_email_authentication_error(self, mock_smtp, email_service):
         """Testa falha na autenticação SMTP"""
         # Arrange
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         mock_server.login.side_effect = Exception("Authentication failed")
         # Act & Assert
         with pytest.raises(EmailDeliveryError) as exc_info:
@@ -164,7 +177,7 @@ class TestSMTPEmailService:
         assert "Authentication failed" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch("infrastructure.external.smtp_email_service.smtplib.SMTP")
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
     async def test_send_email_without_tls(self, mock_smtp):
         """Testa envio de email sem TLS"""
         # Arrange
@@ -178,8 +191,7 @@ class TestSMTPEmailService:
             from_name="Test System",
             base_url="http://localhost:8000",
         )
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = self._mock_server(mock_smtp)
         # Act
         result = await email_service.send_invitation_email(
             email="user@example.com",
@@ -189,8 +201,162 @@ class TestSMTPEmailService:
         )
         # Assert
         assert result is True
-        mock_server.starttls.assert_not_called()  # TLS não deve ser chamado
-        mock_server.login.assert_called_once()
+        # TLS não deve ser usado
+        assert mock_smtp.call_args.kwargs["start_tls"] is False
+        mock_server.login.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
+    async def test_connection_is_reused_between_sends(self, mock_smtp, email_service):
+        """Testa que a conexão do pool é reaproveitada e validada com NOOP"""
+        # Arrange
+        mock_server = self._mock_server(mock_smtp)
+        # Act
+        await email_service.send_account_activated_email(
+            email="user@example.com", full_name="João Silva"
+        )
+        await email_service.send_account_activated_email(
+            email="user@example.com", full_name="João Silva"
+        )
+        await email_service.aclose()
+        # Assert
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_awaited_once()
+        mock_server.noop.assert_awaited_once()
+        assert mock_server.send_message.await_count == 2
+        mock_server.quit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
+    async def test_failed_send_discards_connection(self, mock_smtp, email_service):
+        """Testa que conexão com falha no envio não volta ao pool"""
+        # Arrange
+        mock_server = self._mock_server(mock_smtp)
+        mock_server.send_message.side_effect = Exception("Broken pipe")
+        # Act & Assert
+        with pytest.raises(EmailDeliveryError):
+            await email_service.send_account_activated_email(
+                email="user@example.com", full_name="João Silva"
+            )
+        mock_server.quit.assert_awaited_once()
+        assert email_service._pool.empty()
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
+    async def test_send_invitation_emails_uses_single_connection(
+        self, mock_smtp, email_service
+    ):
+        """Testa convites em lote na mesma conexão, ignorando itens inválidos"""
+        # Arrange
+        mock_server = self._mock_server(mock_smtp)
+        mock_server.is_connected = True
+        invitations = [
+            {
+                "email": f"user{i}@example.com",
+                "full_name": f"Usuário {i}",
+                "invitation_token": f"token-{i:04d}",
+                "invited_by_name": "Admin User",
+            }
+            for i in range(3)
+        ]
+        invitations.append({**invitations[0], "email": "invalido"})
+        # Act
+        sent = await email_service.send_invitation_emails(invitations)
+        # Assert
+        assert sent == 3
+        mock_smtp.assert_called_once()
+        assert mock_server.send_message.await_count == 3
+        recipients = [
+            call.args[0]["To"] for call in mock_server.send_message.await_args_list
+        ]
+        assert "user2@example.com" in recipients[2]
+        assert email_service._pool.qsize() == 1
+
+    @staticmethod
+    def _invitations(count):
+        return [
+            {
+                "email": f"user{i}@example.com",
+                "full_name": f"Usuário {i}",
+                "invitation_token": f"token-{i:04d}",
+                "invited_by_name": "Admin User",
+            }
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
+    async def test_send_invitation_emails_reconnects_after_disconnect(
+        self, mock_smtp, email_service
+    ):
+        """Testa que o lote obtém nova conexão quando a atual cai"""
+        # Arrange
+        dead, fresh = MagicMock(), MagicMock()
+        for server in (dead, fresh):
+            for method in ("connect", "login", "noop", "send_message", "quit"):
+                setattr(server, method, AsyncMock())
+        fresh.is_connected = True
+
+        async def disconnect(msg):
+            dead.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("gone")
+
+        dead.is_connected = True
+        dead.send_message.side_effect = disconnect
+        dead.quit.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+        mock_smtp.side_effect = [dead, fresh]
+        # Act
+        sent = await email_service.send_invitation_emails(self._invitations(3))
+        # Assert
+        assert sent == 2
+        assert fresh.send_message.await_count == 2
+        dead.close.assert_called_once()
+        assert email_service._pool.qsize() == 1
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.external.smtp_email_service._MAX_MESSAGES_PER_CONNECTION", 2)
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
+    async def test_send_invitation_emails_rotates_connection_per_message(
+        self, mock_smtp, email_service
+    ):
+        """Testa que cada convite conta para o limite de mensagens da conexão"""
+        # Arrange
+        servers = [MagicMock(), MagicMock()]
+        for server in servers:
+            for method in ("connect", "login", "noop", "send_message", "quit"):
+                setattr(server, method, AsyncMock())
+            server.is_connected = True
+        mock_smtp.side_effect = servers
+        # Act
+        sent = await email_service.send_invitation_emails(self._invitations(3))
+        # Assert
+        assert sent == 3
+        assert servers[0].send_message.await_count == 2
+        servers[0].quit.assert_awaited_once()
+        assert servers[1].send_message.await_count == 1
+        assert email_service._messages_sent[id(servers[1])] == 1
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.external.smtp_email_service._CONNECT_TIMEOUT_SECONDS", 0.01)
+    @patch("infrastructure.external.smtp_email_service.aiosmtplib.SMTP")
+    async def test_connect_timeout_raises_delivery_error(
+        self, mock_smtp, email_service
+    ):
+        """Testa que handshake travado vira EmailDeliveryError e fecha a conexão"""
+        # Arrange
+        mock_server = self._mock_server(mock_smtp)
+
+        async def hang():
+            await asyncio.sleep(1)
+
+        mock_server.connect.side_effect = hang
+        # Act & Assert
+        with pytest.raises(EmailDeliveryError) as exc_info:
+            await email_service.send_account_activated_email(
+                email="user@example.com", full_name="João Silva"
+            )
+        assert "Tempo esgotado" in str(exc_info.value)
+        mock_server.close.assert_called_once()
 
     def test_create_invitation_html_content(self, email_service):
         """Testa criação de conteúdo HTML do email de convite"""
@@ -251,6 +417,19 @@ class TestSMTPEmailService:
         assert "Bem-vindo ao Sistema" in html_content
         assert "<!DOCTYPE html>" in html_content
 
+    def test_html_templates_escape_user_input(self, email_service):
+        """Testa que o HTML escapa dados do usuário e o texto os mantém"""
+        # Act
+        html_content = email_service._create_password_reset_html(
+            full_name="<b>João</b>", reset_url="http://localhost:8000/reset"
+        )
+        text_content = email_service._create_password_reset_text(
+            full_name="<b>João</b>", reset_url="http://localhost:8000/reset"
+        )
+        # Assert
+        assert "&lt;b&gt;João&lt;/b&gt;" in html_content
+        assert "<b>João</b>" in text_content
+
     def test_email_service_configuration(self):
         """Testa configuração do serviço de email"""
         # Act
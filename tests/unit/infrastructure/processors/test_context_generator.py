@@ -0,0 +1,109 @@
+import pytest
+
+from infrastructure.processors.context_generator import ContextGenerator
+
+
+class TestContextGenerator:
+    """Testes para ContextGenerator"""
+
+    @pytest.fixture
+    def generator(self):
+        """Fixture para ContextGenerator"""
+        return ContextGenerator()
+
+    def test_section_context_uses_first_header(self, generator):
+        """Testa que a seção é o primeiro cabeçalho encontrado no chunk"""
+        chunk = "texto inicial\n## Disposições Gerais\n1. Primeiro item"
+
+        assert generator._get_section_context(chunk, {}) == "Seção: Disposições Gerais"
+
+    def test_section_context_uses_precomputed_headers(self, generator):
+        """Testa mapeamento do chunk para o cabeçalho anterior via offsets"""
+        metadata = {"_header_offsets": [0, 100], "_header_titles": ["Um", "Dois"]}
+
+        in_second = generator._get_section_context(
+            "texto", {"start_char": 150, "end_char": 180}, metadata
+        )
+        crossing = generator._get_section_context(
+            "texto", {"start_char": 50, "end_char": 120}, metadata
+        )
+
+        assert in_second == "Seção: Dois"
+        assert crossing == "Seção: Dois"
+
+    def test_section_context_without_group_uses_full_line(self, generator):
+        """Testa cabeçalho em linha terminada por dois pontos"""
+        assert generator._get_section_context("RESUMO:\ntexto", {}) == "Seção: RESUMO:"
+
+    def test_section_context_falls_back_to_position(self, generator):
+        """Testa contexto por posição quando não há cabeçalho"""
+        position_info = {"chunk_index": 9, "total_chunks": 10}
+
+        context = generator._get_section_context("texto corrido", position_info)
+
+        assert context == "Final do documento"
+
+    def test_content_type_context_detects_money(self, generator):
+        """Testa detecção de conteúdo financeiro por valores monetários"""
+        assert generator._get_content_type_context("Total R$ 150") == (
+            "Conteúdo: Financeiro"
+        )
+
+    @pytest.mark.parametrize(
+        "chunk,expected",
+        [
+            ("Reunião em 10/05/2024", "Conteúdo: Datas"),
+            ("Prazo até 2024-05-10", "Conteúdo: Datas"),
+            ("Quem? Onde? Quando?", "Conteúdo: Perguntas"),
+            ("1. Primeiro\n2. Segundo", "Conteúdo: Lista numerada"),
+            ("Texto sem marcadores", None),
+        ],
+    )
+    def test_content_type_context_fallbacks(self, generator, chunk, expected):
+        """Testa classificação por marcadores quando não há palavras-chave"""
+        assert generator._get_content_type_context(chunk) == expected
+
+    def test_content_type_context_scores_categories(self, generator):
+        """Testa que a categoria com mais ocorrências é escolhida"""
+        chunk = "O artigo 5 da lei trata do orçamento e do parágrafo único"
+
+        assert generator._get_content_type_context(chunk) == "Conteúdo: Legal"
+
+    def test_content_type_context_financial_keywords(self, generator):
+        """Testa classificação financeira pelas palavras-chave do autômato"""
+        chunk = "A receita e a despesa do orçamento"
+
+        assert generator._get_content_type_context(chunk) == "Conteúdo: Financial"
+
+    def test_detect_language_counts_whole_words(self, generator):
+        """Testa que palavras-chave não são contadas dentro de outras palavras"""
+        # "com" dentro de "computador" e "comum" não conta como português
+        assert generator._detect_language("the computador comum") == "english"
+        assert generator._detect_language("the cat and the dog") == "english"
+        assert generator._detect_language("o texto que para com") == "portuguese"
+
+    def test_detect_language_stops_when_decided(self, generator):
+        """Testa que a detecção para quando um idioma abre vantagem"""
+        text = "que para com uma dos são " + "the and that " * 3
+
+        assert generator._detect_language(text) == "portuguese"
+
+    def test_extract_title_from_text(self, generator):
+        """Testa título como primeira linha iniciada por maiúscula e sem ponto"""
+        text = "1. item\ncurto\n  Relatório Anual de Gestão  \nTexto. Com ponto"
+
+        assert generator._extract_title_from_text(text) == "Relatório Anual de Gestão"
+        assert generator._extract_title_from_text("sem título aqui.") is None
+
+    def test_extract_document_metadata(self, generator):
+        """Testa extração de metadados estruturais do documento"""
+        text = "# Título\n| a | b | c |\n- item\n1. Primeiro\nque para com uma"
+
+        metadata = generator.extract_document_metadata(text, {"file_type": "pdf"})
+
+        assert metadata["headers_count"] == 2
+        assert metadata["_header_offsets"] == [0, 30]
+        assert metadata["_header_titles"] == ["Título", "Primeiro"]
+        assert metadata["has_tables"] is True
+        assert metadata["has_lists"] is True
+        assert metadata["language"] == "portuguese"
@@ -0,0 +1,147 @@
+import re
+from unittest.mock import patch
+
+import pytest
+
+from infrastructure.processors.text_chunker import TextChunker
+
+
+class FakeEncoding:
+    """Encoding simulado: cada palavra com o espaço seguinte é um token"""
+
+    def encode(self, text):
+        return re.findall(r"\S+\s*|\s+", text)
+
+    encode_ordinary = encode
+
+    def decode_with_offsets(self, tokens):
+        offsets, position = [], 0
+        for token in tokens:
+            offsets.append(position)
+            position += len(token)
+        return "".join(tokens), offsets
+
+
+class TestTextChunker:
+    """Testes para TextChunker"""
+
+    @pytest.fixture
+    def chunker(self):
+        """Fixture para TextChunker com encoding simulado"""
+        with patch(
+            "infrastructure.processors.text_chunker.tiktoken.get_encoding",
+            return_value=FakeEncoding(),
+        ):
+            yield TextChunker(chunk_size=20, chunk_overlap=0)
+
+    def test_chunk_document_content_offsets_and_context(self, chunker):
+        """Testa posições no texto original e contexto adicionado aos chunks"""
+        content = "\n\n".join(
+            f"Parágrafo {i} com algumas palavras de exemplo." for i in range(10)
+        )
+
+        chunks = chunker.chunk_document_content(content, "doc-1", {"file_type": "pdf"})
+
+        assert len(chunks) > 1
+        assert [chunk.chunk_index for chunk in chunks] == list(range(len(chunks)))
+        for chunk in chunks:
+            assert content[chunk.start_char : chunk.end_char] == chunk.original_content
+        assert "Tipo: PDF" in chunks[0].content
+        assert chunks[0].content.endswith(chunks[0].original_content)
+
+    def test_chunk_document_content_without_context(self):
+        """Testa chunks sem contextual retrieval"""
+        with patch(
+            "infrastructure.processors.text_chunker.tiktoken.get_encoding",
+            return_value=FakeEncoding(),
+        ):
+            chunker = TextChunker(
+                chunk_size=20, chunk_overlap=0, use_contextual_retrieval=False
+            )
+
+        chunks = chunker.chunk_document_content("Texto curto.", "doc-1", {})
+
+        assert len(chunks) == 1
+        assert chunks[0].content == "Texto curto."
+
+    def test_split_text_respects_token_limit_and_separators(self, chunker):
+        """Testa janelas de tokens cortadas no fim do parágrafo"""
+        paragraph = "uma frase com oito palavras para o teste."
+        content = "\n\n".join([paragraph] * 5)
+
+        chunks = chunker.split_text(content)
+
+        assert all(len(chunk.split()) <= 20 for chunk in chunks)
+        assert chunks[0] == f"{paragraph}\n\n{paragraph}"
+        assert "".join(chunks).replace("\n", "") == paragraph * 5
+
+    def test_split_text_applies_overlap(self):
+        """Testa sobreposição de tokens entre janelas consecutivas"""
+        with patch(
+            "infrastructure.processors.text_chunker.tiktoken.get_encoding",
+            return_value=FakeEncoding(),
+        ):
+            chunker = TextChunker(chunk_size=4, chunk_overlap=1)
+
+        chunks = chunker.split_text("a b c d e f g")
+
+        assert chunks == ["a b c d", "d e f g"]
+
+    def test_split_text_heading_with_overlap_has_no_fragments(self):
+        """Testa título curto seguido de parágrafo longo com sobreposição"""
+        with patch(
+            "infrastructure.processors.text_chunker.tiktoken.get_encoding",
+            return_value=FakeEncoding(),
+        ):
+            chunker = TextChunker(chunk_size=20, chunk_overlap=5)
+        body = " ".join(f"p{i}" for i in range(60))
+        content = f"CAPÍTULO II - DISPOSIÇÕES\n\n{body}"
+
+        chunks = chunker.split_text(content)
+
+        assert [len(chunk.split()) for chunk in chunks] == [20, 20, 20, 19]
+        assert chunks[0].startswith("CAPÍTULO II")
+        assert chunks[1].startswith("p11 ")
+
+    def test_split_text_overlaps_across_paragraph_breaks(self):
+        """Testa sobreposição de chunk_overlap tokens também em cortes de parágrafo"""
+        with patch(
+            "infrastructure.processors.text_chunker.tiktoken.get_encoding",
+            return_value=FakeEncoding(),
+        ):
+            chunker = TextChunker(chunk_size=20, chunk_overlap=5)
+        paragraphs = [" ".join(f"w{n}{i}" for i in range(15)) for n in range(4)]
+
+        chunks = chunker.split_text("\n\n".join(paragraphs))
+
+        assert len(chunks) > 1
+        for previous, current in zip(chunks, chunks[1:]):
+            shared = set(previous.split()[-5:]) & set(current.split()[:5])
+            assert len(shared) == 5
+
+    def test_chunk_document_content_uses_enclosing_header(self, chunker):
+        """Testa que chunks sem cabeçalho herdam a seção anterior do documento"""
+        body = " ".join(["palavra"] * 30)
+        content = f"# Capítulo Um\n\n{body}"
+
+        chunks = chunker.chunk_document_content(content, "doc-1", {})
+
+        assert len(chunks) > 1
+        assert all("Seção: Capítulo Um" in chunk.content for chunk in chunks)
+
+    def test_estimate_chunk_count_uses_character_estimate(self, chunker):
+        """Testa estimativa de chunks sem tokenizar o documento"""
+        chunker.encoding = None
+
+        assert chunker.estimate_chunk_count("") == 1
+        assert chunker.estimate_chunk_count("x" * 400) == 5
+
+    def test_iter_chunk_document_content_is_lazy(self, chunker):
+        """Testa que os chunks são gerados sob demanda"""
+        content = "\n\n".join(f"Parágrafo {i} com texto." for i in range(20))
+
+        iterator = chunker.iter_chunk_document_content(content, "doc-1", {})
+        first = next(iterator)
+
+        assert first.chunk_index == 0
+        assert [chunk.chunk_index for chunk in iterator][0] == 1
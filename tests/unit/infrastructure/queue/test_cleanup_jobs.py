@@ -0,0 +1,237 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import true
+
+from infrastructure.queue.jobs import (
+    _cleanup_expired_uploads,
+    _cleanup_orphaned_files,
+    _delete_uploads,
+    _delete_uploads_s3_objects,
+    _handle_job_failure,
+)
+
+
+def _upload(s3_key=None, s3_bucket="test-bucket"):
+    return SimpleNamespace(
+        id=uuid4(), s3_bucket=s3_bucket, s3_key=s3_key, s3_region="us-east-1"
+    )
+
+
+class TestDeleteUploadsS3Objects:
+    """Testes unitários para a remoção em lote dos arquivos de uploads"""
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._s3")
+    async def test_deletes_all_keys_in_single_call(self, mock_s3_factory):
+        """Deve remover todas as keys com uma única chamada em lote"""
+        mock_s3 = mock_s3_factory.return_value
+        mock_s3.delete_files = AsyncMock(side_effect=lambda keys: keys)
+
+        uploads = [
+            _upload("temp/a/file.pdf"),
+            _upload(None),
+            _upload("temp/b/file.pdf"),
+        ]
+
+        failed = await _delete_uploads_s3_objects(uploads)
+
+        assert failed == set()
+        mock_s3.delete_files.assert_awaited_once()
+        keys = mock_s3.delete_files.await_args.args[0]
+        assert [k.key for k in keys] == ["temp/a/file.pdf", "temp/b/file.pdf"]
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._s3")
+    async def test_returns_keys_not_deleted(self, mock_s3_factory):
+        """Deve devolver as keys que o S3 não removeu"""
+        mock_s3_factory.return_value.delete_files = AsyncMock(
+            side_effect=lambda keys: keys[:1]
+        )
+
+        failed = await _delete_uploads_s3_objects(
+            [_upload("temp/a/file.pdf"), _upload("temp/b/file.pdf")]
+        )
+
+        assert failed == {("test-bucket", "temp/b/file.pdf")}
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._s3")
+    async def test_skips_s3_without_keys(self, mock_s3_factory):
+        """Não deve acessar o S3 quando nenhum upload tem arquivo"""
+        failed = await _delete_uploads_s3_objects([_upload(None)])
+
+        assert failed == set()
+        mock_s3_factory.assert_not_called()
+
+
+class TestDeleteUploads:
+    """Testes unitários para _delete_uploads"""
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._CLEANUP_PARTITION_SIZE", 2)
+    @patch("infrastructure.queue.jobs._delete_uploads_s3_objects")
+    async def test_deletes_returning_keys_per_partition(self, mock_delete_s3):
+        """Deve usar DELETE ... RETURNING por partição até esgotar as linhas"""
+        mock_delete_s3.return_value = set()
+        partitions = [
+            [_upload("temp/a/file.pdf"), _upload("temp/b/file.pdf")],
+            [_upload("temp/c/file.pdf")],
+        ]
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[Mock(all=Mock(return_value=rows)) for rows in partitions]
+        )
+
+        deleted = await _delete_uploads(session, true())
+
+        assert deleted == 3
+        assert [c.args[0] for c in mock_delete_s3.await_args_list] == partitions
+        assert session.commit.await_count == 2
+        sql = str(session.execute.await_args.args[0])
+        assert sql.startswith("DELETE FROM file_upload")
+        assert "RETURNING file_upload.id, file_upload.s3_bucket" in sql
+        session.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._delete_uploads_s3_objects")
+    async def test_rolls_back_partition_when_s3_raises(self, mock_delete_s3):
+        """Não deve commitar a partição se a remoção no S3 levantar erro"""
+        mock_delete_s3.side_effect = RuntimeError("falhou")
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            return_value=Mock(all=Mock(return_value=[_upload("temp/a/file.pdf")]))
+        )
+
+        with pytest.raises(RuntimeError):
+            await _delete_uploads(session, true())
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._CLEANUP_PARTITION_SIZE", 2)
+    @patch("infrastructure.queue.jobs._s3")
+    async def test_skips_key_that_always_fails(self, mock_s3_factory):
+        """Key com falha permanente não deve travar a limpeza das demais"""
+        stuck = _upload("temp/stuck/file.pdf")
+        ok = _upload("temp/ok/file.pdf")
+        last = _upload("temp/last/file.pdf")
+        mock_s3_factory.return_value.delete_files = AsyncMock(
+            side_effect=lambda keys: [k for k in keys if "stuck" not in k.key]
+        )
+
+        for _ in range(2):
+            session = AsyncMock()
+            session.execute = AsyncMock(
+                side_effect=[
+                    Mock(all=Mock(return_value=[stuck, ok])),
+                    Mock(),
+                    Mock(all=Mock(return_value=[last])),
+                ]
+            )
+
+            deleted = await _delete_uploads(session, true())
+
+            assert deleted == 2
+            session.rollback.assert_awaited_once()
+            assert session.commit.await_count == 2
+            cleanup, next_partition = [
+                c.args[0] for c in session.execute.await_args_list[1:]
+            ]
+            assert list(cleanup.compile().params.values()) == [[ok.id]]
+            assert "NOT IN" in str(next_partition)
+            assert [stuck.id] in next_partition.compile().params.values()
+
+
+class TestCleanupExpiredUploads:
+    """Testes unitários para _cleanup_expired_uploads"""
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._delete_uploads")
+    @patch("infrastructure.queue.jobs.get_async_session")
+    async def test_reports_deleted_count(self, mock_get_session, mock_delete):
+        """Deve remover uploads expirados e reportar a quantidade"""
+        session = AsyncMock()
+        mock_get_session.return_value.__aenter__.return_value = session
+        mock_delete.return_value = 7
+
+        result = await _cleanup_expired_uploads()
+
+        assert result["deleted_count"] == 7
+        where = str(mock_delete.await_args.args[1])
+        assert "file_upload.expires_at <" in where
+        session.delete.assert_not_called()
+
+
+class TestCleanupOrphanedFiles:
+    """Testes unitários para _cleanup_orphaned_files"""
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._delete_uploads")
+    @patch("infrastructure.queue.jobs.get_async_session")
+    async def test_uses_anti_join(self, mock_get_session, mock_delete):
+        """Deve identificar órfãos com NOT EXISTS em vez de NOT IN"""
+        mock_get_session.return_value.__aenter__.return_value = AsyncMock()
+        mock_delete.return_value = 3
+
+        result = await _cleanup_orphaned_files()
+
+        assert result["deleted_count"] == 3
+        where = str(mock_delete.await_args.args[1])
+        assert "NOT (EXISTS" in where
+        assert "NOT IN" not in where
+
+
+class TestHandleJobFailure:
+    """Testes unitários para _handle_job_failure"""
+
+    @pytest.fixture
+    def session(self):
+        session = AsyncMock()
+        with patch("infrastructure.queue.jobs.get_async_session") as mock_get_session:
+            mock_get_session.return_value.__aenter__.return_value = session
+            yield mock_get_session
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._s3")
+    @patch("infrastructure.queue.jobs.PostgresFileUploadRepository")
+    @patch("infrastructure.queue.jobs.PostgresDocumentProcessingJobRepository")
+    async def test_last_attempt_shares_session_and_deletes_file(
+        self, mock_job_repo_class, mock_upload_repo_class, mock_s3_factory, session
+    ):
+        """Deve registrar o erro e remover o arquivo S3 usando uma única sessão"""
+        processing_job = Mock()
+        mock_job_repo_class.return_value.find_by_id = AsyncMock(
+            return_value=processing_job
+        )
+        mock_job_repo_class.return_value.save = AsyncMock()
+        file_upload = Mock()
+        mock_upload_repo_class.return_value.find_by_id = AsyncMock(
+            return_value=file_upload
+        )
+        mock_s3_factory.return_value.delete_file = AsyncMock(return_value=True)
+
+        await _handle_job_failure(str(uuid4()), str(uuid4()), "falhou", True)
+
+        session.assert_called_once()
+        processing_job.fail_with_error.assert_called_once_with("falhou")
+        mock_s3_factory.return_value.delete_file.assert_awaited_once_with(
+            file_upload.s3_key
+        )
+
+    @pytest.mark.asyncio
+    @patch("infrastructure.queue.jobs._s3")
+    @patch("infrastructure.queue.jobs.PostgresDocumentProcessingJobRepository")
+    async def test_retry_keeps_file(
+        self, mock_job_repo_class, mock_s3_factory, session
+    ):
+        """Não deve remover o arquivo S3 quando ainda há tentativas"""
+        mock_job_repo_class.return_value.find_by_id = AsyncMock(return_value=Mock())
+        mock_job_repo_class.return_value.save = AsyncMock()
+
+        await _handle_job_failure(str(uuid4()), str(uuid4()), "falhou", False)
+
+        mock_s3_factory.assert_not_called()
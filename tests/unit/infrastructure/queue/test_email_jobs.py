@@ -9,14 +9,14 @@ class TestSendEmailJob:
     """Testes unitários para send_email_job"""
 
     @patch("infrastructure.queue.jobs.get_current_job")
-    @patch("infrastructure.queue.jobs.asyncio.run")
-    def test_send_invitation_email_success(self, mock_asyncio_run, mock_get_job):
+    @patch("infrastructure.queue.jobs._run")
+    def test_send_invitation_email_success(self, mock_run, mock_get_job):
         """Deve enviar email de convite com sucesso"""
         mock_job = Mock()
         mock_job.id = "job-123"
         mock_get_job.return_value = mock_job
 
-        mock_asyncio_run.return_value = True
+        mock_run.return_value = True
 
         result = send_email_job(
             email_type="invitation",
@@ -31,17 +31,17 @@ class TestSendEmailJob:
         assert result["status"] == "sent"
         assert result["recipient"] == "test@example.com"
         assert result["email_type"] == "invitation"
-        mock_asyncio_run.assert_called_once()
+        mock_run.assert_called_once()
 
     @patch("infrastructure.queue.jobs.get_current_job")
-    @patch("infrastructure.queue.jobs.asyncio.run")
-    def test_send_welcome_email_success(self, mock_asyncio_run, mock_get_job):
+    @patch("infrastructure.queue.jobs._run")
+    def test_send_welcome_email_success(self, mock_run, mock_get_job):
         """Deve enviar email de boas-vindas com sucesso"""
         mock_job = Mock()
         mock_job.id = "job-456"
         mock_get_job.return_value = mock_job
 
-        mock_asyncio_run.return_value = True
+        mock_run.return_value = True
 
         result = send_email_job(
             email_type="welcome",
@@ -52,18 +52,16 @@ class TestSendEmailJob:
 
         assert result["status"] == "sent"
         assert result["email_type"] == "welcome"
-        mock_asyncio_run.assert_called_once()
+        mock_run.assert_called_once()
 
     @patch("infrastructure.queue.jobs.get_current_job")
-    @patch("infrastructure.queue.jobs.asyncio.run")
-    def test_send_email_unknown_type_raises_error(
-        self, mock_asyncio_run, mock_get_job
-    ):
+    @patch("infrastructure.queue.jobs._run")
+    def test_send_email_unknown_type_raises_error(self, mock_run, mock_get_job):
         """Deve lançar exceção para tipo de email desconhecido"""
         mock_job = Mock()
         mock_get_job.return_value = mock_job
 
-        mock_asyncio_run.side_effect = ValueError("Tipo de email desconhecido: unknown_type")
+        mock_run.side_effect = ValueError("Tipo de email desconhecido: unknown_type")
 
         with pytest.raises(ValueError) as exc_info:
             send_email_job(
@@ -76,16 +74,14 @@ class TestSendEmailJob:
         assert "Tipo de email desconhecido" in str(exc_info.value)
 
     @patch("infrastructure.queue.jobs.get_current_job")
-    @patch("infrastructure.queue.jobs.asyncio.run")
-    def test_send_email_smtp_failure_raises_exception(
-        self, mock_asyncio_run, mock_get_job
-    ):
+    @patch("infrastructure.queue.jobs._run")
+    def test_send_email_smtp_failure_raises_exception(self, mock_run, mock_get_job):
         """Deve propagar exceção quando SMTP falhar"""
         mock_job = Mock()
         mock_job.id = "job-789"
         mock_get_job.return_value = mock_job
 
-        mock_asyncio_run.side_effect = Exception("SMTP connection failed")
+        mock_run.side_effect = Exception("SMTP connection failed")
 
         with pytest.raises(Exception) as exc_info:
             send_email_job(
@@ -99,4 +95,3 @@ class TestSendEmailJob:
             )
 
         assert "SMTP connection failed" in str(exc_info.value)
-
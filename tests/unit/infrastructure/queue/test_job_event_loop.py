@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from infrastructure.queue import jobs
+
+
+@pytest.fixture(autouse=True)
+def reset_loop():
+    jobs.shutdown_event_loop()
+    yield
+    with patch("infrastructure.queue.jobs.db_connection") as mock_db:
+        mock_db.close = AsyncMock()
+        jobs.shutdown_event_loop()
+    jobs._s3.cache_clear()
+    jobs._email_service.cache_clear()
+
+
+class TestJobEventLoop:
+    """Testes unitários para o event loop persistente dos jobs"""
+
+    def test_reuses_same_loop_between_jobs(self):
+        """Deve executar jobs consecutivos no mesmo event loop"""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = jobs._run(current_loop())
+        second = jobs._run(current_loop())
+
+        assert first is second
+        assert not first.is_closed()
+
+    @patch("infrastructure.queue.jobs.db_connection")
+    def test_shutdown_closes_loop_and_database(self, mock_db):
+        """Deve fechar o pool do banco e o loop no encerramento"""
+        mock_db.close = AsyncMock()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loop = jobs._run(current_loop())
+        jobs.shutdown_event_loop()
+
+        mock_db.close.assert_awaited_once()
+        assert loop.is_closed()
+        assert jobs._run(current_loop()) is not loop
+
+
+class TestJobServices:
+    """Testes unitários para os clientes compartilhados entre jobs"""
+
+    @patch("infrastructure.queue.jobs.S3Service")
+    def test_s3_service_is_built_once(self, mock_s3_class):
+        """Deve reaproveitar o mesmo S3Service entre jobs"""
+        jobs._s3.cache_clear()
+
+        assert jobs._s3() is jobs._s3()
+        mock_s3_class.assert_called_once()
+
+    @patch("infrastructure.queue.jobs.db_connection")
+    @patch("infrastructure.queue.jobs.S3Service")
+    def test_shutdown_closes_shared_s3_service(self, mock_s3_class, mock_db):
+        """Deve fechar o S3Service compartilhado no encerramento"""
+        mock_db.close = AsyncMock()
+        mock_s3_class.return_value.close = AsyncMock()
+        jobs._s3.cache_clear()
+
+        async def use_s3():
+            return jobs._s3()
+
+        s3_service = jobs._run(use_s3())
+        jobs.shutdown_event_loop()
+
+        s3_service.close.assert_awaited_once()
+        assert jobs._s3.cache_info().currsize == 0
+
+    @patch("infrastructure.queue.jobs.db_connection")
+    @patch("infrastructure.queue.jobs.SMTPEmailService")
+    def test_email_service_is_shared_and_closed_on_shutdown(
+        self, mock_email_class, mock_db
+    ):
+        """Deve reaproveitar o SMTPEmailService entre jobs e fechá-lo no fim"""
+        mock_db.close = AsyncMock()
+        mock_email_class.return_value.send_welcome_email = AsyncMock(return_value=True)
+        mock_email_class.return_value.aclose = AsyncMock()
+        jobs._email_service.cache_clear()
+
+        for _ in range(2):
+            jobs._run(jobs._send_email_async("welcome", "a@b.com", "Fulano", {}))
+
+        mock_email_class.assert_called_once()
+        email_service = mock_email_class.return_value
+        assert email_service.send_welcome_email.await_count == 2
+        email_service.aclose.assert_not_awaited()
+
+        jobs.shutdown_event_loop()
+
+        email_service.aclose.assert_awaited_once()
+        assert jobs._email_service.cache_info().currsize == 0
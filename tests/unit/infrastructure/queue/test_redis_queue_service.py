@@ -67,3 +67,60 @@ class TestRedisQueueServiceEmailSending:
         call_kwargs = mock_queue.enqueue.call_args.kwargs
         assert call_kwargs["meta"]["priority"] == "normal"
 
+
+class TestRedisQueueServiceConnection:
+    """Testes unitários para a conexão Redis do RedisQueueService"""
+
+    def test_services_share_connection_pool(self):
+        """Deve reaproveitar o mesmo pool entre instâncias"""
+        from infrastructure.queue.redis_queue import RedisQueueService
+
+        first = RedisQueueService()
+        second = RedisQueueService()
+
+        assert first.redis_conn.connection_pool is second.redis_conn.connection_pool
+
+    def test_connection_pool_retries_transient_errors(self):
+        """Deve configurar retry com backoff e keepalive nas conexões"""
+        from redis.exceptions import BusyLoadingError
+
+        from infrastructure.queue.redis_queue import _connection_pool
+
+        kwargs = _connection_pool().connection_kwargs
+
+        assert kwargs["decode_responses"] is False
+        assert kwargs["socket_keepalive"] is True
+        assert kwargs["retry"]._retries == 3
+        assert BusyLoadingError in kwargs["retry_on_error"]
+
+
+class TestRedisQueueServiceDocumentProcessing:
+    """Testes unitários para o enfileiramento de processamento de documentos"""
+
+    @patch("infrastructure.queue.redis_queue.Redis")
+    @patch("infrastructure.queue.redis_queue.Queue")
+    def test_enqueue_document_processing_many_single_call(
+        self, mock_queue_class, mock_redis
+    ):
+        """Deve enfileirar todos os documentos com um único enqueue_many"""
+        from uuid import uuid4
+
+        from infrastructure.queue.redis_queue import RedisQueueService
+
+        mock_queue = Mock()
+        mock_queue.enqueue_many.return_value = [Mock(id="job-1"), Mock(id="job-2")]
+        mock_queue_class.return_value = mock_queue
+        mock_queue_class.prepare_data.side_effect = lambda *args, **kwargs: kwargs
+
+        items = [(uuid4(), uuid4(), "normal"), (uuid4(), uuid4(), "high")]
+        service = RedisQueueService()
+
+        job_ids = service.enqueue_document_processing_many(items)
+
+        assert job_ids == ["job-1", "job-2"]
+        mock_queue.enqueue_many.assert_called_once()
+        mock_queue.enqueue.assert_not_called()
+        data = mock_queue.enqueue_many.call_args.args[0]
+        assert data[1]["args"] == (str(items[1][0]), str(items[1][1]))
+        assert data[1]["meta"]["priority"] == "high"
+        assert data[1]["retry"].max == 3
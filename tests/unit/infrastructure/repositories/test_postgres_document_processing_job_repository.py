@@ -0,0 +1,169 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.document_processing_job import DocumentProcessingJob
+from domain.value_objects.processing_status import ProcessingStatus
+from infrastructure.database.models import DocumentProcessingJobModel
+from infrastructure.repositories.postgres_document_processing_job_repository import (
+    PostgresDocumentProcessingJobRepository,
+)
+
+
+class TestPostgresDocumentProcessingJobRepository:
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock(spec=AsyncSession)
+        session.identity_map = Mock()
+        session.identity_map.get.return_value = None
+        session.identity_key = Mock()
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        return PostgresDocumentProcessingJobRepository(mock_session)
+
+    @pytest.fixture
+    def job(self):
+        return DocumentProcessingJob(status=ProcessingStatus.EMBEDDING, progress=50)
+
+    @pytest.mark.asyncio
+    async def test_save_single_upsert(self, repository, mock_session, job):
+        mock_session.execute.return_value = Mock()
+
+        await repository.save(job)
+
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "status = excluded.status" in sql
+        assert "created_at = excluded.created_at" not in sql
+        assert "upload_id = excluded.upload_id" not in sql
+        assert "RETURNING" not in sql
+        mock_session.add.assert_not_called()
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_refreshes_loaded_model(self, repository, mock_session, job):
+        loaded = DocumentProcessingJobModel(
+            id=job.id, status="uploaded", progress=0, meta_data={}
+        )
+        mock_session.execute.return_value = Mock()
+        mock_session.identity_map.get.return_value = loaded
+
+        await repository.save(job)
+
+        mock_session.identity_key.assert_called_once_with(
+            DocumentProcessingJobModel, job.id
+        )
+        assert loaded.status == "embedding"
+        assert loaded.progress == 50
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_rollback_on_error(self, repository, mock_session, job):
+        mock_session.execute.side_effect = Exception("db down")
+
+        with pytest.raises(Exception, match="db down"):
+            await repository.save(job)
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_entity_to_row(self, repository, job):
+        row = repository._entity_to_row(job)
+
+        assert row["id"] == job.id
+        assert row["status"] == "embedding"
+        assert row["progress"] == 50
+        assert row["content_hash_value"] is None
+
+    @pytest.mark.asyncio
+    async def test_save_many_single_statement(self, repository, mock_session):
+        mock_session.execute.return_value = Mock()
+        jobs = [DocumentProcessingJob() for _ in range(3)]
+
+        await repository.save_many(jobs)
+
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "id_m2" in sql
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_many_empty(self, repository, mock_session):
+        await repository.save_many([])
+
+        mock_session.execute.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_many_rollback_on_error(self, repository, mock_session):
+        mock_session.execute.side_effect = Exception("db down")
+
+        with pytest.raises(Exception, match="db down"):
+            await repository.save_many([DocumentProcessingJob()])
+
+        mock_session.rollback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_processing_jobs_streams_rows(
+        self, repository, mock_session, job
+    ):
+        model = Mock(
+            **{
+                name: value
+                for name, value in repository._entity_to_row(job).items()
+                if name != "meta_data"
+            },
+            meta_data={},
+        )
+
+        async def stream():
+            yield model
+
+        mock_session.stream_scalars.return_value = stream()
+
+        jobs = await repository.find_processing_jobs(limit=10)
+
+        assert [found.id for found in jobs] == [job.id]
+        stmt = mock_session.stream_scalars.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 50
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_by_status_returns_empty_on_error(
+        self, repository, mock_session
+    ):
+        mock_session.stream_scalars.side_effect = Exception("db down")
+
+        assert await repository.find_by_status(ProcessingStatus.FAILED) == []
+
+    @pytest.mark.asyncio
+    async def test_find_processing_jobs_inlines_inflight_statuses(
+        self, repository, mock_session
+    ):
+        async def stream():
+            return
+            yield
+
+        mock_session.stream_scalars.return_value = stream()
+
+        await repository.find_processing_jobs()
+
+        stmt = mock_session.stream_scalars.call_args.args[0]
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+        assert (
+            "status IN ('extracting', 'checking_duplicates', 'chunking', 'embedding')"
+            in sql
+        )
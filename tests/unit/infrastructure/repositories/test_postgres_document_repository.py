@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -35,45 +36,57 @@ class TestPostgresDocumentRepository:
         assert repo._session == mock_session
 
     @pytest.mark.asyncio
-    async def test_save_new_document_success(
+    async def test_save_document_upsert(
         self, repository, mock_session, sample_document
     ):
-        # Mock para documento não existente
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
-        mock_session.flush = AsyncMock()
+        mock_session.execute.return_value = Mock()
+        mock_session.identity_map = Mock()
+        mock_session.identity_map.get.return_value = None
+        mock_session.identity_key = Mock()
         result = await repository.save(sample_document)
         assert result == sample_document
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_called_once()
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "title = excluded.title" in sql
+        assert "metadata = excluded.metadata" in sql
+        assert "created_at = excluded.created_at" not in sql
+        assert "RETURNING" not in sql
+        mock_session.add.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_save_existing_document_success(
+    async def test_save_document_refreshes_loaded_model(
         self, repository, mock_session, sample_document
     ):
-        existing_model = Mock(spec=DocumentModel)
-        existing_model.titulo = "Old Title"
-        existing_model.conteudo = "Old Content"
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = existing_model
-        mock_session.execute.return_value = mock_result
-        mock_session.flush = AsyncMock()
-        result = await repository.save(sample_document)
-        assert result == sample_document
-        assert existing_model.title == sample_document.title
-        assert existing_model.content == sample_document.content
-        mock_session.flush.assert_called_once()
+        loaded = DocumentModel(
+            id=sample_document.id,
+            title="Antigo",
+            content="texto antigo",
+            file_path="antigo.pdf",
+            file_hash="hash-antigo",
+            meta_data={},
+        )
+        mock_session.execute.return_value = Mock()
+        mock_session.identity_map = Mock()
+        mock_session.identity_map.get.return_value = loaded
+        mock_session.identity_key = Mock()
+
+        await repository.save(sample_document)
+
+        mock_session.identity_key.assert_called_once_with(
+            DocumentModel, sample_document.id
+        )
+        assert loaded.title == sample_document.title
+        assert loaded.content == sample_document.content
+        assert loaded.file_hash == sample_document.content_hash
+        assert loaded.updated_at == sample_document.updated_at
 
     @pytest.mark.asyncio
     async def test_save_document_integrity_error(
         self, repository, mock_session, sample_document
     ):
-        # Mock para documento não existente
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
-        mock_session.flush.side_effect = IntegrityError("statement", "params", "orig")
+        mock_session.execute.side_effect = IntegrityError("statement", "params", "orig")
         mock_session.rollback = AsyncMock()
         with pytest.raises(DocumentProcessingError):
             await repository.save(sample_document)
@@ -102,6 +115,24 @@ class TestPostgresDocumentRepository:
         result = await repository.find_by_id(uuid4())
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_find_by_ids_keeps_requested_order(self, repository, mock_session):
+        first, second, missing = uuid4(), uuid4(), uuid4()
+        rows = [Mock(id=second), Mock(id=first)]
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.all.return_value = rows
+        with patch.object(
+            repository, "_model_to_entity", side_effect=lambda row: row.id
+        ):
+            result = await repository.find_by_ids([first, missing, second])
+        assert result == [first, second]
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids_empty(self, repository, mock_session):
+        assert await repository.find_by_ids([]) == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_by_source_found(
         self, repository, mock_session, sample_document
@@ -120,13 +151,22 @@ class TestPostgresDocumentRepository:
         result = await repository.find_by_source("nonexistent.pdf")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_find_by_source_inlines_json_key(self, repository, mock_session):
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.scalar_one_or_none.return_value = None
+
+        await repository.find_by_source("test.pdf")
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "json_extract_path_text(document.metadata, 'source') = " in sql
+
     @pytest.mark.asyncio
     async def test_find_all_success(self, repository, mock_session, sample_document):
         mock_model = Mock(spec=DocumentModel)
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = [mock_model]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [mock_model]
         mock_session.execute.return_value = mock_result
         with patch.object(repository, "_model_to_entity", return_value=sample_document):
             result = await repository.find_all()
@@ -137,9 +177,7 @@ class TestPostgresDocumentRepository:
     async def test_find_all_with_limit(self, repository, mock_session, sample_document):
         mock_model = Mock(spec=DocumentModel)
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = [mock_model]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [mock_model]
         mock_session.execute.return_value = mock_result
         with patch.object(repository, "_model_to_entity", return_value=sample_document):
             result = await repository.find_all(limit=5, offset=10)
@@ -149,22 +187,84 @@ class TestPostgresDocumentRepository:
     @pytest.mark.asyncio
     async def test_find_all_empty(self, repository, mock_session):
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = []
         mock_session.execute.return_value = mock_result
         result = await repository.find_all()
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_find_all_selects_entity_columns(
+        self, repository, mock_session, sample_document
+    ):
+        row = Mock(
+            id=sample_document.id,
+            title=sample_document.title,
+            content=sample_document.content,
+            meta_data={"source": "test.pdf", "created_date": "2024-01-02T03:04:05"},
+            created_at=sample_document.created_at,
+            updated_at=sample_document.updated_at,
+        )
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.all.return_value = [row]
+
+        result = await repository.find_all(limit=5)
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT document.id, document.title")
+        assert "file_hash" not in sql
+        assert result[0].id == sample_document.id
+        assert result[0].file_path == "test.pdf"
+        assert result[0].metadata.creation_date == datetime(2024, 1, 2, 3, 4, 5)
+
+    @pytest.mark.asyncio
+    async def test_find_all_with_cursor_seeks_past_it(self, repository, mock_session):
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.all.return_value = []
+
+        await repository.find_all(limit=20, cursor=(datetime(2024, 1, 1), uuid4()))
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "WHERE (document.created_at, document.id) < (" in sql
+        assert "ORDER BY document.created_at DESC, document.id DESC" in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_find_all_without_content(
+        self, repository, mock_session, sample_document
+    ):
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.all.return_value = [Mock()]
+
+        with patch.object(repository, "_model_to_entity", return_value=sample_document):
+            result = await repository.find_all(limit=20, with_content=False)
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "'' AS content" in sql
+        assert "document.content" not in sql
+        assert result[0].content_loaded is False
+
+    @pytest.mark.asyncio
+    async def test_save_refuses_document_without_content(
+        self, repository, mock_session, sample_document
+    ):
+        sample_document.content_loaded = False
+
+        with pytest.raises(DocumentProcessingError, match="sem conteúdo"):
+            await repository.save(sample_document)
+        with pytest.raises(DocumentProcessingError, match="sem conteúdo"):
+            await repository.update(sample_document)
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_by_title_similarity(
         self, repository, mock_session, sample_document
     ):
         mock_model = Mock(spec=DocumentModel)
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = [mock_model]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [mock_model]
         mock_session.execute.return_value = mock_result
         with patch.object(repository, "_model_to_entity", return_value=sample_document):
             result = await repository.find_by_title_similarity("Test", 0.8)
@@ -177,9 +277,7 @@ class TestPostgresDocumentRepository:
     ):
         mock_model = Mock(spec=DocumentModel)
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = [mock_model]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [mock_model]
         mock_session.execute.return_value = mock_result
         with patch.object(repository, "_model_to_entity", return_value=sample_document):
             result = await repository.find_by_content_search("test content")
@@ -246,6 +344,18 @@ class TestPostgresDocumentRepository:
         result = await repository.exists("nonexistent.pdf")
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_exists_uses_exists_subquery(self, repository, mock_session):
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.scalar.return_value = True
+
+        assert await repository.exists_by_content_hash("test content") is True
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "SELECT EXISTS (SELECT" in sql
+        assert "count(" not in sql
+
     @pytest.mark.asyncio
     async def test_exists_by_content_hash_true(self, repository, mock_session):
         mock_result = Mock()
@@ -254,6 +364,18 @@ class TestPostgresDocumentRepository:
         result = await repository.exists_by_content_hash("test content")
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_exists_by_content_hash_uses_given_hash(
+        self, repository, mock_session
+    ):
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.scalar.return_value = True
+        with patch.object(repository, "_calculate_file_hash") as calculate:
+            await repository.exists_by_content_hash("content", content_hash="abc")
+        calculate.assert_not_called()
+        stmt = mock_session.execute.call_args.args[0]
+        assert "abc" in stmt.compile().params.values()
+
     @pytest.mark.asyncio
     async def test_exists_by_content_hash_false(self, repository, mock_session):
         mock_result = Mock()
@@ -301,6 +423,20 @@ class TestPostgresDocumentRepository:
         assert "source" in result
         assert "document_type" in result
 
+    def test_metadata_dates_round_trip_without_isoformat(self, repository):
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        metadata = DocumentMetadata(
+            source="test.pdf", file_size=1, file_type="pdf", creation_date=created
+        )
+
+        data = repository._metadata_to_dict(metadata)
+
+        assert data["created_date"] is created
+        assert data["modified_date"] is None
+        assert repository._dict_to_metadata(data).creation_date == created
+        stored = {**data, "created_date": "2024-01-02T03:04:05"}
+        assert repository._dict_to_metadata(stored).creation_date == created
+
     def test_dict_to_metadata(self, repository):
         metadata_dict = {
             "source": "test.pdf",
@@ -377,6 +513,23 @@ class TestPostgresDocumentChunkRepository:
             await repository.save_chunk(sample_chunk)
         mock_session.rollback.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_save_chunks_single_insert(
+        self, repository, mock_session, sample_chunk
+    ):
+        other_chunk = MockFactory.create_document_chunk(chunk_index=1)
+        result = await repository.save_chunks([sample_chunk, other_chunk])
+        assert result == [sample_chunk, other_chunk]
+        mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args.args[1]
+        assert [row["id"] for row in rows] == [sample_chunk.id, other_chunk.id]
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_chunks_empty(self, repository, mock_session):
+        assert await repository.save_chunks([]) == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_chunk_by_id_found(self, repository, mock_session, sample_chunk):
         mock_model = Mock(spec=DocumentChunkModel)
@@ -399,9 +552,7 @@ class TestPostgresDocumentChunkRepository:
     ):
         mock_model = Mock(spec=DocumentChunkModel)
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = [mock_model]
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [mock_model]
         mock_session.execute.return_value = mock_result
         with patch.object(repository, "_model_to_entity", return_value=sample_chunk):
             result = await repository.find_chunks_by_document_id(uuid4())
@@ -411,13 +562,38 @@ class TestPostgresDocumentChunkRepository:
     @pytest.mark.asyncio
     async def test_find_chunks_by_document_id_empty(self, repository, mock_session):
         mock_result = Mock()
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = []
         mock_session.execute.return_value = mock_result
         result = await repository.find_chunks_by_document_id(uuid4())
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_find_chunks_by_document_ids_groups_by_document(
+        self, repository, mock_session
+    ):
+        doc_a, doc_b, doc_empty = uuid4(), uuid4(), uuid4()
+        rows = [
+            Mock(document_id=doc_a, chunk_index=0),
+            Mock(document_id=doc_a, chunk_index=1),
+            Mock(document_id=doc_b, chunk_index=0),
+        ]
+        mock_session.execute.return_value = Mock()
+        mock_session.execute.return_value.all.return_value = rows
+        with patch.object(
+            repository,
+            "_model_to_entity",
+            side_effect=lambda row: (row.document_id, row.chunk_index),
+        ):
+            result = await repository.find_chunks_by_document_ids(
+                [doc_a, doc_b, doc_empty]
+            )
+        assert result == {
+            doc_a: [(doc_a, 0), (doc_a, 1)],
+            doc_b: [(doc_b, 0)],
+            doc_empty: [],
+        }
+        mock_session.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_delete_chunks_by_document_id_success(self, repository, mock_session):
         mock_result = Mock()
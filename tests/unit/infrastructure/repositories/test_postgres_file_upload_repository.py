@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.file_upload import FileUpload
+from infrastructure.database.models import FileUploadModel
+from infrastructure.repositories.postgres_file_upload_repository import (
+    PostgresFileUploadRepository,
+)
+
+
+class TestPostgresFileUploadRepository:
+    @pytest.fixture
+    def mock_session(self):
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        return PostgresFileUploadRepository(mock_session)
+
+    @pytest.fixture
+    def file_upload(self):
+        return FileUpload(
+            filename="doc.pdf", file_size=10, content_type="application/pdf"
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_existing_uses_identity_map(
+        self, repository, mock_session, file_upload
+    ):
+        existing = Mock(spec=FileUploadModel)
+        mock_session.get.return_value = existing
+
+        await repository.save(file_upload)
+
+        mock_session.get.assert_called_once_with(FileUploadModel, file_upload.id)
+        mock_session.execute.assert_not_called()
+        mock_session.add.assert_not_called()
+        assert existing.filename == "doc.pdf"
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_new_adds_model(self, repository, mock_session, file_upload):
+        mock_session.get.return_value = None
+
+        await repository.save(file_upload)
+
+        mock_session.add.assert_called_once()
+        assert mock_session.add.call_args.args[0].id == file_upload.id
+        mock_session.commit.assert_called_once()
@@ -2,7 +2,9 @@ from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
+import numpy as np
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,11 +14,18 @@ from domain.value_objects.embedding import Embedding
 from infrastructure.database.models import DocumentEmbeddingModel
 from infrastructure.repositories.postgres_vector_repository import (
     PostgresVectorRepository,
+    clear_search_cache,
 )
 from tests.helpers.mock_factories import MockFactory
 
 
 class TestPostgresVectorRepository:
+    @pytest.fixture(autouse=True)
+    def empty_search_cache(self):
+        clear_search_cache()
+        yield
+        clear_search_cache()
+
     @pytest.fixture
     def mock_session(self):
         return AsyncMock(spec=AsyncSession)
@@ -58,6 +67,36 @@ class TestPostgresVectorRepository:
                     mock_session.add.assert_called_once()
                     mock_session.flush.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_add_chunk_embeddings_single_upsert(
+        self, repository, mock_session, sample_embedding
+    ):
+        chunk_ids = [uuid4(), uuid4()]
+        result = await repository.add_chunk_embeddings(
+            [(chunk_id, sample_embedding) for chunk_id in chunk_ids]
+        )
+        assert result == 2
+        mock_session.execute.assert_called_once()
+        sql = str(
+            mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT (chunk_id) DO UPDATE" in sql
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_chunk_embeddings_empty(self, repository, mock_session):
+        assert await repository.add_chunk_embeddings([]) == 0
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_chunk_embeddings_integrity_error(
+        self, repository, mock_session, sample_embedding
+    ):
+        mock_session.execute.side_effect = IntegrityError("statement", "params", "orig")
+        with pytest.raises(DocumentProcessingError):
+            await repository.add_chunk_embeddings([(uuid4(), sample_embedding)])
+        mock_session.rollback.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_add_chunk_embedding_chunk_not_found(
         self, repository, mock_session, sample_embedding
@@ -94,7 +133,7 @@ class TestPostgresVectorRepository:
         # Mock search results
         mock_row = Mock()
         mock_row.id = uuid4()
-        mock_row.similarity_score = 0.95
+        mock_row.distance = 0.05
         mock_row.conteudo = "Test content"
         mock_row.indice_chunk = 0
         mock_row.documento_id = uuid4()
@@ -118,7 +157,8 @@ class TestPostgresVectorRepository:
         assert len(results) == 1
         assert isinstance(results[0], SearchResult)
         assert results[0].chunk.id == mock_row.id
-        assert results[0].similarity_score == mock_row.similarity_score
+        assert results[0].similarity_score == pytest.approx(0.95)
+        assert results[0].distance == pytest.approx(0.05)
 
     @pytest.mark.asyncio
     async def test_search_similar_empty(
@@ -135,6 +175,93 @@ class TestPostgresVectorRepository:
             )
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_search_similar_cached(
+        self, repository, mock_session, sample_embedding
+    ):
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.search_similar_chunks(sample_embedding, n_results=5)
+        await PostgresVectorRepository(mock_session).search_similar_chunks(
+            sample_embedding, n_results=5
+        )
+        assert mock_session.execute.call_count == 1
+
+        await repository.search_similar_chunks(sample_embedding, n_results=10)
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_cache_cleared_on_write(
+        self, repository, mock_session, sample_embedding
+    ):
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.search_similar_chunks(sample_embedding, n_results=5)
+        await repository.add_chunk_embeddings([(uuid4(), sample_embedding)])
+        await repository.search_similar_chunks(sample_embedding, n_results=5)
+
+        assert mock_session.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_search_within_document_ranks_exactly(
+        self, repository, mock_session, sample_embedding
+    ):
+        document_id = uuid4()
+        query = Embedding(vector=[1.0, 0.0], model="test", dimensions=2)
+        rows = []
+        for vector in ([0.0, 1.0], [1.0, 0.1], [1.0, 1.0]):
+            row = Mock()
+            row.id = uuid4()
+            row.document_id = document_id
+            row.embedding = vector
+            row.meta_data = {}
+            rows.append(row)
+        mock_result = Mock()
+        mock_result.fetchall.return_value = rows
+        mock_session.execute.return_value = mock_result
+
+        with patch.object(
+            repository, "_vector_to_embedding", return_value=sample_embedding
+        ):
+            results = await repository.search_similar_chunks(
+                query,
+                n_results=2,
+                similarity_threshold=0.5,
+                metadata_filter={"document_id": str(document_id)},
+            )
+
+        assert [r.chunk.id for r in results] == [rows[1].id, rows[2].id]
+        assert results[0].similarity_score == pytest.approx(1 / np.sqrt(1.01))
+        assert results[1].distance == pytest.approx(1 - 1 / np.sqrt(2))
+        sql = str(
+            mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "document_chunk.document_id = %(document_id_1)s" in sql
+        assert "<=>" not in sql
+
+    @pytest.mark.asyncio
+    async def test_search_similar_orders_by_raw_distance(
+        self, repository, mock_session, sample_embedding
+    ):
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+        with patch.object(
+            repository, "_embedding_to_vector", return_value=[0.1] * 1536
+        ):
+            await repository.search_similar_chunks(
+                sample_embedding, n_results=5, similarity_threshold=0.8
+            )
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ORDER BY document_embedding.embedding <=> %(embedding_1)s" in sql
+        assert "DESC" not in sql
+        assert "<=> %(embedding_1)s) <= %(param_1)s" in sql
+
     @pytest.mark.asyncio
     async def test_get_embedding_by_chunk_id_found(
         self, repository, mock_session, sample_embedding
@@ -186,8 +313,13 @@ class TestPostgresVectorRepository:
         mock_result.rowcount = 5
         mock_session.execute.return_value = mock_result
         result = await repository.delete_document_embeddings(document_id)
-        assert result >= 0  # O método retorna 0 quando há erro
+        assert result == 5
         mock_session.execute.assert_called_once()
+        sql = str(
+            mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "DELETE FROM document_embedding" in sql
+        assert "SELECT document_chunk.id" in sql
 
     @pytest.mark.asyncio
     async def test_count_embeddings_success_duplicate(self, repository, mock_session):
@@ -238,6 +370,20 @@ class TestPostgresVectorRepository:
         assert len(result) == sample_embedding.dimensions
         assert all(isinstance(x, float) for x in result)
 
+    def test_embedding_to_vector_rounds_float32_noise(self, repository):
+        vector = np.asarray([0.1, -0.0123456789], dtype=np.float32)
+        embedding = Embedding(vector=vector.tolist(), model="test", dimensions=2)
+
+        result = repository._embedding_to_vector(embedding)
+
+        assert result == [0.1, -0.01234568]
+        assert len(str(result)) < len(str(vector.tolist()))
+
+    def test_embedding_to_vector_unsupported(self, repository):
+        embedding = Mock(vector="0.1,0.2")
+        with pytest.raises(DocumentProcessingError, match="não suportado"):
+            repository._embedding_to_vector(embedding)
+
     def test_vector_to_embedding(self, repository):
         vector = [0.1] * 1536
         result = repository._vector_to_embedding(vector)
@@ -286,7 +432,7 @@ class TestPostgresVectorRepository:
         # Mock search results with filters
         mock_row = Mock()
         mock_row.id = uuid4()
-        mock_row.similarity_score = 0.90
+        mock_row.distance = 0.10
         mock_row.conteudo = "Filtered content"
         mock_row.indice_chunk = 0
         mock_row.documento_id = uuid4()
@@ -10,6 +10,7 @@ Usage:
     python worker.py --queues cleanup   # Worker apenas para limpeza
     python worker.py --all              # Worker para todas as filas
     python worker.py --verbose          # Logs detalhados
+    python worker.py --no-fork          # Executa os jobs no próprio processo
 """
 
 import argparse
@@ -18,9 +19,10 @@ import sys
 from typing import List
 
 from redis import Redis
-from rq import Worker
+from rq import SimpleWorker, Worker
 
 from infrastructure.config.settings import settings
+from infrastructure.queue.jobs import shutdown_event_loop
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -63,6 +65,11 @@ def main():
         help="Modo burst: processar jobs existentes e sair",
     )
     parser.add_argument("--name", type=str, help="Nome do worker (para identificação)")
+    parser.add_argument(
+        "--no-fork",
+        action="store_true",
+        help="Executa os jobs no processo do worker, reaproveitando event loop e conexões",
+    )
 
     args = parser.parse_args()
 
@@ -91,7 +98,8 @@ def main():
     logger.info(f"Modo burst: {'Sim' if args.burst else 'Não'}")
 
     try:
-        worker = Worker(queue_names, connection=redis_conn, name=worker_name)
+        worker_class = SimpleWorker if args.no_fork else Worker
+        worker = worker_class(queue_names, connection=redis_conn, name=worker_name)
 
         worker.log = logger
 
@@ -109,6 +117,7 @@ def main():
         logger.error(f"Erro no worker: {e}")
         sys.exit(1)
     finally:
+        shutdown_event_loop()
         logger.info("Worker finalizado")
 
 